@@ -13,6 +13,7 @@ Features:
 - Hybrid retrieval with embeddings and keyword search
 - Professional UI with status indicators and error handling
 - Analytics tracking and performance monitoring
+- Token-by-token answer streaming with TTFT and tokens/sec metrics
 - Configurable prompt templates and guardrails
 - Production deployment with automatic fallback strategies
 
@@ -35,6 +36,7 @@ Components:
 
 from __future__ import annotations
 
+import asyncio
 import copy
 import logging
 import os
@@ -50,11 +52,12 @@ import random
 import statistics
 import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from starlette.responses import JSONResponse
 
 import gradio as gr
@@ -66,11 +69,26 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from rag_pipeline.ingestion.pipeline import ingest_and_index_document
+from rag_pipeline.retrieval.fusion import FUSION_METHODS
 from rag_pipeline.retrieval.retriever import HybridRetriever
-from rag_pipeline.retrieval.reranker import PassThroughReranker
-from rag_pipeline.indexing.opensearch_client import OpenSearchConfig, create_client, ensure_index
+from rag_pipeline.retrieval.async_retriever import AsyncHybridRetriever
+from rag_pipeline.retrieval.reranker import PassThroughReranker, build_reranker
+from rag_pipeline.indexing.opensearch_client import (
+    OpenSearchConfig,
+    create_async_client,
+    create_client,
+    ensure_index,
+)
+from rag_pipeline.indexing.local_engine import LocalSearchEngine
+from rag_pipeline.indexing.vector_storage import EncodedEmbeddings, load_vector_codec, storage_mapping
 from rag_pipeline.security import SecurityMiddleware, get_client_ip
+from rag_pipeline.answer_cache import SemanticAnswerCache, prompt_fingerprint
+from rag_pipeline.cache import LRUCache
+from rag_pipeline.embeddings.micro_batcher import QueryMicroBatcher
+from rag_pipeline.metrics import GENERATION_MS_BUCKETS, TOKENS_PER_SECOND_BUCKETS, Histogram
+from rag_pipeline.settings import get_setting, load_app_settings
 from llm_ollama.adapters import OllamaChatAdapter
+from llm_ollama.residency import ModelResidencyKeeper
 
 
 logger = logging.getLogger(__name__)
@@ -91,6 +109,16 @@ HEALTH_RED_TOAST_MESSAGE = (
     "Ollama is currently unreachable. You can continue to ask questions, "
     "but responses may fail until the connection recovers."
 )
+NO_DOCUMENTS_REPLY = "No relevant passages found in the indexed documents."
+MISSING_PROMPT_REPLY = "Prompt template missing. Please review research_qa_prompt.yaml."
+# Concurrent chat requests each Gradio event may run on the event loop.
+CHAT_CONCURRENCY_LIMIT = int(os.getenv("MAX_CONCURRENT_QUERIES", "10"))
+# Streamed-generation timings, exported by /status.
+GENERATION_METRICS = {
+    "ttft_ms": Histogram(GENERATION_MS_BUCKETS),
+    "total_ms": Histogram(GENERATION_MS_BUCKETS),
+    "tokens_per_second": Histogram(TOKENS_PER_SECOND_BUCKETS),
+}
 
 
 PROMPT_PATH = Path(__file__).resolve().parent.parent / "rag_pipeline" / "prompts" / "research_qa_prompt.yaml"
@@ -109,10 +137,13 @@ class AssistantDependencies:
     
     Attributes:
         retriever: Hybrid retriever for document search
+        async_retriever: Coroutine front-end over the retriever for async handlers
         embedding_model: Model for text embeddings
         opensearch_client: OpenSearch client for indexing
         index_name: Target index name for documents
         chat_adapter: Ollama chat interface adapter
+        residency_keeper: Background refresher keeping Ollama models loaded
+        answer_cache: Semantic cache of generated answers in front of the LLM
     """
 
     retriever: HybridRetriever
@@ -120,6 +151,9 @@ class AssistantDependencies:
     opensearch_client: Any
     index_name: str
     chat_adapter: Any
+    async_retriever: Optional[AsyncHybridRetriever] = None
+    residency_keeper: Optional[ModelResidencyKeeper] = None
+    answer_cache: Optional[SemanticAnswerCache] = None
 
     def __deepcopy__(self, memo):
         """Return self because dependencies manage live connections."""
@@ -671,6 +705,12 @@ def ingest_files(files: Any, clear_previous: bool, state: AssistantState, health
                 except Exception:
                     pass
 
+    answer_cache = getattr(state.deps, "answer_cache", None)
+    if answer_cache is not None:
+        # Answers over edited chunks already miss (the key hashes each chunk's
+        # text); clearing frees the entries for evidence that was replaced.
+        answer_cache.clear()
+
     progress(1.0, desc="Ingestion complete")
     result = "\n".join(messages)
     logger.info(f"Ingestion complete. Result: {result[:200]}...")
@@ -680,36 +720,9 @@ def ingest_files(files: Any, clear_previous: bool, state: AssistantState, health
     return result, state, health_state, status_html
 
 
-def answer_question(
-    query: str,
-    history: List[Tuple[str, str]],
-    state: AssistantState,
-) -> Tuple[List[Tuple[str, str]], AssistantState]:
-    """
-    Process user questions through the complete RAG pipeline.
-    
-    Orchestrates the full question-answering workflow including document
-    retrieval, context formatting, prompt generation, LLM inference,
-    and response presentation with citations.
-    
-    Args:
-        query: User's question or query
-        history: Conversation history as list of (user, assistant) tuples
-        state: Current application state with all dependencies
-        
-    Returns:
-        Tuple of (updated_history, updated_state) where updated_history
-        includes the new Q&A pair with formatted citations
-        
-    Process:
-        1. Retrieve relevant documents from index
-        2. Format context and conversation history
-        3. Generate structured prompt
-        4. Query Ollama LLM for response
-        5. Format response with citations and sources
-    """
-    
-    # Security checks
+def _screen_query(query: str) -> Tuple[str, Optional[str]]:
+    """Apply rate limiting and sanitization; return (query, error_reply)."""
+
     if SECURITY_ENABLED and security_middleware:
         # Rate limiting check
         client_ip = get_client_ip(None)  # Would get actual IP in production
@@ -717,32 +730,23 @@ def answer_question(
             client_ip, "/api/chat"
         )
         if not is_allowed:
-            error_message = f"Rate limit exceeded. {limit_info.get('error', '')}"
-            updated_history = history + [(query, error_message)]
-            return updated_history, state
-            
+            return query, f"Rate limit exceeded. {limit_info.get('error', '')}"
+
         # Input sanitization
         sanitized_query, is_safe = security_middleware.sanitizer.sanitize_query(query)
         if not is_safe:
-            error_message = "Invalid input detected. Please check your query and try again."
-            updated_history = history + [(query, error_message)]
-            return updated_history, state
+            return query, "Invalid input detected. Please check your query and try again."
         query = sanitized_query
 
-    try:
-        documents = state.deps.retriever.retrieve(query=query, top_k=3)
-    except NotImplementedError as error:
-        assistant_reply = (
-            "Retrieval is not configured yet. "
-            f"Please complete the embedding model setup. Detail: {error}"
-        )
-        updated_history = history + [(query, assistant_reply)]
-        return updated_history, state
+    return query, None
 
-    if not documents:
-        assistant_reply = "No relevant passages found in the indexed documents."
-        updated_history = history + [(query, assistant_reply)]
-        return updated_history, state
+
+def _build_llm_messages(
+    query: str,
+    documents: List[Any],
+    state: AssistantState,
+) -> Tuple[List[Dict[str, str]], List[str]]:
+    """Format retrieved documents into prompt messages plus citation lines."""
 
     context_blocks = []
     citations = []
@@ -765,35 +769,255 @@ def answer_question(
             context=context_snippets,
         )
         messages.append({"role": message.get("role", "user"), "content": content})
+    return messages, citations
 
-    if not messages:
-        assistant_reply = (
-            "Prompt template missing. Please review research_qa_prompt.yaml."
-        )
-        updated_history = history + [(query, assistant_reply)]
-        return updated_history, state
 
-    try:
-        answer = state.deps.chat_adapter.invoke_messages(messages)
-    except RuntimeError as error:
-        answer = (
+def _describe_llm_failure(error: Exception) -> str:
+    """Turn an LLM invocation error into the message shown in the chat."""
+
+    if isinstance(error, RuntimeError):
+        return (
             "LLM request failed. The selected Ollama model may be too large for this machine. "
             "Try pulling a smaller model such as 'mistral' or 'llama3:8b'.\n\n"
             f"Details: {error}"
         )
-    except NotImplementedError as error:
-        answer = (
+    if isinstance(error, NotImplementedError):
+        return (
             "LLM integration not available yet. "
             f"Please configure Ollama. Detail: {error}"
         )
-    except Exception as exc:  # pragma: no cover - surface runtime failures
-        answer = f"Failed to create answer via Ollama: {exc}"
+    return f"Failed to create answer via Ollama: {error}"
 
+
+def _retrieval_not_configured(error: Exception) -> str:
+    """Message shown when the retriever is still a configuration stub."""
+
+    return (
+        "Retrieval is not configured yet. "
+        f"Please complete the embedding model setup. Detail: {error}"
+    )
+
+
+def _record_generation(stats: Any) -> None:
+    """Add one streamed completion's timings to `GENERATION_METRICS`."""
+
+    for name, histogram in GENERATION_METRICS.items():
+        value = getattr(stats, name, None)
+        if value is not None:
+            histogram.observe(value)
+    logger.info(
+        "LLM stream model=%s ttft_ms=%s tokens=%s tokens_per_second=%s",
+        getattr(stats, "model", None),
+        None if stats.ttft_ms is None else round(stats.ttft_ms, 1),
+        stats.tokens,
+        None if stats.tokens_per_second is None else round(stats.tokens_per_second, 1),
+    )
+
+
+def _with_citations(answer: str, citations: List[str]) -> str:
     if citations:
-        answer = answer + "\n\nSources:\n" + "\n".join(citations)
+        return answer + "\n\nSources:\n" + "\n".join(citations)
+    return answer
+
+
+def _stream_failure(partial: str, error: Exception) -> str:
+    """Failure message, keeping whatever was already streamed."""
+
+    message = _describe_llm_failure(error)
+    return f"{partial}\n\n{message}" if partial else message
+
+
+def _answer_cache_key(query: str, documents: List[Any], state: AssistantState) -> Optional[Dict[str, Any]]:
+    """Answer-cache lookup arguments for this turn, or None when caching is off.
+
+    The question vector normally comes straight from the retriever's query
+    cache, since retrieval has just embedded the same text. Evidence is keyed
+    by chunk ID plus a hash of the chunk text: re-ingested chunks keep their
+    IDs, so an edited passage must not match answers grounded in the old one.
+    """
+
+    if state.deps.answer_cache is None:
+        return None
+    retriever = state.deps.retriever
+    try:
+        vector = retriever.cached_query_vector(query) if hasattr(retriever, "cached_query_vector") else None
+        if vector is None:
+            vector = retriever.embed_query(query)
+    except Exception as exc:
+        logger.debug("Answer cache skipped; no query vector: %s", exc)
+        return None
+    return {
+        "vector": vector,
+        "chunk_ids": [f"{doc.chunk_key}:{doc.text_hash}" for doc in documents],
+        "prompt_version": prompt_fingerprint(state.prompt_template),
+        "model": current_model_name(state),
+    }
+
+
+def _store_answer(state: AssistantState, cache_key: Optional[Dict[str, Any]], answer: str, stats: Any = None) -> None:
+    """Cache a completed answer under the model that actually generated it."""
+
+    if cache_key is None:
+        return
+    model = getattr(stats, "model", None) or cache_key["model"]
+    state.deps.answer_cache.store(answer=answer, **{**cache_key, "model": model})
+
+
+def answer_question(
+    query: str,
+    history: List[Tuple[str, str]],
+    state: AssistantState,
+) -> Iterator[Tuple[List[Tuple[str, str]], AssistantState]]:
+    """
+    Process user questions through the complete RAG pipeline.
+    
+    Orchestrates the full question-answering workflow including document
+    retrieval, context formatting, prompt generation, LLM inference,
+    and response presentation with citations.
+    
+    Args:
+        query: User's question or query
+        history: Conversation history as list of (user, assistant) tuples
+        state: Current application state with all dependencies
+        
+    Yields:
+        Tuples of (updated_history, updated_state): one per streamed chunk
+        with the partial answer, then the final answer with citations
+        
+    Process:
+        1. Retrieve relevant documents from index
+        2. Serve a cached answer for a similar question over the same documents
+        3. Format context and conversation history
+        4. Generate structured prompt
+        5. Stream the Ollama LLM response (TTFT and tokens/sec recorded)
+        6. Format response with citations and sources, then cache it
+    """
 
-    updated_history = history + [(query, answer)]
-    return updated_history, state
+    query, rejection = _screen_query(query)
+    if rejection:
+        yield history + [(query, rejection)], state
+        return
+
+    try:
+        documents = state.deps.retriever.retrieve(query=query, top_k=3)
+    except NotImplementedError as error:
+        yield history + [(query, _retrieval_not_configured(error))], state
+        return
+
+    if not documents:
+        yield history + [(query, NO_DOCUMENTS_REPLY)], state
+        return
+
+    cache_key = _answer_cache_key(query, documents, state)
+    cached = state.deps.answer_cache.lookup(**cache_key) if cache_key is not None else None
+    if cached is not None:
+        yield history + [(query, cached)], state
+        return
+
+    messages, citations = _build_llm_messages(query, documents, state)
+    if not messages:
+        yield history + [(query, MISSING_PROMPT_REPLY)], state
+        return
+
+    adapter = state.deps.chat_adapter
+    stream_messages = getattr(adapter, "stream_messages", None)
+    answer = ""
+    stats = None
+    try:
+        if callable(stream_messages):
+            stream = stream_messages(messages)
+            for delta in stream:
+                answer += delta
+                yield history + [(query, answer)], state
+            stats = stream.stats
+            _record_generation(stats)
+        else:
+            answer = adapter.invoke_messages(messages)
+    except Exception as error:  # pragma: no cover - surface runtime failures
+        answer = _stream_failure(answer, error)
+        cache_key = None
+
+    answer = _with_citations(answer, citations)
+    _store_answer(state, cache_key, answer, stats)
+    yield history + [(query, answer)], state
+
+
+async def answer_question_async(
+    query: str,
+    history: List[Tuple[str, str]],
+    state: AssistantState,
+) -> AsyncIterator[Tuple[List[Tuple[str, str]], AssistantState]]:
+    """
+    Coroutine variant of `answer_question` for the Gradio event loop.
+
+    Awaits retrieval and streams generation instead of blocking a worker
+    thread, so one process can serve many concurrent chats. Uses the async
+    retriever and the adapter's async client when configured, and otherwise
+    off-loads the blocking implementations to worker threads.
+
+    Args:
+        query: User's question or query
+        history: Conversation history as list of (user, assistant) tuples
+        state: Current application state with all dependencies
+
+    Yields:
+        Tuples of (updated_history, updated_state), partial answers first
+    """
+
+    query, rejection = _screen_query(query)
+    if rejection:
+        yield history + [(query, rejection)], state
+        return
+
+    try:
+        async_retriever = getattr(state.deps, "async_retriever", None)
+        if async_retriever is not None:
+            documents = await async_retriever.retrieve(query=query, top_k=3)
+        else:
+            documents = await asyncio.to_thread(state.deps.retriever.retrieve, query=query, top_k=3)
+    except NotImplementedError as error:
+        yield history + [(query, _retrieval_not_configured(error))], state
+        return
+
+    if not documents:
+        yield history + [(query, NO_DOCUMENTS_REPLY)], state
+        return
+
+    cache_key = None
+    if state.deps.answer_cache is not None:
+        cache_key = await asyncio.to_thread(_answer_cache_key, query, documents, state)
+    cached = state.deps.answer_cache.lookup(**cache_key) if cache_key is not None else None
+    if cached is not None:
+        yield history + [(query, cached)], state
+        return
+
+    messages, citations = _build_llm_messages(query, documents, state)
+    if not messages:
+        yield history + [(query, MISSING_PROMPT_REPLY)], state
+        return
+
+    adapter = state.deps.chat_adapter
+    answer = ""
+    stats = None
+    try:
+        if hasattr(adapter, "astream_messages"):
+            stream = await adapter.astream_messages(messages)
+            async for delta in stream:
+                answer += delta
+                yield history + [(query, answer)], state
+            stats = stream.stats
+            _record_generation(stats)
+        elif hasattr(adapter, "ainvoke_messages"):
+            answer = await adapter.ainvoke_messages(messages)
+        else:
+            answer = await asyncio.to_thread(adapter.invoke_messages, messages)
+    except Exception as error:  # pragma: no cover - surface runtime failures
+        answer = _stream_failure(answer, error)
+        cache_key = None
+
+    answer = _with_citations(answer, citations)
+    _store_answer(state, cache_key, answer, stats)
+    yield history + [(query, answer)], state
 
 
 def messages_to_pairs(messages: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
@@ -826,13 +1050,13 @@ def pairs_to_messages(pairs: List[Tuple[str, str]]) -> List[Dict[str, str]]:
     return messages
 
 
-def handle_question(
+async def handle_question(
     query: str,
     history: List[Dict[str, Any]],
     state: AssistantState,
     health_state: Dict[str, Any],
-) -> Tuple[List[Dict[str, str]], AssistantState, Dict[str, Any], str]:
-    """Wrap question answering to refresh health metadata and status UI."""
+) -> AsyncIterator[Tuple[List[Dict[str, str]], AssistantState, Any, Any]]:
+    """Stream the answer into the chat, then refresh health metadata and status UI."""
 
     if health_state.get("status") == "red" and not health_state.get("toast_shown"):
         gr.Warning(HEALTH_RED_TOAST_MESSAGE)
@@ -840,10 +1064,14 @@ def handle_question(
         health_state["toast_shown"] = True
 
     pairs = messages_to_pairs(history)
-    updated_pairs, state = answer_question(query, pairs, state)
-    health_state, status_html = run_health_check(state, health_state, force=True)
-    messages = pairs_to_messages(updated_pairs)
-    return messages, state, health_state, status_html
+    updated_pairs = pairs
+    async for updated_pairs, state in answer_question_async(query, pairs, state):
+        # Partial answers: leave the health outputs untouched until the end.
+        yield pairs_to_messages(updated_pairs), state, gr.skip(), gr.skip()
+    health_state, status_html = await asyncio.to_thread(
+        run_health_check, state, health_state, force=True
+    )
+    yield pairs_to_messages(updated_pairs), state, health_state, status_html
 
 
 def apply_llm_settings_with_health(
@@ -1061,12 +1289,14 @@ def build_interface(state: AssistantState) -> gr.Blocks:
                     fn=handle_question,
                     inputs=[question_box, chat, assistant_state, health_state],
                     outputs=[chat, assistant_state, health_state, model_status_html],
+                    concurrency_limit=CHAT_CONCURRENCY_LIMIT,
                 )
                 
                 question_box.submit(
                     fn=handle_question,
                     inputs=[question_box, chat, assistant_state, health_state],
                     outputs=[chat, assistant_state, health_state, model_status_html],
+                    concurrency_limit=CHAT_CONCURRENCY_LIMIT,
                 )
 
             with gr.Tab("Configuration", id="settings_tab") as settings_tab:
@@ -1209,6 +1439,22 @@ def attach_status_endpoint(starlette_app: Any, state: AssistantState) -> None:
                 "latency_ms": health_state.get("last_latency"),
                 "status_code": health_state.get("last_status_code"),
             }
+            retriever = getattr(state.deps, "retriever", None)
+            if hasattr(retriever, "cache_stats"):
+                response_payload["query_cache"] = retriever.cache_stats()
+            if hasattr(retriever, "leg_stats"):
+                response_payload["retrieval_legs"] = retriever.leg_stats()
+            if isinstance(getattr(retriever, "query_embedder", None), QueryMicroBatcher):
+                response_payload["query_batching"] = retriever.query_embedder.stats()
+            response_payload["generation"] = {
+                name: histogram.stats() for name, histogram in GENERATION_METRICS.items()
+            }
+            answer_cache = getattr(state.deps, "answer_cache", None)
+            if answer_cache is not None:
+                response_payload["answer_cache"] = answer_cache.stats()
+            keeper = getattr(state.deps, "residency_keeper", None)
+            if keeper is not None:
+                response_payload["model_residency"] = keeper.stats()
             status_error = health_state.get("error")
             if error_detail:
                 status_error = error_detail
@@ -1252,6 +1498,11 @@ def load_dependencies() -> AssistantDependencies:
     - OPENSEARCH_HOST: OpenSearch server URL
     - OPENSEARCH_INDEX: Target index name
     - EMBEDDING_MODEL_NAME: HuggingFace model for embeddings
+    - EMBEDDING_CACHE_DIR: Optional directory for the persistent embedding cache
+    - QUERY_CACHE_SIZE: Query-vector cache entries shared by all sessions (0 disables)
+    - QUERY_CACHE_TTL_SECONDS: Query-vector cache entry lifetime
+    - RERANKER_TYPE: passthrough, keyword, cross_encoder or cascade
+    - RERANK_BUDGET_MS: Per-request latency budget for the cascade reranker
     - OLLAMA_BASE_URL: Ollama server URL
     - OLLAMA_MODEL: Primary model name
     - OLLAMA_FALLBACK_MODEL: Backup model name
@@ -1316,6 +1567,7 @@ def load_dependencies() -> AssistantDependencies:
     embedding_model_name = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
     index_name = os.getenv("OPENSEARCH_INDEX", "quest-research")
     opensearch_host = os.getenv("OPENSEARCH_HOST")
+    local_index_dir = os.getenv("LOCAL_INDEX_DIR")
     opensearch_username = os.getenv("OPENSEARCH_USERNAME", "")
     opensearch_password = os.getenv("OPENSEARCH_PASSWORD", "")
     tls_verify_env = os.getenv("OPENSEARCH_TLS_VERIFY", "true").lower()
@@ -1323,16 +1575,56 @@ def load_dependencies() -> AssistantDependencies:
     ollama_base_url = os.getenv("OLLAMA_BASE_URL")
     ollama_model = os.getenv("OLLAMA_MODEL")
     ollama_fallback = os.getenv("OLLAMA_FALLBACK_MODEL")
+    app_settings = load_app_settings()
+    query_cache_size = int(os.getenv("QUERY_CACHE_SIZE", "1024"))
+    query_cache = (
+        LRUCache(
+            max_size=query_cache_size,
+            ttl_seconds=float(os.getenv("QUERY_CACHE_TTL_SECONDS", "3600")),
+        )
+        if query_cache_size > 0
+        else None
+    )
 
-    if opensearch_host:
+    answer_cache = None
+    if get_setting(app_settings, "performance.answer_cache.enabled", True):
+        answer_cache = SemanticAnswerCache(
+            similarity_threshold=float(get_setting(app_settings, "performance.answer_cache.similarity_threshold", 0.95)),
+            max_size=int(get_setting(app_settings, "performance.answer_cache.max_size", 1024)),
+            ttl_seconds=float(get_setting(app_settings, "performance.cache_ttl", 3600)) or None,
+        )
+
+    vector_codec = None
+    if opensearch_host or local_index_dir:
         try:
-            from rag_pipeline.embeddings.sentence_transformer import (
-                SentenceTransformerEmbeddings,
-            )
+            from rag_pipeline.embeddings.backends import build_embedder
 
-            embedding_backend = SentenceTransformerEmbeddings(model_name=embedding_model_name)
+            embedding_backend = build_embedder(
+                os.getenv("EMBEDDING_BACKEND"),
+                model_name=embedding_model_name,
+                cache_dir=os.getenv("EMBEDDING_CACHE_DIR") or None,
+            )
+            vector_codec = load_vector_codec()
+            if vector_codec is not None:
+                # Reduced / quantized index: queries must be encoded like the stored documents.
+                embedding_backend = EncodedEmbeddings(embedding_backend, vector_codec)
             embedding_model = embedding_backend
             query_embedder = embedding_backend
+            batching_enabled = os.getenv("QUERY_BATCHING_ENABLED")
+            if batching_enabled is None:
+                batching_enabled = get_setting(app_settings, "performance.query_batching.enabled", True)
+            if str(batching_enabled).lower() not in {"false", "0"}:
+                # Coalesce concurrent chat queries into one encoder call.
+                query_embedder = QueryMicroBatcher(
+                    embedding_backend,
+                    max_wait_ms=float(
+                        os.getenv("QUERY_BATCH_WAIT_MS")
+                        or get_setting(app_settings, "performance.query_batching.max_wait_ms", 5)
+                    ),
+                    max_batch_size=int(
+                        get_setting(app_settings, "performance.query_batching.max_batch_size", 32)
+                    ),
+                )
         except Exception as exc:  # pragma: no cover - defensive fallback
             embedding_model = NotImplementedStub("Embedding Model", f"Embedding backend failed to load ({exc}).")
             query_embedder = NotImplementedStub("Query Embedder", f"Query embedding backend failed to load ({exc}).")
@@ -1354,6 +1646,10 @@ def load_dependencies() -> AssistantDependencies:
                 model=ollama_model,
                 timeout=float(os.getenv("OLLAMA_TIMEOUT", "30")),
                 fallback_model=ollama_fallback,
+                max_retries=int(get_setting(app_settings, "ollama.max_retries", 3)),
+                # One keep-alive connection per concurrent chat turn.
+                pool_maxsize=int(get_setting(app_settings, "performance.max_concurrent_queries", 10)),
+                keep_alive=get_setting(app_settings, "ollama.keep_alive"),
             )
         else:
             raise ValueError("OLLAMA_BASE_URL and OLLAMA_MODEL must be configured.")
@@ -1399,6 +1695,7 @@ def load_dependencies() -> AssistantDependencies:
                 pass
 
     client: Any
+    async_client: Any = None
     if opensearch_host:
         try:
             config = OpenSearchConfig(
@@ -1412,7 +1709,11 @@ def load_dependencies() -> AssistantDependencies:
             if SCHEMA_PATH.exists():
                 with SCHEMA_PATH.open("r", encoding="utf-8") as schema_file:
                     schema = yaml.safe_load(schema_file)
-                ensure_index(client, index_name, schema)
+                ensure_index(client, index_name, storage_mapping(schema, vector_codec))
+            try:
+                async_client = create_async_client(config)
+            except ImportError as exc:
+                logger.info("Async OpenSearch client unavailable (%s); async retrieval will use worker threads.", exc)
         except Exception as exc:  # pragma: no cover - fallback on failure
             error_message = (
                 "OpenSearch connection failed. "
@@ -1443,14 +1744,49 @@ def load_dependencies() -> AssistantDependencies:
                 index_name=index_name,
                 chat_adapter=chat_adapter,
             )
+    elif local_index_dir:
+        # Single-node mode: search in-process instead of calling a cluster.
+        client = LocalSearchEngine(data_dir=local_index_dir, autosave=True)
+        if SCHEMA_PATH.exists():
+            with SCHEMA_PATH.open("r", encoding="utf-8") as schema_file:
+                schema = yaml.safe_load(schema_file)
+            ensure_index(client, index_name, storage_mapping(schema, vector_codec))
+        logger.info("Using local in-process search engine at %s", local_index_dir)
     else:
         client = NotImplementedStub("OpenSearch Client", "OPENSEARCH_HOST not configured")
 
+    try:
+        reranker = build_reranker(
+            os.getenv("RERANKER_TYPE", "passthrough"),
+            budget_ms=float(os.getenv("RERANK_BUDGET_MS", "150")),
+        )
+    except ValueError as exc:
+        logger.warning("Invalid reranker configuration (%s); using pass-through ordering.", exc)
+        reranker = PassThroughReranker()
+
+    fusion = str(
+        os.getenv("RETRIEVAL_FUSION") or get_setting(app_settings, "rag.retrieval.fusion", "server")
+    ).lower()
+    if fusion not in ("server", *FUSION_METHODS):
+        logger.warning(
+            "Invalid retrieval fusion mode '%s' (expected 'server' or one of %s); using server-side hybrid.",
+            fusion,
+            FUSION_METHODS,
+        )
+        fusion = "server"
+
+    top_k_retrieval = int(get_setting(app_settings, "rag.retrieval.top_k_retrieval", 20))
     retriever = HybridRetriever(
         client=client,
         index_name=index_name,
         query_embedder=query_embedder,
-        reranker=PassThroughReranker(),
+        reranker=reranker,
+        query_cache=query_cache,
+        hybrid_size=top_k_retrieval,
+        knn_k=top_k_retrieval,
+        fusion=fusion,
+        bm25_weight=float(get_setting(app_settings, "rag.retrieval.bm25_weight", 0.5)),
+        semantic_weight=float(get_setting(app_settings, "rag.retrieval.semantic_weight", 0.5)),
     )
 
     return AssistantDependencies(
@@ -1459,9 +1795,30 @@ def load_dependencies() -> AssistantDependencies:
         opensearch_client=client,
         index_name=index_name,
         chat_adapter=chat_adapter,
+        async_retriever=AsyncHybridRetriever(retriever, client=async_client),
+        residency_keeper=start_model_residency(chat_adapter, app_settings),
+        answer_cache=answer_cache,
     )
 
 
+def start_model_residency(chat_adapter: Any, settings: Dict[str, Any]) -> Optional[ModelResidencyKeeper]:
+    """Warm the adapter's Ollama models and, if configured, keep them loaded.
+
+    `ollama.keep_warm` starts a ModelResidencyKeeper (which warms on start);
+    with only `ollama.warm_up` the models are loaded once in the background so
+    app start-up does not wait on Ollama.
+    """
+
+    client = getattr(chat_adapter, "client", None)
+    if not callable(getattr(client, "warm_up", None)):
+        return None
+    if get_setting(settings, "ollama.keep_warm", True):
+        return ModelResidencyKeeper(client).start()
+    if get_setting(settings, "ollama.warm_up", True):
+        threading.Thread(target=client.warm_up, name="ollama-warm-up", daemon=True).start()
+    return None
+
+
 def update_llm_settings(
     primary_model: str,
     fallback_model: str,
@@ -1498,14 +1855,25 @@ def update_llm_settings(
 
     target_primary = primary or current_primary
 
+    previous_config = getattr(getattr(state.deps.chat_adapter, "client", None), "config", None)
+
     try:
         adapter = OllamaChatAdapter.from_env(
             base_url=base_url,
             model=target_primary,
             timeout=timeout,
             fallback_model=fallback or None,
+            max_retries=getattr(previous_config, "max_retries", None),
+            pool_maxsize=getattr(previous_config, "pool_maxsize", None),
+            keep_alive=getattr(previous_config, "keep_alive", None),
         )
+        if state.deps.residency_keeper is not None:
+            state.deps.residency_keeper.stop()
+        previous_close = getattr(state.deps.chat_adapter, "close", None)
+        if callable(previous_close):
+            previous_close()
         state.deps.chat_adapter = adapter
+        state.deps.residency_keeper = start_model_residency(adapter, load_app_settings())
 
         os.environ["OLLAMA_MODEL"] = target_primary
         os.environ["OLLAMA_TIMEOUT"] = str(int(timeout))
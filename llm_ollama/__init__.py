@@ -14,11 +14,16 @@ Features:
 - Environment-based configuration
 - Production-ready logging and debugging
 - Model availability checking
+- Token streaming with time-to-first-token and tokens/sec stats
+- Model warm-up and background residency refresh (keep_alive)
 
 Components:
 - client.py: Core Ollama HTTP client and configuration
 - adapters.py: High-level chat adapters and convenience wrappers
+- async_client.py: Asyncio client on a pooled httpx connection set
+- residency.py: Background keeper that holds models loaded in Ollama
 - OllamaClient: Low-level API communication
+- AsyncOllamaClient: Non-blocking API communication
 - OllamaChatAdapter: Simplified chat interface
 
 Usage:
@@ -36,13 +41,19 @@ Usage:
 """
 
 # Import main classes for easy access
-from .client import OllamaClient, OllamaConfig, OllamaHealth, ModelNotFoundError
+from .client import ChatStream, GenerationStats, OllamaClient, OllamaConfig, OllamaHealth, ModelNotFoundError
+from .async_client import AsyncOllamaClient
 from .adapters import OllamaChatAdapter
+from .residency import ModelResidencyKeeper
 
 __all__ = [
     'OllamaClient',
+    'AsyncOllamaClient',
     'OllamaConfig', 
     'OllamaHealth',
     'ModelNotFoundError',
-    'OllamaChatAdapter'
+    'ChatStream',
+    'GenerationStats',
+    'OllamaChatAdapter',
+    'ModelResidencyKeeper'
 ]
\ No newline at end of file
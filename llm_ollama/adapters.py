@@ -14,6 +14,8 @@ Features:
 - Error handling and recovery mechanisms
 - Production-ready chat adapters
 - Flexible configuration options
+- Async invocation for event-loop based servers
+- Token streaming (sync iterator and async iterator) with TTFT / tokens-per-second stats
 
 Usage:
     # Create adapter from environment
@@ -27,15 +29,45 @@ Usage:
     response = adapter.invoke_messages([
         {"role": "user", "content": "What is machine learning?"}
     ])
+
+    # Inside a coroutine
+    response = await adapter.ainvoke_messages(messages)
+
+    # Stream partial answers
+    stream = adapter.stream_messages(messages)
+    for delta in stream:
+        print(delta, end="")
+    print(stream.stats.ttft_ms)
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+from .async_client import AsyncChatStream, AsyncOllamaClient, httpx
+from .client import ChatStream, GenerationStats, OllamaClient, OllamaConfig
+
+
+class ThreadedChatStream:
+    """Async view of a blocking `ChatStream`, pulling each chunk on a worker thread."""
+
+    def __init__(self, stream: ChatStream) -> None:
+        self._stream = stream
+        self._chunks = iter(stream)
+        self.stats: GenerationStats = stream.stats
 
-from .client import OllamaClient, OllamaConfig
+    async def __aiter__(self) -> AsyncIterator[str]:
+        try:
+            while (delta := await asyncio.to_thread(next, self._chunks, None)) is not None:
+                yield delta
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self._stream.close)
 
 
 @dataclass
@@ -57,9 +89,11 @@ class OllamaChatAdapter:
     
     Attributes:
         client: Underlying OllamaClient for API communication
+        async_client: Optional AsyncOllamaClient sharing the same config
     """
 
     client: OllamaClient
+    async_client: Optional[AsyncOllamaClient] = None
 
     @classmethod
     def from_env(
@@ -68,6 +102,9 @@ class OllamaChatAdapter:
         model: str,
         timeout: float = 30.0,
         fallback_model: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: Optional[Union[str, float]] = None,
     ) -> "OllamaChatAdapter":
         """
         Create OllamaChatAdapter from environment configuration.
@@ -80,6 +117,12 @@ class OllamaChatAdapter:
             model: Primary model name to use
             timeout: Request timeout in seconds
             fallback_model: Optional fallback model (defaults to env var)
+            max_retries: Retry budget for transient failures (defaults to
+                OLLAMA_MAX_RETRIES, then OllamaConfig's default)
+            pool_maxsize: Keep-alive connections to hold open (defaults to
+                OllamaConfig's default)
+            keep_alive: How long Ollama keeps models loaded after a request
+                (defaults to OLLAMA_KEEP_ALIVE, then the server default)
             
         Returns:
             Configured OllamaChatAdapter instance
@@ -96,7 +139,15 @@ class OllamaChatAdapter:
             timeout=timeout,
             fallback_model=fallback,
         )
-        return cls(client=OllamaClient(config))
+        if max_retries is None and os.getenv("OLLAMA_MAX_RETRIES"):
+            max_retries = int(os.environ["OLLAMA_MAX_RETRIES"])
+        if max_retries is not None:
+            config.max_retries = max_retries
+        if pool_maxsize is not None:
+            config.pool_maxsize = pool_maxsize
+        config.keep_alive = keep_alive if keep_alive is not None else os.getenv("OLLAMA_KEEP_ALIVE") or None
+        async_client = AsyncOllamaClient(config) if httpx is not None else None
+        return cls(client=OllamaClient(config), async_client=async_client)
 
     def invoke_messages(
         self,
@@ -122,3 +173,65 @@ class OllamaChatAdapter:
         """
 
         return self.client.generate(messages=messages, stream=False, options=options)
+
+    def close(self) -> None:
+        """Release the sync client's pooled connections."""
+
+        self.client.close()
+
+    async def ainvoke_messages(
+        self,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict] = None,
+    ) -> str:
+        """
+        Coroutine variant of `invoke_messages`.
+
+        Uses the pooled async client when available; otherwise runs the
+        blocking client in a worker thread so the event loop stays free.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            options: Optional model parameters (temperature, top_p, etc.)
+
+        Returns:
+            Generated response text from Ollama
+        """
+
+        if self.async_client is not None:
+            return await self.async_client.generate(messages=messages, options=options)
+        return await asyncio.to_thread(self.invoke_messages, messages, options)
+
+    def stream_messages(
+        self,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict] = None,
+    ) -> ChatStream:
+        """
+        Stream a chat completion; iterate the result for content deltas.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            options: Optional model parameters (temperature, top_p, etc.)
+
+        Returns:
+            ChatStream whose `stats` hold TTFT and tokens/sec once exhausted
+        """
+
+        return self.client.stream_chat(messages=messages, options=options)
+
+    async def astream_messages(
+        self,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict] = None,
+    ) -> AsyncChatStream | ThreadedChatStream:
+        """
+        Coroutine variant of `stream_messages`; iterate the result with `async for`.
+
+        Uses the pooled async client when available; otherwise the blocking
+        stream is opened and read on worker threads.
+        """
+
+        if self.async_client is not None:
+            return await self.async_client.stream_chat(messages=messages, options=options)
+        return ThreadedChatStream(await asyncio.to_thread(self.stream_messages, messages, options))
@@ -0,0 +1,280 @@
+"""
+Asyncio Ollama HTTP Client
+
+This module provides an asyncio-native counterpart to `OllamaClient`, built on a
+pooled `httpx.AsyncClient`, so a single Gradio worker process can keep many chat
+requests in flight without dedicating a thread to each blocking LLM call.
+
+Features:
+- Non-blocking chat generation and health checks
+- Async NDJSON token streaming with the same TTFT / tokens-per-second stats
+- One pooled, keep-alive connection set per client (connect retries per config)
+- Same fallback-model and auto-pull behaviour as OllamaClient
+- Shared OllamaConfig so fallback promotion is visible to the sync client
+- Explicit lifecycle management via `aclose()` or `async with`
+
+Components:
+- AsyncOllamaClient: Asynchronous HTTP client for the Ollama REST API
+- AsyncChatStream: Async iterator over a streamed completion
+
+Usage:
+    config = OllamaConfig(base_url="http://localhost:11434", model="llama3:8b")
+    async with AsyncOllamaClient(config) as client:
+        answer = await client.generate(messages=messages)
+        async for delta in await client.stream_chat(messages=messages):
+            print(delta, end="")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+from .client import (
+    GenerationStats,
+    ModelNotFoundError,
+    OllamaConfig,
+    OllamaHealth,
+    chat_payload,
+    http_error_for_status,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncChatStream:
+    """
+    Async iterator over the content deltas of one streamed `/api/chat` response.
+
+    Mirrors `ChatStream`: `stats` is final once iteration ends, and `aclose()`
+    releases the connection when the consumer stops early.
+    """
+
+    def __init__(self, response: "httpx.Response", stats: GenerationStats) -> None:
+        self._response = response
+        self.stats = stats
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        try:
+            async for line in self._response.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                content = self.stats.observe(data)
+                if content:
+                    yield content
+                if self.stats.done:
+                    return
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._response.aclose()
+
+
+class AsyncOllamaClient:
+    """
+    Asyncio Ollama API Client
+
+    Mirrors the public surface of `OllamaClient` with coroutine methods. The
+    underlying `httpx.AsyncClient` is created lazily on first use so the client
+    binds to whichever event loop serves the request.
+
+    Attributes:
+        config: Connection and model settings, shareable with a sync client
+        max_connections: Upper bound on concurrent connections to Ollama
+        max_keepalive_connections: Idle connections kept open for reuse
+    """
+
+    def __init__(
+        self,
+        config: OllamaConfig,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ) -> None:
+        if httpx is None:
+            raise ImportError("httpx must be installed to use AsyncOllamaClient.")
+        self.config = config
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self._http: Optional["httpx.AsyncClient"] = http_client
+
+    def _client(self) -> "httpx.AsyncClient":
+        """Return the pooled HTTP client, creating it on first use."""
+
+        if self._http is None:
+            # httpx transports retry failed connection attempts only (no status retries).
+            transport = httpx.AsyncHTTPTransport(
+                retries=self.config.max_retries,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+            self._http = httpx.AsyncClient(
+                base_url=self.config.base_url.rstrip("/"),
+                timeout=self.config.timeout,
+                transport=transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _post(self, endpoint: str, payload: dict) -> dict:
+        """Send a POST request and map failures like `OllamaClient._post`."""
+
+        response = await self._send(endpoint, payload)
+        return response.json()
+
+    async def _send(self, endpoint: str, payload: dict, stream: bool = False) -> "httpx.Response":
+        """POST `payload`; with `stream`, return before the body is read."""
+
+        client = self._client()
+        try:
+            response = await client.send(client.build_request("POST", endpoint, json=payload), stream=stream)
+        except httpx.HTTPError as exc:
+            raise RuntimeError(f"Ollama request to {endpoint} failed: {exc}") from exc
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            await response.aclose()
+            raise http_error_for_status(endpoint, exc.response.status_code, exc) from exc
+        return response
+
+    async def health_check(self) -> OllamaHealth:
+        """Query `/api/tags` and report availability and latency."""
+
+        start = time.perf_counter()
+        try:
+            response = await self._client().get("/api/tags")
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            response.raise_for_status()
+            return OllamaHealth(
+                healthy=True,
+                status_code=response.status_code,
+                latency_ms=latency_ms,
+            )
+        except httpx.HTTPError as exc:
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            status_code = getattr(getattr(exc, "response", None), "status_code", None)
+            return OllamaHealth(
+                healthy=False,
+                status_code=status_code,
+                latency_ms=latency_ms,
+                error=str(exc),
+            )
+
+    async def _with_fallback(self, invoke: Callable[[str], Awaitable[T]]) -> T:
+        """Await `invoke(model)` with auto-pull on 404 and fallback-model promotion."""
+
+        async def _attempt(model_name: str, allow_pull: bool = True) -> T:
+            try:
+                return await invoke(model_name)
+            except ModelNotFoundError as not_found:
+                if not allow_pull:
+                    raise
+                logger.warning(
+                    "Ollama model '%s' missing — attempting auto-pull before fallback.",
+                    model_name,
+                )
+                try:
+                    await self._pull_model(model_name)
+                except Exception as pull_exc:
+                    logger.error("Auto-pull for model '%s' failed: %s", model_name, pull_exc)
+                    raise not_found from pull_exc
+                return await _attempt(model_name, allow_pull=False)
+
+        primary_model = self.config.model
+        fallback_model = (
+            self.config.fallback_model
+            if self.config.fallback_model and self.config.fallback_model != primary_model
+            else None
+        )
+
+        try:
+            return await _attempt(primary_model)
+        except RuntimeError as exc:
+            if not fallback_model:
+                raise
+            logger.warning(
+                "Primary Ollama model '%s' failed (%s). Trying fallback '%s'.",
+                primary_model,
+                exc,
+                fallback_model,
+            )
+            result = await _attempt(fallback_model)
+            # Promote fallback to become the active model for subsequent calls.
+            self.config.model = fallback_model
+            return result
+
+    async def generate(
+        self,
+        messages: List[dict],
+        options: Optional[dict] = None,
+    ) -> str:
+        """Invoke Ollama's chat endpoint without blocking the event loop."""
+
+        response = await self._with_fallback(
+            lambda model_name: self._post("/api/chat", chat_payload(self.config, model_name, messages, False, options))
+        )
+        message = response.get("message", {})
+        return message.get("content", "")
+
+    async def stream_chat(self, messages: List[dict], options: Optional[dict] = None) -> AsyncChatStream:
+        """Open a streamed chat completion; iterate the result for content deltas."""
+
+        stats = GenerationStats(model=self.config.model)
+
+        async def _open(model_name: str) -> "httpx.Response":
+            stats.model = model_name
+            return await self._send("/api/chat", chat_payload(self.config, model_name, messages, True, options), stream=True)
+
+        return AsyncChatStream(await self._with_fallback(_open), stats)
+
+    async def _pull_model(self, model_name: str) -> None:
+        """Pull a model via the Ollama HTTP API, consuming the NDJSON progress stream."""
+
+        timeout = max(self.config.timeout, 120.0)
+        async with self._client().stream(
+            "POST", "/api/pull", json={"model": model_name}, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if data.get("error"):
+                    raise RuntimeError(data["error"])
+                status = data.get("status", "").lower()
+                if status in {"success", "exists", "already exists"}:
+                    logger.info("Auto-pull for model '%s' completed.", model_name)
+                    return
+        raise RuntimeError(f"Ollama pull for model '{model_name}' did not complete successfully.")
@@ -12,7 +12,11 @@ Features:
 - Automatic fallback model support
 - Comprehensive error handling with context
 - Request timeout and retry logic
+- Pooled keep-alive `requests.Session` per client with retry/backoff
 - Model listing and introspection
+- NDJSON token streaming with time-to-first-token and tokens/sec stats
+- Batched `/api/embed` embedding with bounded concurrency (per-text fallback)
+- Per-request keep_alive and explicit warm_up() to keep models resident
 - Production-ready logging and debugging
 
 Components:
@@ -20,6 +24,7 @@ Components:
 - OllamaConfig: Configuration management for client setup
 - OllamaHealth: Health check results and monitoring
 - ModelNotFoundError: Custom exception for missing models
+- ChatStream / GenerationStats: Streamed completion and its timing
 
 Usage:
     # Configure and create client
@@ -35,21 +40,37 @@ Usage:
     
     # Generate responses
     response = client.generate(messages=messages)
+
+    # Stream tokens as they are generated
+    stream = client.stream_chat(messages=messages)
+    for delta in stream:
+        print(delta, end="")
+    print(stream.stats.ttft_ms, stream.stats.tokens_per_second)
+
+    # Release pooled connections when done
+    client.close()
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import re
+import threading
 import time
-from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ModelNotFoundError(RuntimeError):
     """
@@ -95,12 +116,201 @@ class OllamaConfig:
         model: Primary model name to use for generation
         timeout: Request timeout in seconds
         fallback_model: Fallback model name for error recovery
+        max_retries: Retries for connection failures and 502/503/504 responses
+        backoff_factor: Exponential backoff base between retries, in seconds
+        pool_maxsize: Keep-alive connections held open to the Ollama host
+        embed_batch_size: Texts per `/api/embed` request
+        embed_concurrency: Embedding requests in flight at once per client
+        keep_alive: How long Ollama keeps the model loaded after each request
+            (e.g. "30m", seconds as a number, -1 for forever; None = server default)
     """
 
     base_url: str
     model: str
     timeout: float = 30.0
     fallback_model: Optional[str] = "gemma3:1b"
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    pool_maxsize: int = 10
+    embed_batch_size: int = 64
+    embed_concurrency: int = 4
+    keep_alive: Optional[Union[str, float]] = None
+
+
+# Gateway errors and a restarting server are transient; HTTP 500 is not
+# (usually out of memory for the model) and goes to the fallback model instead.
+RETRY_STATUSES = (502, 503, 504)
+
+
+# Ollama unloads idle models after five minutes unless keep_alive says otherwise.
+SERVER_DEFAULT_KEEP_ALIVE_SECONDS = 300.0
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def keep_alive_seconds(value: Optional[Union[str, float]]) -> Optional[float]:
+    """Seconds a keep_alive value holds a model resident; None means forever.
+
+    Accepts numbers (seconds) and Go-style durations such as "30m" or "1h30m".
+    An unset value maps to the server's five-minute default.
+    """
+
+    if value is None:
+        return SERVER_DEFAULT_KEEP_ALIVE_SECONDS
+    if isinstance(value, (int, float)) or re.fullmatch(r"-?\d+(?:\.\d+)?", str(value).strip()):
+        seconds = float(value)
+    else:
+        text = str(value).strip().lower()
+        parts = _DURATION_PART.findall(text)
+        if not parts or "".join(number + unit for number, unit in parts) != text.lstrip("-"):
+            raise ValueError(f"Unrecognized keep_alive duration '{value}'")
+        seconds = sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+        if text.startswith("-"):
+            seconds = -seconds
+    return None if seconds < 0 else seconds
+
+
+def chat_payload(
+    config: OllamaConfig,
+    model_name: str,
+    messages: List[dict],
+    stream: bool,
+    options: Optional[dict],
+) -> dict:
+    """`/api/chat` request body shared by the sync and async clients."""
+
+    payload = {
+        "model": model_name,
+        "messages": messages,
+        "stream": stream,
+    }
+    if options:
+        payload["options"] = options
+    if config.keep_alive is not None:
+        payload["keep_alive"] = config.keep_alive
+    return payload
+
+
+def build_session(config: OllamaConfig) -> requests.Session:
+    """Create a keep-alive session with a bounded pool and retry/backoff policy."""
+
+    retry = Retry(
+        total=config.max_retries,
+        connect=config.max_retries,
+        # One read retry covers a keep-alive connection Ollama closed while idle;
+        # more would multiply the timeout of a slow generation.
+        read=min(1, config.max_retries),
+        status=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        # Ollama's chat / embedding / pull POSTs have no side effects worth guarding.
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def http_error_for_status(endpoint: str, status: Optional[int], exc: Exception) -> RuntimeError:
+    """Map an HTTP failure from Ollama onto the exception callers expect."""
+
+    if status == 500:
+        return RuntimeError(
+            "Ollama request failed with HTTP 500. The selected model may exceed available "
+            "system memory. Try pulling a smaller model such as 'mistral' or 'llama3:8b'."
+        )
+    if status == 404:
+        return ModelNotFoundError(f"Ollama endpoint {endpoint} returned HTTP 404.")
+    return RuntimeError(f"Ollama request to {endpoint} failed: {exc}")
+
+
+@dataclass
+class GenerationStats:
+    """
+    Timing of One Streamed Chat Completion
+
+    Attributes:
+        model: Model that produced the completion (the fallback if it was used)
+        ttft_ms: Request start to first content token, including retries/fallback
+        total_ms: Request start to the final (`done`) chunk
+        tokens: Generated tokens (Ollama's eval_count, else content chunks)
+        tokens_per_second: Decode throughput after the first token
+    """
+
+    model: str
+    started: float = field(default_factory=time.perf_counter, repr=False)
+    ttft_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+    tokens: int = 0
+    tokens_per_second: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.total_ms is not None
+
+    def observe(self, data: dict) -> str:
+        """Account for one NDJSON chunk and return its content delta."""
+
+        if data.get("error"):
+            raise RuntimeError(f"Ollama stream failed: {data['error']}")
+        now = time.perf_counter()
+        content = (data.get("message") or {}).get("content", "")
+        if content:
+            if self.ttft_ms is None:
+                self.ttft_ms = (now - self.started) * 1000.0
+            self.tokens += 1
+        if data.get("done"):
+            self.total_ms = (now - self.started) * 1000.0
+            eval_count, eval_ns = data.get("eval_count"), data.get("eval_duration")
+            if eval_count and eval_ns:
+                self.tokens = int(eval_count)
+                self.tokens_per_second = eval_count / (eval_ns / 1e9)
+            elif self.tokens and self.ttft_ms is not None and self.total_ms > self.ttft_ms:
+                self.tokens_per_second = self.tokens / ((self.total_ms - self.ttft_ms) / 1000.0)
+        return content
+
+
+class ChatStream:
+    """
+    Iterator over the content deltas of one streamed `/api/chat` response.
+
+    `stats` is filled in as chunks arrive and is final once iteration ends.
+    Closing early (or leaving a `with` block) releases the connection.
+    """
+
+    def __init__(self, lines: Iterable[bytes], stats: GenerationStats, close: Callable[[], None]):
+        self._lines = lines
+        self.stats = stats
+        self._close = close
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            for line in self._lines:
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                content = self.stats.observe(data)
+                if content:
+                    yield content
+                if self.stats.done:
+                    return
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._close()
+
+    def __enter__(self) -> "ChatStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class OllamaClient:
@@ -124,10 +334,30 @@ class OllamaClient:
         generate: Generate text responses from prompts/messages
         health_check: Monitor service health and availability
         list_models: Get available model information
+        close: Release pooled connections
     """
 
-    def __init__(self, config: OllamaConfig):
+    def __init__(self, config: OllamaConfig, session: Optional[requests.Session] = None):
         self.config = config
+        # One pooled session per client: chat turns and health polls reuse
+        # connections instead of paying TCP setup on every call.
+        self.session = session if session is not None else build_session(config)
+        # Shared by every embed() call on this client, so concurrent callers
+        # together never exceed `embed_concurrency` requests.
+        self._embed_slots = threading.BoundedSemaphore(max(1, config.embed_concurrency))
+        # None until the first batch call shows whether /api/embed exists.
+        self._batch_embed: Optional[bool] = None
+
+    def close(self) -> None:
+        """Close pooled connections."""
+
+        self.session.close()
+
+    def __enter__(self) -> "OllamaClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _post(self, endpoint: str, payload: dict) -> dict:
         """
@@ -149,25 +379,23 @@ class OllamaClient:
             ModelNotFoundError: For 404 model not found errors
         """
 
+        return self._send(endpoint, payload).json()
+
+    def _send(self, endpoint: str, payload: dict, stream: bool = False) -> requests.Response:
+        """POST `payload` and return the response, mapping failures like `_post`."""
+
         url = f"{self.config.base_url.rstrip('/')}{endpoint}"
         try:
-            response = requests.post(url, json=payload, timeout=self.config.timeout)
+            response = self.session.post(url, json=payload, timeout=self.config.timeout, stream=stream)
             response.raise_for_status()
         except requests.HTTPError as exc:
             status = exc.response.status_code if exc.response is not None else None
-            if status == 500:
-                raise RuntimeError(
-                    "Ollama request failed with HTTP 500. The selected model may exceed available "
-                    "system memory. Try pulling a smaller model such as 'mistral' or 'llama3:8b'."
-                ) from exc
-            if status == 404:
-                raise ModelNotFoundError(
-                    f"Ollama endpoint {endpoint} returned HTTP 404."
-                ) from exc
-            raise RuntimeError(f"Ollama request to {endpoint} failed: {exc}") from exc
+            if exc.response is not None:
+                exc.response.close()
+            raise http_error_for_status(endpoint, status, exc) from exc
         except requests.RequestException as exc:
             raise RuntimeError(f"Ollama request to {endpoint} failed: {exc}") from exc
-        return response.json()
+        return response
 
     def health_check(self) -> OllamaHealth:
         """
@@ -190,7 +418,7 @@ class OllamaClient:
 
         start = time.perf_counter()
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.base_url.rstrip('/')}/api/tags",
                 timeout=self.config.timeout,
             )
@@ -211,24 +439,12 @@ class OllamaClient:
                 error=str(exc),
             )
 
-    def generate(
-        self,
-        messages: List[dict],
-        stream: bool = False,
-        options: Optional[dict] = None,
-    ) -> str:
-        """Invoke Ollama's chat endpoint and concatenate the response."""
+    def _with_fallback(self, invoke: Callable[[str], T]) -> T:
+        """Run `invoke(model)` with auto-pull on 404 and fallback-model promotion."""
 
-        def _invoke(model_name: str, allow_pull: bool = True) -> dict:
-            payload = {
-                "model": model_name,
-                "messages": messages,
-                "stream": stream,
-            }
-            if options:
-                payload["options"] = options
+        def _attempt(model_name: str, allow_pull: bool = True) -> T:
             try:
-                return self._post("/api/chat", payload)
+                return invoke(model_name)
             except ModelNotFoundError as not_found:
                 if not allow_pull:
                     raise
@@ -250,7 +466,7 @@ class OllamaClient:
                         pull_exc,
                     )
                     raise not_found from pull_exc
-                return _invoke(model_name, allow_pull=False)
+                return _attempt(model_name, allow_pull=False)
 
         primary_model = self.config.model
         fallback_model = (
@@ -260,7 +476,7 @@ class OllamaClient:
         )
 
         try:
-            response = _invoke(primary_model)
+            return _attempt(primary_model)
         except RuntimeError as exc:
             if not fallback_model:
                 raise
@@ -270,41 +486,164 @@ class OllamaClient:
                 exc,
                 fallback_model,
             )
-            response = _invoke(fallback_model)
+            result = _attempt(fallback_model)
             # Promote fallback to become the active model for subsequent calls.
             self.config.model = fallback_model
+            return result
+
+    def generate(
+        self,
+        messages: List[dict],
+        stream: bool = False,
+        options: Optional[dict] = None,
+    ) -> str:
+        """Invoke Ollama's chat endpoint and concatenate the response."""
 
         if stream:
-            raise NotImplementedError("Streaming responses are not handled yet.")
+            return "".join(self.stream_chat(messages, options=options))
 
+        response = self._with_fallback(
+            lambda model_name: self._post("/api/chat", chat_payload(self.config, model_name, messages, False, options))
+        )
         message = response.get("message", {})
         return message.get("content", "")
 
+    def stream_chat(self, messages: List[dict], options: Optional[dict] = None) -> ChatStream:
+        """
+        Stream a chat completion as NDJSON and yield content deltas.
+
+        Fallback and auto-pull apply until the response starts; errors after
+        the first chunk are raised to the consumer. The returned stream's
+        `stats` carry time-to-first-token and tokens/sec once it is exhausted.
+        """
+
+        stats = GenerationStats(model=self.config.model)
+
+        def _open(model_name: str) -> requests.Response:
+            stats.model = model_name
+            payload = chat_payload(self.config, model_name, messages, True, options)
+            return self._send("/api/chat", payload, stream=True)
+
+        response = self._with_fallback(_open)
+        return ChatStream(response.iter_lines(), stats, close=response.close)
+
+    def resident_models(self) -> List[str]:
+        """Models worth keeping loaded: the active model and its fallback."""
+
+        return [model for model in dict.fromkeys((self.config.model, self.config.fallback_model)) if model]
+
+    def warm_up(self, models: Optional[Iterable[str]] = None) -> Dict[str, Optional[float]]:
+        """
+        Load models into Ollama ahead of user traffic.
+
+        An empty `/api/generate` request loads the model (or just renews its
+        keep_alive if it is already resident) without generating anything.
+
+        Args:
+            models: Models to load (defaults to `resident_models()`)
+
+        Returns:
+            Milliseconds each request took (None where it failed). A load
+            from disk takes seconds; a renewal takes milliseconds.
+        """
+
+        timings: Dict[str, Optional[float]] = {}
+        for model in models if models is not None else self.resident_models():
+            payload: dict = {"model": model}
+            if self.config.keep_alive is not None:
+                payload["keep_alive"] = self.config.keep_alive
+            start = time.perf_counter()
+            try:
+                self._post("/api/generate", payload)
+            except RuntimeError as exc:
+                logger.warning("Warm-up for Ollama model '%s' failed: %s", model, exc)
+                timings[model] = None
+                continue
+            timings[model] = (time.perf_counter() - start) * 1000.0
+            logger.info("Ollama model '%s' resident (%.0f ms).", model, timings[model])
+        return timings
+
     def embed(self, texts: Iterable[str], options: Optional[dict] = None) -> List[List[float]]:
-        """Call the embeddings endpoint to obtain vectors for each text."""
-
-        vectors: List[List[float]] = []
-        for text in texts:
-            payload = {
-                "model": self.config.model,
-                "prompt": text,
-            }
-            if options:
-                payload["options"] = options
-
-            response = self._post("/api/embeddings", payload)
-            embedding = response.get("embedding")
-            if embedding is None:
-                raise ValueError("Ollama embedding response missing 'embedding' key.")
-            vectors.append(embedding)
-        return vectors
+        """
+        Obtain one vector per text, in input order.
+
+        Texts are sent `embed_batch_size` at a time to the multi-input
+        `/api/embed` endpoint, with up to `embed_concurrency` requests in
+        flight. Servers without that endpoint (404) are remembered and served
+        one text per `/api/embeddings` request instead.
+        """
+
+        texts = list(texts)
+        if not texts:
+            return []
+        if self._batch_embed is False:
+            return self._bounded_map(self._embed_one, texts, options)
+
+        size = max(1, self.config.embed_batch_size)
+        batches = [texts[start:start + size] for start in range(0, len(texts), size)]
+        try:
+            results = self._bounded_map(self._embed_batch, batches, options)
+        except ModelNotFoundError:
+            if self._batch_embed:
+                raise  # The endpoint exists, so the model itself is missing.
+            logger.warning("Ollama /api/embed unavailable; falling back to per-text /api/embeddings.")
+            vectors = self._bounded_map(self._embed_one, texts, options)
+            self._batch_embed = False
+            return vectors
+        self._batch_embed = True
+        return [vector for batch in results for vector in batch]
+
+    def _bounded_map(self, func: Callable[[T, Optional[dict]], list], items: List[T], options: Optional[dict]) -> list:
+        """`func` over `items` in order, holding an embedding slot per request."""
+
+        def _call(item: T) -> list:
+            with self._embed_slots:
+                return func(item, options)
+
+        if len(items) == 1:
+            return [_call(items[0])]
+        workers = min(len(items), max(1, self.config.embed_concurrency))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ollama-embed") as executor:
+            return list(executor.map(_call, items))
+
+    def _embed_batch(self, texts: List[str], options: Optional[dict]) -> List[List[float]]:
+        payload = {
+            "model": self.config.model,
+            "input": texts,
+        }
+        if options:
+            payload["options"] = options
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+
+        response = self._post("/api/embed", payload)
+        embeddings = response.get("embeddings")
+        if embeddings is None or len(embeddings) != len(texts):
+            raise ValueError("Ollama /api/embed response missing 'embeddings' for every input.")
+        return embeddings
+
+    def _embed_one(self, text: str, options: Optional[dict]) -> List[float]:
+        payload = {
+            "model": self.config.model,
+            "prompt": text,
+        }
+        if options:
+            payload["options"] = options
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+
+        response = self._post("/api/embeddings", payload)
+        embedding = response.get("embedding")
+        if embedding is None:
+            raise ValueError("Ollama embedding response missing 'embedding' key.")
+        return embedding
 
     def _pull_model(self, model_name: str) -> None:
         """Attempt to pull a model via the Ollama HTTP API."""
 
         url = f"{self.config.base_url.rstrip('/')}/api/pull"
         timeout = max(self.config.timeout, 120.0)
-        with requests.post(
+        with self.session.post(
             url,
             json={"model": model_name},
             timeout=timeout,
@@ -0,0 +1,130 @@
+"""
+Ollama Model Residency Keeper
+
+This module keeps the chat models loaded in Ollama between user requests.
+Ollama unloads a model once its keep_alive window passes without traffic, and
+the next question then pays a multi-second load from disk before the first
+token. The keeper renews residency on a background thread shortly before the
+window would expire.
+
+Features:
+- Warms the primary and fallback models as soon as it starts
+- Refreshes at a fraction of the keep_alive window (default 80%)
+- Follows model changes on the client (e.g. after a fallback promotion)
+- Stops cleanly; safe to restart with a new client
+- Refresh counts and last load timings for status reporting
+
+Usage:
+    client = OllamaClient(OllamaConfig(base_url=url, model="llama3:8b", keep_alive="30m"))
+    keeper = ModelResidencyKeeper(client).start()
+    ...
+    keeper.stop()
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .client import OllamaClient, keep_alive_seconds
+
+logger = logging.getLogger(__name__)
+
+REFRESH_FRACTION = 0.8
+MIN_REFRESH_INTERVAL = 10.0
+
+
+class ModelResidencyKeeper:
+    """
+    Background thread that keeps Ollama models resident.
+
+    Attributes:
+        client: OllamaClient whose config supplies models and keep_alive
+        interval: Seconds between refreshes; None warms once and exits
+            (used when keep_alive is negative, i.e. models never unload)
+        models: Fixed model list (defaults to the client's primary and fallback)
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        interval: Optional[float] = None,
+        models: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.client = client
+        if interval is None:
+            window = keep_alive_seconds(client.config.keep_alive)
+            interval = None if window is None else max(MIN_REFRESH_INTERVAL, window * REFRESH_FRACTION)
+        self.interval = interval
+        self.models: Optional[List[str]] = list(models) if models is not None else None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refresh: Optional[float] = None
+        self.last_timings: Dict[str, Optional[float]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ModelResidencyKeeper":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def refresh(self) -> Dict[str, Optional[float]]:
+        """Warm every model once and record the outcome."""
+
+        timings = self.client.warm_up(self.models)
+        self.refreshes += 1
+        self.failures += sum(1 for elapsed in timings.values() if elapsed is None)
+        self.last_refresh = time.time()
+        self.last_timings = timings
+        return timings
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception as exc:  # keep the thread alive through unexpected errors
+                self.failures += 1
+                logger.warning("Ollama residency refresh failed: %s", exc)
+            if self.interval is None or self._stop.wait(self.interval):
+                return
+
+    def start(self) -> "ModelResidencyKeeper":
+        """Warm the models now and keep refreshing them in the background."""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ollama-residency", daemon=True)
+            self._thread.start()
+            logger.info(
+                "Keeping Ollama models resident (keep_alive=%s, refresh every %s).",
+                self.client.config.keep_alive,
+                f"{self.interval:.0f}s" if self.interval is not None else "never",
+            )
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "keep_alive": self.client.config.keep_alive,
+            "interval_s": self.interval,
+            "models": self.models if self.models is not None else self.client.resident_models(),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_refresh": self.last_refresh,
+            "last_load_ms": {
+                model: round(elapsed, 1) if elapsed is not None else None
+                for model, elapsed in self.last_timings.items()
+            },
+        }
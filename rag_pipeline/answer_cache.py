@@ -0,0 +1,197 @@
+"""
+Semantic Answer Cache
+
+This module caches generated answers in front of the LLM so that repeated
+research questions are served in milliseconds instead of a full Ollama
+generation. An answer is reused only when the new question embeds close to a
+cached one (cosine similarity above a threshold) *and* retrieval returned the
+same evidence for the same prompt template and model, so a paraphrase never
+receives an answer grounded in different passages.
+
+Features:
+- Exact match on (retrieved chunk-ID set, prompt version, model)
+- Cosine-similarity match on the normalized question embedding within that key
+- LRU eviction over evidence sets plus per-answer time-to-live
+- Thread-safe access for concurrent Gradio sessions
+- Hit, miss and near-miss counters with hit rate for status endpoints
+
+Usage:
+    cache = SemanticAnswerCache(similarity_threshold=0.95, ttl_seconds=3600)
+    key = dict(chunk_ids=ids, prompt_version=prompt_fingerprint(template), model='llama3:8b')
+    answer = cache.lookup(query_vector, **key)
+    if answer is None:
+        answer = generate(...)
+        cache.store(query_vector, answer, **key)
+    print(cache.stats())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import CacheStats, LRUCache
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_MAX_EVIDENCE_SETS = 1024
+DEFAULT_MAX_VARIANTS = 8
+
+EvidenceKey = Tuple[FrozenSet[str], str, str]
+
+
+def prompt_fingerprint(template: Dict[str, Any]) -> str:
+    """Version of a prompt template: its explicit `version`, else a content hash."""
+
+    if template.get("version"):
+        return str(template["version"])
+    payload = json.dumps(template.get("qa_prompt", template), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _unit_vector(vector: Any) -> Optional[np.ndarray]:
+    array = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(array))
+    return array / norm if norm > 0 else None
+
+
+@dataclass
+class CachedAnswer:
+    """One stored answer and the unit-length question vector it answered."""
+
+    vector: np.ndarray
+    answer: str
+    expires_at: float
+
+
+@dataclass
+class AnswerCacheStats(CacheStats):
+    """Cache counters plus lookups that matched the evidence but not the question."""
+
+    near_misses: int = 0
+
+
+class SemanticAnswerCache:
+    """
+    Answer cache keyed on evidence, prompt and model, matched by question similarity.
+
+    Attributes:
+        similarity_threshold: Minimum cosine similarity between question vectors
+        max_size: Evidence sets kept before least-recently-used eviction
+        ttl_seconds: Lifetime of each stored answer (None keeps answers until evicted)
+        max_variants: Differently phrased questions remembered per evidence set
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_size: int = DEFAULT_MAX_EVIDENCE_SETS,
+        ttl_seconds: Optional[float] = None,
+        max_variants: int = DEFAULT_MAX_VARIANTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError("similarity_threshold must be in (0, 1]")
+        if max_variants <= 0:
+            raise ValueError("max_variants must be a positive integer")
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_variants = max_variants
+        self._clock = clock
+        self._entries: LRUCache[List[CachedAnswer]] = LRUCache(
+            max_size=max_size, ttl_seconds=ttl_seconds, clock=clock
+        )
+        self._lock = threading.Lock()
+        self._stats = AnswerCacheStats()
+
+    @staticmethod
+    def evidence_key(chunk_ids: Iterable[str], prompt_version: str, model: str) -> EvidenceKey:
+        """Exact part of the key: the same passages, prompt and model."""
+
+        return frozenset(str(chunk_id) for chunk_id in chunk_ids), prompt_version, model
+
+    def _live_answers(self, key: EvidenceKey) -> List[CachedAnswer]:
+        answers = self._entries.get(key) or []
+        now = self._clock()
+        live = [answer for answer in answers if answer.expires_at > now]
+        self._stats.expirations += len(answers) - len(live)
+        return live
+
+    def lookup(
+        self,
+        vector: Any,
+        chunk_ids: Iterable[str],
+        prompt_version: str,
+        model: str,
+    ) -> Optional[str]:
+        """Return the stored answer for a similar question over the same evidence."""
+
+        unit = _unit_vector(vector)
+        key = self.evidence_key(chunk_ids, prompt_version, model)
+        with self._lock:
+            answers = self._live_answers(key) if unit is not None else []
+            best: Optional[CachedAnswer] = None
+            best_similarity = -1.0
+            for cached in answers:
+                similarity = float(cached.vector @ unit) if cached.vector.shape == unit.shape else -1.0
+                if similarity > best_similarity:
+                    best, best_similarity = cached, similarity
+            if best is not None and best_similarity >= self.similarity_threshold:
+                self._stats.hits += 1
+                return best.answer
+            self._stats.misses += 1
+            if best is not None:
+                self._stats.near_misses += 1
+            return None
+
+    def store(
+        self,
+        vector: Any,
+        answer: str,
+        chunk_ids: Iterable[str],
+        prompt_version: str,
+        model: str,
+    ) -> None:
+        """Remember `answer`, replacing any stored answer to an equivalent question."""
+
+        unit = _unit_vector(vector)
+        if unit is None or not answer:
+            return
+        key = self.evidence_key(chunk_ids, prompt_version, model)
+        expires_at = float("inf") if self.ttl_seconds is None else self._clock() + self.ttl_seconds
+        with self._lock:
+            answers = [
+                cached
+                for cached in self._live_answers(key)
+                if cached.vector.shape != unit.shape
+                or float(cached.vector @ unit) < self.similarity_threshold
+            ]
+            answers.append(CachedAnswer(vector=unit, answer=answer, expires_at=expires_at))
+            self._entries.put(key, answers[-self.max_variants:])
+
+    def clear(self) -> None:
+        """Drop every stored answer (e.g. after re-ingestion) while keeping counters."""
+
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters and current occupancy."""
+
+        entries = self._entries.stats()
+        with self._lock:
+            payload = self._stats.as_dict()
+        payload["evictions"] = entries["evictions"]
+        payload["expirations"] += entries["expirations"]
+        payload["evidence_sets"] = entries["size"]
+        payload["max_size"] = entries["max_size"]
+        payload["ttl_seconds"] = self.ttl_seconds
+        payload["similarity_threshold"] = self.similarity_threshold
+        return payload
@@ -0,0 +1,132 @@
+"""
+In-Process Caching Utilities
+
+This module provides the small, thread-safe caching primitives shared by the
+RAG pipeline components (embedding lookups, query vectors, reranker scores),
+keeping hit/miss accounting consistent so cache effectiveness can be exported
+alongside the rest of the service metrics.
+
+Features:
+- Bounded least-recently-used eviction
+- Optional time-to-live expiry per entry
+- Thread-safe access for concurrent Gradio sessions
+- Hit, miss and eviction counters
+- Stats snapshot suitable for JSON status endpoints
+
+Usage:
+    cache = LRUCache(max_size=1024, ttl_seconds=3600)
+    cache.put("key", value)
+    value = cache.get("key")
+    print(cache.stats())
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how effective a cache has been since creation."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return counters plus the derived hit rate."""
+
+        payload = asdict(self)
+        payload["hit_rate"] = round(self.hit_rate, 4)
+        return payload
+
+
+class LRUCache(Generic[V]):
+    """Bounded mapping that evicts the least recently used entry first.
+
+    When `ttl_seconds` is set, entries older than the TTL are treated as misses
+    and dropped on access.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive when provided")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value or None, refreshing its recency on a hit."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Insert or refresh an entry, evicting the oldest one when full."""
+
+        expires_at = float("inf") if self.ttl_seconds is None else self._clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry while keeping the accumulated counters."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self._clock()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters and current occupancy."""
+
+        with self._lock:
+            payload = self._stats.as_dict()
+            payload["size"] = len(self._entries)
+            payload["max_size"] = self.max_size
+            payload["ttl_seconds"] = self.ttl_seconds
+        return payload
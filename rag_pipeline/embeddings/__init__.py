@@ -10,6 +10,7 @@ Features:
 - Batch processing for efficiency
 - GPU acceleration support
 - Model caching and optimization
+- Persistent content-addressed embedding cache
 - Consistent vector dimensions
 - Error handling for model loading
 
@@ -0,0 +1,60 @@
+"""
+Embedding Backend Selection
+
+This module maps the `EMBEDDING_BACKEND` setting to an embedder instance so
+the app, batch ingestion and the directory watcher all build the same model
+the same way.
+
+Features:
+- `torch`: SentenceTransformerEmbeddings (PyTorch, GPU/MPS aware)
+- `onnx`: OnnxEmbeddings (ONNX Runtime, optional int8 weights, CPU only)
+- Backend-specific options read from the environment
+
+Usage:
+    embedder = build_embedder(os.getenv('EMBEDDING_BACKEND', 'torch'), 'all-MiniLM-L6-v2')
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from .sentence_transformer import SentenceTransformerEmbeddings
+
+EMBEDDING_BACKENDS = ("torch", "onnx")
+
+
+def _onnx_quantize() -> bool:
+    return os.getenv("ONNX_QUANTIZE", "true").lower() not in {"false", "0"}
+
+
+def cache_namespace(backend: Optional[str], model_name: str) -> str:
+    """Embedding-cache model key used by `backend` (vectors differ per backend)."""
+
+    if (backend or "torch").lower() == "onnx":
+        return f"{model_name}:onnx{'-int8' if _onnx_quantize() else ''}"
+    return model_name
+
+
+def build_embedder(
+    backend: Optional[str],
+    model_name: str,
+    cache_dir: Optional[str] = None,
+) -> SentenceTransformerEmbeddings:
+    """Return the embedder for `backend` (defaults to ``torch``)."""
+
+    backend = (backend or "torch").lower()
+    if backend == "torch":
+        return SentenceTransformerEmbeddings(model_name=model_name, cache_dir=cache_dir)
+    if backend == "onnx":
+        from .onnx_backend import OnnxEmbeddings
+
+        threads = os.getenv("ONNX_NUM_THREADS")
+        return OnnxEmbeddings(
+            model_name=model_name,
+            cache_dir=cache_dir,
+            onnx_dir=os.getenv("ONNX_MODEL_DIR") or None,
+            quantize=_onnx_quantize(),
+            num_threads=int(threads) if threads else None,
+        )
+    raise ValueError(f"Unknown embedding backend '{backend}'. Expected one of {EMBEDDING_BACKENDS}.")
@@ -0,0 +1,127 @@
+"""
+Length-Bucketed Dynamic Batching
+
+This module groups texts of similar token length into encoder batches bounded
+by a padded-token budget rather than a fixed count. Transformers pad every
+sequence in a batch to the longest one, so mixing short headings with long
+chunks wastes most of the compute on padding; sorting by length first and
+sizing batches by tokens keeps padding low and batch cost roughly constant.
+
+Features:
+- Token lengths from the model's tokenizer, with a cheap word-count estimate
+- Longest-first batching under a `max_tokens` budget (batch size x longest)
+- Hard cap on sequences per batch and truncation-aware length clamping
+- Index arrays so callers can scatter results back into input order
+- Padding-efficiency accounting for monitoring
+
+Usage:
+    lengths = token_lengths(texts, tokenizer, max_length=256)
+    for batch in length_bucketed_batches(lengths, max_tokens=8192):
+        vectors[batch] = model.encode([texts[i] for i in batch])
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_TOKENS = 8192
+DEFAULT_MAX_BATCH_SIZE = 128
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough WordPiece length: ~4/3 tokens per word plus [CLS]/[SEP]."""
+
+    return len(text.split()) * 4 // 3 + 2
+
+
+def token_lengths(
+    texts: Sequence[str],
+    tokenizer: Any = None,
+    max_length: Optional[int] = None,
+) -> np.ndarray:
+    """Return the (truncated) token length of each text as an int array."""
+
+    lengths: Optional[List[int]] = None
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(
+                list(texts),
+                add_special_tokens=True,
+                truncation=max_length is not None,
+                max_length=max_length,
+            )["input_ids"]
+            lengths = [len(ids) for ids in encoded]
+        except Exception as exc:  # pragma: no cover - tokenizer quirks fall back to estimates
+            logger.debug(f"Tokenizer length lookup failed, estimating instead: {exc}")
+    if lengths is None:
+        lengths = [estimate_tokens(text) for text in texts]
+
+    result = np.asarray(lengths, dtype=np.int64)
+    if max_length:
+        np.minimum(result, max_length, out=result)
+    return np.maximum(result, 1)
+
+
+def length_bucketed_batches(
+    lengths: np.ndarray,
+    max_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+) -> List[np.ndarray]:
+    """Split input positions into batches of similar length under a token budget.
+
+    Positions are visited longest first, so each batch's padded cost is
+    `len(batch) * lengths[batch[0]]`; a single over-budget text still forms
+    its own batch.
+    """
+
+    if max_tokens <= 0 or max_batch_size <= 0:
+        raise ValueError("max_tokens and max_batch_size must be positive integers")
+
+    order = np.argsort(-lengths, kind="stable")
+    batches: List[np.ndarray] = []
+    start = 0
+    while start < order.size:
+        longest = int(lengths[order[start]])
+        size = max(1, min(max_batch_size, max_tokens // longest))
+        batches.append(order[start : start + size])
+        start += size
+    return batches
+
+
+@dataclass
+class BatchingStats:
+    """Running totals of real vs padded tokens across encoder batches."""
+
+    batches: int = 0
+    texts: int = 0
+    tokens: int = 0
+    padded_tokens: int = 0
+
+    def record(self, lengths: np.ndarray, batches: Sequence[np.ndarray]) -> None:
+        for batch in batches:
+            batch_lengths = lengths[batch]
+            self.batches += 1
+            self.texts += int(batch.size)
+            self.tokens += int(batch_lengths.sum())
+            self.padded_tokens += int(batch_lengths.max()) * int(batch.size)
+
+    @property
+    def padding_efficiency(self) -> float:
+        """Share of encoded positions that are real tokens (1.0 = no padding)."""
+
+        return self.tokens / self.padded_tokens if self.padded_tokens else 1.0
+
+    def as_dict(self) -> dict:
+        return {
+            "batches": self.batches,
+            "texts": self.texts,
+            "tokens": self.tokens,
+            "padded_tokens": self.padded_tokens,
+            "padding_efficiency": round(self.padding_efficiency, 4),
+        }
@@ -0,0 +1,311 @@
+"""
+Persistent Content-Addressed Embedding Cache
+
+This module stores document embeddings on disk keyed by the embedding model and
+a hash of the normalized chunk text, so re-ingesting an unchanged corpus costs
+memory-mapped disk reads instead of transformer forward passes.
+
+Features:
+- Content-addressed keys (model name + normalized text hash)
+- Append-only float32 vector store read through numpy.memmap
+- In-memory LRU in front of the disk store
+- Hit/miss counters for memory and disk tiers
+- Crash-tolerant layout (vectors are written before their keys)
+- Safe to share between processes (app, watcher, batch ingestion)
+
+Storage Layout (one directory per model):
+- meta.json: model name and embedding dimension
+- vectors.f32: contiguous float32 rows
+- keys.txt: one hex digest per row, in row order
+- .lock: `flock` target serializing writers across processes
+
+Note:
+    Appends and torn-tail repair run under an exclusive `fcntl.flock` on
+    `.lock`, and a writer picks up rows added by other processes before
+    numbering its own, so several processes may share one directory. Readers
+    pick up other processes' rows on their next miss. Without `fcntl`
+    (Windows) only one writer process per directory is supported.
+
+Usage:
+    cache = EmbeddingCache('/var/cache/rag-embeddings', 'all-MiniLM-L6-v2')
+    vectors = cache.get_many(['chunk one', 'chunk two'])  # None for misses
+    cache.put_many(['chunk two'], new_vectors)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from ..cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+_KEY_BYTES = 64 + 1  # hex sha256 digest + newline
+
+
+def normalize_for_cache(text: str) -> str:
+    """Apply the normalization used for cache keys (NFKC + collapsed whitespace)."""
+
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def embedding_cache_key(model_name: str, text: str) -> str:
+    """Return the content address for a (model, text) pair."""
+
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(normalize_for_cache(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier (LRU + memory-mapped file) store for embedding vectors."""
+
+    def __init__(
+        self,
+        cache_dir: str | os.PathLike[str],
+        model_name: str,
+        memory_size: int = 4096,
+    ) -> None:
+        self.model_name = model_name
+        self.directory = Path(cache_dir).expanduser() / re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._meta_path = self.directory / "meta.json"
+        self._vectors_path = self.directory / "vectors.f32"
+        self._keys_path = self.directory / "keys.txt"
+        self._lock_path = self.directory / ".lock"
+
+        self._memory: LRUCache[np.ndarray] = LRUCache(max_size=memory_size)
+        self._lock = threading.RLock()
+        self._rows: Dict[str, int] = {}
+        self._row_count = 0
+        self._dimension: Optional[int] = None
+        self._mmap: Optional[np.memmap] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        self._load()
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Embedding dimension stored in this cache, once known."""
+
+        return self._dimension
+
+    def _read_meta(self) -> None:
+        if self._dimension is not None or not self._meta_path.exists():
+            return
+        meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+        if meta.get("model_name") != self.model_name:
+            raise ValueError(
+                f"Embedding cache at {self.directory} belongs to model "
+                f"'{meta.get('model_name')}', not '{self.model_name}'."
+            )
+        self._dimension = int(meta["dimension"])
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock on the cache directory, shared by every process using it."""
+
+        if fcntl is None:
+            yield
+            return
+        with self._lock_path.open("a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        """Rebuild the key → row index from disk, ignoring torn trailing writes."""
+
+        with self._file_lock():
+            self._refresh()
+            # Under the lock no writer is mid-append, so anything past the
+            # last complete row was left by a crashed writer.
+            self._truncate_to(self._row_count)
+        if self._dimension is not None:
+            logger.info(
+                "Loaded embedding cache for %s: %d vectors (dim=%d) from %s",
+                self.model_name,
+                self._row_count,
+                self._dimension,
+                self.directory,
+            )
+
+    def _refresh(self) -> None:
+        """Index complete rows appended (by any process) since this one last looked.
+
+        A key line is only written after its vector row is on disk, so every
+        complete key line below the vector row count is safe to serve.
+        """
+
+        self._read_meta()
+        if self._dimension is None or not self._keys_path.exists():
+            return
+
+        row_bytes = self._dimension * np.dtype(np.float32).itemsize
+        vector_rows = self._vectors_path.stat().st_size // row_bytes if self._vectors_path.exists() else 0
+        rows = min(vector_rows, self._keys_path.stat().st_size // _KEY_BYTES)
+        if rows <= self._row_count:
+            return
+
+        with self._keys_path.open("rb") as handle:
+            handle.seek(self._row_count * _KEY_BYTES)
+            data = handle.read((rows - self._row_count) * _KEY_BYTES)
+        for offset in range(0, len(data) - _KEY_BYTES + 1, _KEY_BYTES):
+            line = data[offset:offset + _KEY_BYTES]
+            if line[-1:] != b"\n":
+                break
+            self._rows.setdefault(line[:-1].decode("ascii"), self._row_count)
+            self._row_count += 1
+
+    def _truncate_to(self, rows: int) -> None:
+        """Drop partially written rows left behind by an interrupted writer."""
+
+        if self._dimension is None:
+            return
+        row_bytes = self._dimension * np.dtype(np.float32).itemsize
+        if self._vectors_path.exists() and self._vectors_path.stat().st_size != rows * row_bytes:
+            with self._vectors_path.open("r+b") as handle:
+                handle.truncate(rows * row_bytes)
+        if self._keys_path.exists() and self._keys_path.stat().st_size != rows * _KEY_BYTES:
+            with self._keys_path.open("r+b") as handle:
+                handle.truncate(rows * _KEY_BYTES)
+
+    def _mapped(self, row: int) -> np.memmap:
+        """Return a memmap covering `row`, remapping after the file has grown."""
+
+        if self._mmap is None or row >= self._mmap.shape[0]:
+            self._mmap = np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(self._row_count, self._dimension),
+            )
+        return self._mmap
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached vector for `text`, or None on a miss."""
+
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up several texts at once; misses come back as None."""
+
+        results: List[Optional[np.ndarray]] = []
+        refreshed = False
+        with self._lock:
+            for text in texts:
+                key = embedding_cache_key(self.model_name, text)
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self.memory_hits += 1
+                    results.append(vector)
+                    continue
+
+                row = self._rows.get(key)
+                if row is None and not refreshed:
+                    # Another process may have written it since we last looked.
+                    self._refresh()
+                    refreshed = True
+                    row = self._rows.get(key)
+                if row is None:
+                    self.misses += 1
+                    results.append(None)
+                    continue
+
+                vector = np.array(self._mapped(row)[row], dtype=np.float32)
+                self._memory.put(key, vector)
+                self.disk_hits += 1
+                results.append(vector)
+        return results
+
+    def put_many(self, texts: Sequence[str], vectors: Any) -> None:
+        """Persist vectors for texts that are not cached yet."""
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(texts):
+            raise ValueError("put_many expects one 2-D vector row per text")
+
+        with self._lock, self._file_lock():
+            self._refresh()
+            self._truncate_to(self._row_count)
+            if self._dimension is None:
+                self._dimension = int(matrix.shape[1])
+                self._meta_path.write_text(
+                    json.dumps({"model_name": self.model_name, "dimension": self._dimension}),
+                    encoding="utf-8",
+                )
+            elif matrix.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} does not match cached dimension {self._dimension}."
+                )
+
+            new_keys: Dict[str, np.ndarray] = {}
+            for text, vector in zip(texts, matrix):
+                key = embedding_cache_key(self.model_name, text)
+                self._memory.put(key, vector.copy())
+                if key not in self._rows:
+                    new_keys.setdefault(key, vector)
+
+            if not new_keys:
+                return
+
+            # Vectors first, keys second: a key only becomes visible once its row is complete.
+            with self._vectors_path.open("ab") as handle:
+                handle.write(np.ascontiguousarray(np.stack(list(new_keys.values()))).tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+            with self._keys_path.open("a", encoding="ascii") as handle:
+                handle.write("".join(f"{key}\n" for key in new_keys))
+
+            # Row numbers follow the files, which `_refresh` has caught up with.
+            for key in new_keys:
+                self._rows[key] = self._row_count
+                self._row_count += 1
+            self.writes += len(new_keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for both tiers plus on-disk size."""
+
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            return {
+                "model_name": self.model_name,
+                "directory": str(self.directory),
+                "dimension": self._dimension,
+                "stored_vectors": self._row_count,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory": self._memory.stats(),
+            }
+
+    def __len__(self) -> int:
+        return self._row_count
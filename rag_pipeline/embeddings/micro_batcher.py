@@ -0,0 +1,182 @@
+"""
+Query Embedding Micro-Batcher
+
+This module coalesces concurrent single-query embedding requests into one
+encoder call. Under chat concurrency each Gradio session would otherwise run
+its own one-text forward pass, and N parallel passes fight over the same CPU
+threads; collecting requests for a few milliseconds and encoding them together
+costs one small delay instead.
+
+Features:
+- Collection window bounded by `max_wait_ms` and `max_batch_size`
+- One future per caller; errors are delivered to every caller in the batch
+- Duplicate texts within a batch are encoded once
+- Batch-size and queue-wait histograms for the status endpoint
+- Drop-in `QueryEmbeddingModel` (document embedding passes straight through)
+
+Usage:
+    batcher = QueryMicroBatcher(SentenceTransformerEmbeddings(), max_wait_ms=5)
+    vector = batcher.embed_query_array('what is rag?')
+    future = batcher.submit('another question')
+    print(batcher.stats())
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..metrics import LATENCY_MS_BUCKETS, SIZE_BUCKETS, Histogram
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WAIT_MS = 5.0
+DEFAULT_MAX_BATCH_SIZE = 32
+
+_Request = Tuple[str, Future, float]
+
+
+class QueryMicroBatcher:
+    """
+    Batch concurrent `embed_query` calls against a wrapped embedder.
+
+    Attributes:
+        embedder: Model exposing `embed_queries_array`, `embed_queries` or `embed_query`
+        max_wait_ms: How long the first request of a batch waits for company
+        max_batch_size: Upper bound on queries per encoder call
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        if max_wait_ms < 0 or max_batch_size <= 0:
+            raise ValueError("max_wait_ms must be >= 0 and max_batch_size positive")
+        self.embedder = embedder
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self.batch_sizes = Histogram(SIZE_BUCKETS)
+        self.wait_ms = Histogram(LATENCY_MS_BUCKETS)
+        self.encode_ms = Histogram(LATENCY_MS_BUCKETS)
+        self._requests: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    def __getattr__(self, name: str) -> Any:
+        # Document embedding, model info etc. go straight to the wrapped model.
+        if name == "embedder":
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="query-micro-batcher", daemon=True)
+                self._worker.start()
+
+    def submit(self, text: str) -> "Future[np.ndarray]":
+        """Queue one query and return a future resolving to its float32 vector."""
+
+        if self._closed:
+            raise RuntimeError("QueryMicroBatcher is closed")
+        if not text or not text.strip():
+            raise ValueError("Query text cannot be empty")
+        future: "Future[np.ndarray]" = Future()
+        self._ensure_worker()
+        self._requests.put((text, future, time.perf_counter()))
+        return future
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        return self.submit(text).result()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_query_array(text).tolist()
+
+    def embed_queries_array(self, texts: List[str]) -> np.ndarray:
+        """Already a batch: encode directly without going through the window."""
+
+        return self._encode(list(texts))
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_queries_array(texts).tolist()
+
+    def close(self) -> None:
+        """Stop the worker after it drains requests already queued."""
+
+        self._closed = True
+        if self._worker is not None:
+            self._requests.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_wait_ms": self.max_wait_ms,
+            "max_batch_size": self.max_batch_size,
+            "batch_size": self.batch_sizes.stats(),
+            "wait_ms": self.wait_ms.stats(),
+            "encode_ms": self.encode_ms.stats(),
+        }
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        batch_embed = getattr(self.embedder, "embed_queries_array", None)
+        if callable(batch_embed):
+            return np.asarray(batch_embed(texts), dtype=np.float32)
+        batch_embed = getattr(self.embedder, "embed_queries", None)
+        if callable(batch_embed):
+            return np.asarray(batch_embed(texts), dtype=np.float32)
+        return np.asarray([self.embedder.embed_query(text) for text in texts], dtype=np.float32)
+
+    def _collect(self, first: _Request) -> Tuple[List[_Request], bool]:
+        """Gather requests arriving within the window opened by `first`."""
+
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch, stopping = self._collect(first)
+
+            started = time.perf_counter()
+            for _, _, submitted in batch:
+                self.wait_ms.observe((started - submitted) * 1000.0)
+            self.batch_sizes.observe(len(batch))
+
+            unique = list(dict.fromkeys(text for text, _, _ in batch))
+            try:
+                vectors = self._encode(unique)
+            except BaseException as exc:
+                logger.error(f"Micro-batched query embedding failed for {len(batch)} queries: {exc}")
+                for _, future, _ in batch:
+                    future.set_exception(exc)
+                continue
+            self.encode_ms.observe((time.perf_counter() - started) * 1000.0)
+
+            rows = {text: row for text, row in zip(unique, vectors)}
+            for text, future, _ in batch:
+                future.set_result(rows[text])
@@ -0,0 +1,386 @@
+"""
+ONNX Runtime Embedding Backend
+
+This module runs sentence-transformer models through ONNX Runtime instead of
+PyTorch. The transformer is exported once (optionally with dynamic int8
+weight quantization) and then served with only `onnxruntime` and `tokenizers`
+loaded, which cuts cold start, resident memory and per-query latency on
+CPU-only hosts such as Lambda while keeping the `embed_documents` /
+`embed_query` interface of `SentenceTransformerEmbeddings`.
+
+Features:
+- One-off export of the transformer encoder to ONNX (dynamic batch/sequence axes)
+- Optional dynamic int8 quantization of the exported weights
+- Pooling and normalization settings captured from the source model
+- Length-bucketed batching with per-batch padding
+- Parity check against the PyTorch vectors (cosine similarity threshold)
+- Same caching, model info and health-check surface as the PyTorch backend
+
+Usage:
+    # Export once (needs torch + sentence-transformers), then serve without them
+    export_onnx_model('all-MiniLM-L6-v2', '.cache/onnx/all-MiniLM-L6-v2', quantize=True)
+    embedder = OnnxEmbeddings('all-MiniLM-L6-v2', onnx_dir='.cache/onnx')
+    vectors = embedder.embed_documents(['doc1', 'doc2'])
+
+    # Verify the exported model still matches PyTorch
+    report = check_parity(embedder, SentenceTransformerEmbeddings('all-MiniLM-L6-v2'), texts)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .batching import BatchingStats, length_bucketed_batches
+from .cache import EmbeddingCache
+from .sentence_transformer import SentenceTransformerEmbeddings
+
+try:
+    import onnxruntime as ort
+except ImportError:  # pragma: no cover - optional dependency
+    ort = None  # type: ignore[assignment]
+
+try:
+    from tokenizers import Tokenizer
+except ImportError:  # pragma: no cover - optional dependency
+    Tokenizer = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONNX_DIR = ".cache/onnx"
+CONFIG_FILENAME = "embedding_config.json"
+FP32_FILENAME = "model.onnx"
+INT8_FILENAME = "model_int8.onnx"
+PARITY_THRESHOLD = 0.99
+POOLING_MODES = ("mean", "cls", "max")
+
+
+def model_slug(model_name: str) -> str:
+    """Filesystem-safe directory name for a model identifier."""
+
+    return re.sub(r"[^A-Za-z0-9_.-]+", "__", model_name)
+
+
+def pool_embeddings(
+    hidden: np.ndarray,
+    attention_mask: np.ndarray,
+    mode: str = "mean",
+    normalize: bool = True,
+) -> np.ndarray:
+    """Reduce token states (batch, seq, dim) to sentence vectors (batch, dim)."""
+
+    mask = attention_mask[..., None].astype(np.float32)
+    if mode == "mean":
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+    elif mode == "cls":
+        pooled = hidden[:, 0]
+    elif mode == "max":
+        pooled = np.where(mask > 0, hidden, -1e9).max(axis=1)
+    else:
+        raise ValueError(f"Unknown pooling mode '{mode}'. Expected one of {POOLING_MODES}.")
+    pooled = pooled.astype(np.float32, copy=False)
+    if normalize:
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        pooled = pooled / np.clip(norms, 1e-12, None)
+    return pooled
+
+
+def export_onnx_model(
+    model_name: str,
+    output_dir: str | os.PathLike[str],
+    quantize: bool = True,
+    opset: int = 14,
+) -> Path:
+    """Export a sentence-transformer's encoder to ONNX and return its directory.
+
+    Requires torch, sentence-transformers and (for `quantize`) onnxruntime at
+    export time only. Writes `model.onnx`, optionally `model_int8.onnx`, the
+    fast tokenizer and an `embedding_config.json` describing pooling.
+    """
+
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+    except ImportError as exc:
+        raise ImportError(
+            "Exporting to ONNX requires torch and sentence-transformers. "
+            "Install with: pip install sentence-transformers"
+        ) from exc
+
+    output = Path(output_dir).expanduser()
+    output.mkdir(parents=True, exist_ok=True)
+    model = SentenceTransformer(model_name, device="cpu")
+    transformer = model[0].auto_model.eval()
+    tokenizer = model.tokenizer
+
+    sample = tokenizer(["ONNX export sample"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    fp32_path = output / FP32_FILENAME
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+
+    if quantize:
+        if ort is None:
+            raise ImportError("onnxruntime is required for int8 quantization. Install with: pip install onnxruntime")
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(str(fp32_path), str(output / INT8_FILENAME), weight_type=QuantType.QInt8)
+
+    pooling = "mean"
+    normalize = False
+    for module in model:
+        if type(module).__name__ == "Pooling":
+            config = module.get_config_dict()
+            if config.get("pooling_mode_cls_token"):
+                pooling = "cls"
+            elif config.get("pooling_mode_max_tokens"):
+                pooling = "max"
+        elif type(module).__name__ == "Normalize":
+            normalize = True
+
+    tokenizer.save_pretrained(str(output))
+    config = {
+        "model_name": model_name,
+        "pooling": pooling,
+        "normalize": normalize,
+        "max_seq_length": int(model.max_seq_length),
+        "dimension": int(model.get_sentence_embedding_dimension()),
+        "inputs": input_names,
+        "quantized": quantize,
+        "opset": opset,
+    }
+    (output / CONFIG_FILENAME).write_text(json.dumps(config, indent=2), encoding="utf-8")
+    logger.info(f"Exported {model_name} to ONNX at {output} (int8={quantize})")
+    return output
+
+
+@dataclass
+class OnnxEmbeddings(SentenceTransformerEmbeddings):
+    """ONNX Runtime drop-in for `SentenceTransformerEmbeddings` (CPU only)."""
+
+    onnx_dir: Optional[str] = None  # parent directory of exported models
+    quantize: bool = True  # serve model_int8.onnx instead of model.onnx
+    num_threads: Optional[int] = None  # ONNX Runtime intra-op threads
+    auto_export: bool = False  # export on first use (unchecked) when no model is found
+    _session: Any = None
+    _tokenizer: Any = None
+    _config: Dict[str, Any] | None = None
+
+    def __post_init__(self):
+        """Skip torch device probing; ONNX Runtime runs on the CPU provider."""
+        self.device = "cpu"
+        self._device_info = {
+            'backend': 'onnxruntime',
+            'onnxruntime_available': ort is not None,
+            'recommended_device': 'cpu',
+        }
+
+        if self.cache_dir and self._cache is None:
+            self._cache = EmbeddingCache(self.cache_dir, f"{self.model_name}:onnx{'-int8' if self.quantize else ''}")
+
+        if self._batching is None:
+            self._batching = BatchingStats()
+
+        logger.info(
+            f"Initialized OnnxEmbeddings: model={self.model_name}, int8={self.quantize}, "
+            f"model_dir={self.model_dir}"
+        )
+
+    @property
+    def model_dir(self) -> Path:
+        return Path(self.onnx_dir or DEFAULT_ONNX_DIR).expanduser() / model_slug(self.model_name)
+
+    @property
+    def model_path(self) -> Path:
+        return self.model_dir / (INT8_FILENAME if self.quantize else FP32_FILENAME)
+
+    def _ensure_model(self) -> Any:
+        """Load (exporting first if needed) the ONNX session and tokenizer."""
+        if ort is None or Tokenizer is None:
+            logger.error("onnxruntime / tokenizers are not installed")
+            raise ImportError(
+                "onnxruntime and tokenizers must be installed to use the ONNX embedding backend. "
+                "Install with: pip install onnxruntime tokenizers"
+            )
+
+        if self._session is None:
+            if not self.model_path.exists() or not (self.model_dir / CONFIG_FILENAME).exists():
+                if not self.auto_export:
+                    raise RuntimeError(
+                        f"No exported ONNX model at {self.model_path}. Export it and check parity "
+                        f"against PyTorch first: python scripts/optimization/export_onnx_embeddings.py "
+                        f"--model {self.model_name} --output-dir {self.model_dir.parent}"
+                        f"{'' if self.quantize else ' --no-quantize'}"
+                    )
+                logger.warning(f"Exporting {self.model_name} to ONNX without a parity check")
+                export_onnx_model(self.model_name, self.model_dir, quantize=self.quantize)
+
+            self._config = json.loads((self.model_dir / CONFIG_FILENAME).read_text(encoding="utf-8"))
+            tokenizer = Tokenizer.from_file(str(self.model_dir / "tokenizer.json"))
+            tokenizer.enable_truncation(max_length=int(self._config.get("max_seq_length", 256)))
+            tokenizer.no_padding()
+            self._tokenizer = tokenizer
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if self.num_threads:
+                options.intra_op_num_threads = self.num_threads
+            self._session = ort.InferenceSession(
+                str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+            )
+            logger.info(f"Loaded ONNX model {self.model_path}")
+
+        return self._session
+
+    def _run(self, encodings: Sequence[Any]) -> np.ndarray:
+        """Pad one batch of tokenizer encodings, run the session and pool."""
+
+        width = max(len(encoding.ids) for encoding in encodings)
+        feeds: Dict[str, np.ndarray] = {}
+        for name, attribute in (
+            ("input_ids", "ids"),
+            ("attention_mask", "attention_mask"),
+            ("token_type_ids", "type_ids"),
+        ):
+            if name not in self._config.get("inputs", ()):
+                continue
+            matrix = np.zeros((len(encodings), width), dtype=np.int64)
+            for row, encoding in enumerate(encodings):
+                values = getattr(encoding, attribute)
+                matrix[row, : len(values)] = values
+            feeds[name] = matrix
+
+        mask = feeds.get("attention_mask")
+        if mask is None:
+            mask = np.zeros((len(encodings), width), dtype=np.int64)
+            for row, encoding in enumerate(encodings):
+                mask[row, : len(encoding.ids)] = 1
+
+        hidden = self._session.run(["last_hidden_state"], feeds)[0]
+        return pool_embeddings(
+            hidden,
+            mask,
+            mode=self._config.get("pooling", "mean"),
+            normalize=bool(self._config.get("normalize", False)),
+        )
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        self._ensure_model()
+        encodings = self._tokenizer.encode_batch(list(texts))
+        lengths = np.asarray([max(1, len(encoding.ids)) for encoding in encodings], dtype=np.int64)
+        batches = length_bucketed_batches(lengths, self.max_batch_tokens, self.max_batch_size)
+        self._batching.record(lengths, batches)
+
+        vectors: Optional[np.ndarray] = None
+        for batch in batches:
+            pooled = self._run([encodings[idx] for idx in batch])
+            if vectors is None:
+                vectors = np.empty((len(texts), pooled.shape[1]), dtype=np.float32)
+            vectors[batch] = pooled
+        return vectors
+
+    def _encode_documents(self, texts: List[str]) -> np.ndarray:
+        logger.debug(f"Embedding {len(texts)} documents with ONNX model {self.model_name}")
+        return self._encode(texts)
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        """Return a query embedding as a 1-D float32 array."""
+        if not text or not text.strip():
+            logger.warning("embed_query called with empty or whitespace-only text")
+            raise ValueError("Query text cannot be empty")
+        try:
+            return self._encode([text])[0]
+        except Exception as e:
+            logger.error(f"Failed to embed query: {e}")
+            raise RuntimeError(f"Query embedding failed: {e}")
+
+    def embed_queries_array(self, texts: List[str]) -> np.ndarray:
+        """Return query embeddings for several questions as one float32 matrix."""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        if any(not text or not text.strip() for text in texts):
+            logger.warning("embed_queries called with empty or whitespace-only text")
+            raise ValueError("Query text cannot be empty")
+        try:
+            return self._encode(list(texts))
+        except Exception as e:
+            logger.error(f"Failed to embed queries: {e}")
+            raise RuntimeError(f"Query embedding failed: {e}")
+
+    def get_model_info(self) -> Dict[str, Any]:
+        info = super().get_model_info()
+        info.update(
+            {
+                'backend': 'onnxruntime',
+                'model_loaded': self._session is not None,
+                'model_path': str(self.model_path),
+                'quantized': self.quantize,
+            }
+        )
+        if self._config:
+            info['embedding_dimension'] = self._config.get('dimension')
+            info['max_sequence_length'] = self._config.get('max_seq_length')
+            info['pooling'] = self._config.get('pooling')
+        return info
+
+    def clear_cache(self):
+        """Drop the ONNX session for memory management."""
+        self._session = None
+        self._tokenizer = None
+
+    def __repr__(self) -> str:
+        return (
+            f"OnnxEmbeddings(model={self.model_name}, int8={self.quantize}, "
+            f"loaded={self._session is not None})"
+        )
+
+
+def check_parity(
+    candidate: Any,
+    reference: Any,
+    texts: Sequence[str],
+    threshold: float = PARITY_THRESHOLD,
+) -> Dict[str, Any]:
+    """Compare two embedders text-by-text by cosine similarity.
+
+    Returns min / mean cosine and whether every text reached `threshold`.
+    """
+
+    def matrix(embedder: Any) -> np.ndarray:
+        embed_array = getattr(embedder, "embed_documents_array", None)
+        if callable(embed_array):
+            return np.asarray(embed_array(list(texts)), dtype=np.float32)
+        return np.asarray(embedder.embed_documents(list(texts)), dtype=np.float32)
+
+    left, right = matrix(candidate), matrix(reference)
+    if left.shape != right.shape:
+        raise ValueError(f"Embedding shapes differ: {left.shape} vs {right.shape}")
+    norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+    cosines = (left * right).sum(axis=1) / np.clip(norms, 1e-12, None)
+    worst = int(np.argmin(cosines))
+    return {
+        "texts": len(texts),
+        "threshold": threshold,
+        "min_cosine": round(float(cosines.min()), 6),
+        "mean_cosine": round(float(cosines.mean()), 6),
+        "worst_text": texts[worst][:80],
+        "passed": bool(cosines.min() >= threshold),
+    }
@@ -0,0 +1,229 @@
+"""
+Multi-Process Embedding Pool
+
+This module spreads document embedding across several worker processes, each
+holding its own model copy and pinned to a disjoint slice of CPU cores with a
+matching intra-op thread count. One PyTorch / ONNX Runtime process stops
+scaling well past a handful of threads; several pinned processes that each own
+a few cores keep scaling with the core count during large backfills.
+
+Features:
+- N spawned workers, each pinned (sched_setaffinity) to its own core slice
+- Per-worker thread limits (OMP / MKL / torch / ONNX Runtime) matching the slice
+- Length-sorted, token-balanced sharding across workers, results reassembled in input order
+- Works with either embedding backend (`torch` or `onnx`)
+- Optional parent-side persistent embedding cache
+- Same `embed_documents` / `embed_query` interface as the single-process models
+
+Usage:
+    with EmbeddingProcessPool('all-MiniLM-L6-v2', workers=4) as pool:
+        vectors = pool.embed_documents_array(texts)   # (len(texts), dim) float32
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .backends import build_embedder, cache_namespace
+from .batching import estimate_tokens
+from .cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_SHARD_SIZE = 8
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "ONNX_NUM_THREADS")
+
+# Set once per worker process by `_init_worker`.
+_WORKER_EMBEDDER: Any = None
+
+
+def available_cores() -> List[int]:
+    """CPU ids this process may run on."""
+
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def core_slices(workers: int, cores: Optional[Sequence[int]] = None) -> List[List[int]]:
+    """Split `cores` into `workers` contiguous, near-equal slices.
+
+    With more workers than cores, workers share cores round-robin.
+    """
+
+    cores = list(cores if cores is not None else available_cores())
+    if workers <= len(cores):
+        return [list(map(int, part)) for part in np.array_split(cores, workers)]
+    return [[cores[index % len(cores)]] for index in range(workers)]
+
+
+def _init_worker(
+    backend: Optional[str],
+    model_name: str,
+    slices: "multiprocessing.Queue[List[int]]",
+    factory: Optional[Callable[[], Any]],
+) -> None:
+    """Pin this worker to its core slice, cap its threads and load the model."""
+
+    global _WORKER_EMBEDDER
+    cores = slices.get()
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, cores)
+        except OSError as exc:  # pragma: no cover - containers may forbid pinning
+            logger.warning(f"Could not pin embedding worker {os.getpid()} to cores {cores}: {exc}")
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(len(cores))
+    try:
+        import torch
+
+        torch.set_num_threads(len(cores))
+    except ImportError:
+        pass
+
+    _WORKER_EMBEDDER = factory() if factory is not None else build_embedder(backend, model_name)
+    logger.info(f"Embedding worker {os.getpid()} ready on cores {cores}")
+
+
+def _embed_shard(texts: List[str]) -> np.ndarray:
+    embed_array = getattr(_WORKER_EMBEDDER, "embed_documents_array", None)
+    if callable(embed_array):
+        return np.asarray(embed_array(texts), dtype=np.float32)
+    return np.asarray(_WORKER_EMBEDDER.embed_documents(texts), dtype=np.float32)
+
+
+def _embed_query(text: str) -> np.ndarray:
+    embed_array = getattr(_WORKER_EMBEDDER, "embed_query_array", None)
+    if callable(embed_array):
+        return np.asarray(embed_array(text), dtype=np.float32)
+    return np.asarray(_WORKER_EMBEDDER.embed_query(text), dtype=np.float32)
+
+
+class EmbeddingProcessPool:
+    """
+    Shard document embedding across core-pinned worker processes.
+
+    Attributes:
+        model_name: Model loaded by every worker
+        backend: Embedding backend name passed to `build_embedder`
+        workers: Worker processes (defaults to one per two available cores)
+        min_shard_size: Smallest shard worth a round-trip to a worker
+        cache_dir: Optional persistent embedding cache, consulted in the parent
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        backend: Optional[str] = None,
+        workers: Optional[int] = None,
+        min_shard_size: int = DEFAULT_MIN_SHARD_SIZE,
+        cache_dir: Optional[str] = None,
+        embedder_factory: Optional[Callable[[], Any]] = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        cores = available_cores()
+        self.model_name = model_name
+        self.backend = backend
+        self.workers = workers or max(1, len(cores) // 2)
+        self.min_shard_size = max(1, min_shard_size)
+        self.slices = core_slices(self.workers, cores)
+        self._cache = EmbeddingCache(cache_dir, cache_namespace(backend, model_name)) if cache_dir else None
+
+        context = multiprocessing.get_context(mp_context)
+        slice_queue = context.Queue()
+        for cores_for_worker in self.slices:
+            slice_queue.put(cores_for_worker)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(backend, model_name, slice_queue, embedder_factory),
+        )
+        logger.info(f"Started embedding pool: {self.workers} workers on core slices {self.slices}")
+
+    def __enter__(self) -> "EmbeddingProcessPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _shards(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """Length-sorted index shards, one per worker, with similar token totals.
+
+        Texts are dealt round-robin from the length-sorted order, so every
+        shard stays sorted (tight padding in its batches) and gets its share of
+        the long texts instead of the last worker receiving all of them.
+        """
+
+        order = np.argsort([estimate_tokens(text) for text in texts], kind="stable")
+        count = max(1, min(self.workers, len(texts) // self.min_shard_size))
+        return [shard for shard in (order[start::count] for start in range(count)) if shard.size]
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        shards = self._shards(texts)
+        futures: List[Future] = [
+            self._executor.submit(_embed_shard, [texts[idx] for idx in shard]) for shard in shards
+        ]
+        vectors: Optional[np.ndarray] = None
+        for shard, future in zip(shards, futures):
+            encoded = future.result()
+            if vectors is None:
+                vectors = np.empty((len(texts), encoded.shape[1]), dtype=np.float32)
+            vectors[shard] = encoded
+        return vectors
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Return document embeddings as one float32 matrix, in input order."""
+
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        if self._cache is None:
+            return self._encode(list(texts))
+
+        cached = self._cache.get_many(texts)
+        missing: Dict[str, List[int]] = {}
+        for idx, vector in enumerate(cached):
+            if vector is None:
+                missing.setdefault(texts[idx], []).append(idx)
+        if missing:
+            pending = list(missing)
+            encoded = self._encode(pending)
+            self._cache.put_many(pending, encoded)
+            for text, vector in zip(pending, encoded):
+                for idx in missing[text]:
+                    cached[idx] = vector
+        return np.stack(cached)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents_array(texts).tolist()
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        if not text or not text.strip():
+            raise ValueError("Query text cannot be empty")
+        return self._executor.submit(_embed_query, text).result()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_query_array(text).tolist()
+
+    def get_model_info(self) -> Dict[str, Any]:
+        info: Dict[str, Any] = {
+            'model_name': self.model_name,
+            'backend': self.backend or 'torch',
+            'workers': self.workers,
+            'core_slices': self.slices,
+        }
+        if self._cache is not None:
+            info['embedding_cache'] = self._cache.stats()
+        return info
+
+    def __repr__(self) -> str:
+        return f"EmbeddingProcessPool(model={self.model_name}, workers={self.workers})"
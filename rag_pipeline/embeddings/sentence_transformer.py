@@ -7,10 +7,12 @@ optimized batch processing, comprehensive debugging, and error handling.
 
 Features:
 - Multiple sentence transformer model support
-- Batch processing optimization
+- Length-bucketed batching under a padded-token budget (order restored on output)
 - GPU/CPU/MPS automatic device selection with fallback
 - Model caching and reuse
+- Optional persistent, content-addressed embedding cache
 - Consistent vector normalization
+- Zero-copy float32 ndarray outputs (`*_array` methods)
 - Graceful fallback for missing dependencies
 - Memory-efficient processing
 - Thread-safe operations
@@ -26,9 +28,19 @@ Usage:
     # Generate document embeddings with debugging
     doc_vectors = embedder.embed_documents(['doc1', 'doc2'])
 
+    # Reuse vectors across re-ingestion runs via an on-disk cache
+    embedder = SentenceTransformerEmbeddings('all-MiniLM-L6-v2', cache_dir='.cache/embeddings')
+
     # Generate query embeddings with validation
     query_vector = embedder.embed_query('search query')
 
+    # Embed many evaluation queries in a single forward batch
+    query_vectors = embedder.embed_queries(['query one', 'query two'])
+
+    # Keep vectors as float32 ndarrays end-to-end (serialized once at the JSON boundary)
+    matrix = embedder.embed_documents_array(['doc1', 'doc2'])  # shape (2, dim)
+    query_array = embedder.embed_query_array('search query')
+
     # Get model info for debugging
     info = embedder.get_model_info()
 """
@@ -40,23 +52,50 @@ import time
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:  # pragma: no cover - handled during runtime
-    SentenceTransformer = None  # type: ignore[assignment]
+import numpy as np
+
+from .batching import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_BATCH_TOKENS,
+    BatchingStats,
+    length_bucketed_batches,
+    token_lengths,
+)
+from .cache import EmbeddingCache
+
+# Resolved on first model load so importing this module (e.g. for the ONNX
+# backend, which subclasses the wrapper) does not pull in torch.
+SentenceTransformer = None
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
 
+def _sentence_transformer_class():
+    """Import sentence-transformers lazily; return None when it is missing."""
+    global SentenceTransformer
+    if SentenceTransformer is None:
+        try:
+            from sentence_transformers import SentenceTransformer as model_class
+        except ImportError:  # pragma: no cover - handled during runtime
+            return None
+        SentenceTransformer = model_class
+    return SentenceTransformer
+
+
 @dataclass
 class SentenceTransformerEmbeddings:
     """Wraps a sentence-transformer model for document + query embeddings."""
 
     model_name: str = "all-MiniLM-L6-v2"
     device: str = "auto"  # auto, cpu, cuda, mps
+    cache_dir: Optional[str] = None  # enables the persistent embedding cache
+    max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS  # padded tokens per encoder batch
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
     _model: SentenceTransformer | None = None
     _device_info: Dict[str, Any] | None = None
+    _cache: EmbeddingCache | None = None
+    _batching: BatchingStats | None = None
 
     def __post_init__(self):
         """Initialize device selection and logging."""
@@ -65,6 +104,12 @@ class SentenceTransformerEmbeddings:
         if self.device == "auto":
             self.device = self._device_info['recommended_device']
 
+        if self.cache_dir and self._cache is None:
+            self._cache = EmbeddingCache(self.cache_dir, self.model_name)
+
+        if self._batching is None:
+            self._batching = BatchingStats()
+
         logger.info(
             f"Initialized SentenceTransformerEmbeddings: model={self.model_name}, "
             f"device={self.device}, cuda_available={self._device_info['cuda_available']}, "
@@ -102,7 +147,8 @@ class SentenceTransformerEmbeddings:
 
     def _ensure_model(self) -> SentenceTransformer:
         """Lazy-load the transformer so import time stays light."""
-        if SentenceTransformer is None:
+        model_class = _sentence_transformer_class()
+        if model_class is None:
             logger.error("sentence-transformers library is not installed")
             raise ImportError(
                 "sentence-transformers must be installed to use embedding features. "
@@ -112,7 +158,7 @@ class SentenceTransformerEmbeddings:
         if self._model is None:
             try:
                 logger.info(f"Loading sentence transformer model: {self.model_name}")
-                self._model = SentenceTransformer(self.model_name, device=self.device)
+                self._model = model_class(self.model_name, device=self.device)
                 logger.info(f"Successfully loaded model: {self.model_name} on device: {self.device}")
 
                 # Log model information
@@ -126,7 +172,7 @@ class SentenceTransformerEmbeddings:
                 if self.device != "cpu":
                     logger.warning(f"Falling back to CPU device")
                     try:
-                        self._model = SentenceTransformer(self.model_name, device="cpu")
+                        self._model = model_class(self.model_name, device="cpu")
                         self.device = "cpu"
                         logger.info(f"Successfully loaded model on CPU fallback")
                     except Exception as fallback_e:
@@ -137,34 +183,83 @@ class SentenceTransformerEmbeddings:
 
         return self._model
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Return embeddings for multiple documents."""
+    def _encode_documents(self, texts: List[str]) -> np.ndarray:
+        """Run the transformer over `texts` and return a float32 matrix.
+
+        Texts are encoded in length-sorted batches sized by `max_batch_tokens`
+        so short and long chunks are not padded together; rows come back in
+        input order.
+        """
+
+        model = self._ensure_model()
+        max_length = getattr(model, "max_seq_length", None)
+        lengths = token_lengths(texts, getattr(model, "tokenizer", None), max_length=max_length)
+        batches = length_bucketed_batches(lengths, self.max_batch_tokens, self.max_batch_size)
+        self._batching.record(lengths, batches)
+        logger.debug(f"Embedding {len(texts)} documents with model {self.model_name} in {len(batches)} batches")
+
+        vectors: Optional[np.ndarray] = None
+        for batch in batches:
+            encoded = np.asarray(
+                model.encode(
+                    [texts[idx] for idx in batch],
+                    batch_size=len(batch),
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                ),
+                dtype=np.float32,
+            )
+            if vectors is None:
+                vectors = np.empty((len(texts), encoded.shape[1]), dtype=np.float32)
+            vectors[batch] = encoded
+        return vectors
+
+    def _embed_documents_cached(self, texts: List[str]) -> np.ndarray:
+        """Serve cached vectors and only encode the texts the cache has not seen."""
+
+        cached = self._cache.get_many(texts)
+        missing: Dict[str, List[int]] = {}
+        for idx, vector in enumerate(cached):
+            if vector is None:
+                missing.setdefault(texts[idx], []).append(idx)
+
+        if missing:
+            pending = list(missing)
+            encoded = self._encode_documents(pending)
+            self._cache.put_many(pending, encoded)
+            for text, vector in zip(pending, encoded):
+                for idx in missing[text]:
+                    cached[idx] = vector
+
+        logger.debug(f"Embedding cache: {len(texts)} documents, {len(missing)} unique texts encoded")
+        return np.stack(cached)
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Return document embeddings as one float32 matrix of shape (len(texts), dim)."""
         if not texts:
             logger.warning("embed_documents called with empty text list")
-            return []
+            return np.empty((0, 0), dtype=np.float32)
 
         try:
-            model = self._ensure_model()
-            logger.debug(f"Embedding {len(texts)} documents with model {self.model_name}")
-
-            vectors = model.encode(
-                texts,
-                batch_size=16,
-                show_progress_bar=False,
-                convert_to_numpy=True,
-            )
+            if self._cache is not None:
+                vectors = self._embed_documents_cached(texts)
+            else:
+                vectors = self._encode_documents(texts)
 
-            result = vectors.tolist()
-            logger.debug(f"Successfully generated embeddings: {len(result)} vectors of dimension {len(result[0]) if result else 0}")
-            return result
+            logger.debug(f"Successfully generated embeddings: {vectors.shape[0]} vectors of dimension {vectors.shape[1]}")
+            return vectors
 
         except Exception as e:
             logger.error(f"Failed to embed documents: {e}")
             logger.error(f"Input texts sample: {[t[:50] + '...' if len(t) > 50 else t for t in texts[:3]]}...")
             raise RuntimeError(f"Document embedding failed: {e}")
 
-    def embed_query(self, text: str) -> List[float]:
-        """Return an embedding suitable for hybrid search queries."""
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for multiple documents."""
+        return self.embed_documents_array(texts).tolist()
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        """Return a query embedding as a 1-D float32 array."""
         if not text or not text.strip():
             logger.warning("embed_query called with empty or whitespace-only text")
             raise ValueError("Query text cannot be empty")
@@ -179,8 +274,8 @@ class SentenceTransformerEmbeddings:
                 convert_to_numpy=True,
             )
 
-            result = vector.tolist()
-            logger.debug(f"Successfully generated query embedding: dimension {len(result)}")
+            result = np.asarray(vector, dtype=np.float32)
+            logger.debug(f"Successfully generated query embedding: dimension {result.shape[0]}")
             return result
 
         except Exception as e:
@@ -188,6 +283,38 @@ class SentenceTransformerEmbeddings:
             logger.error(f"Query text: {text[:100]}...")
             raise RuntimeError(f"Query embedding failed: {e}")
 
+    def embed_query(self, text: str) -> List[float]:
+        """Return an embedding suitable for hybrid search queries."""
+        return self.embed_query_array(text).tolist()
+
+    def embed_queries_array(self, texts: List[str]) -> np.ndarray:
+        """Return query embeddings for several questions as one float32 matrix."""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        if any(not text or not text.strip() for text in texts):
+            logger.warning("embed_queries called with empty or whitespace-only text")
+            raise ValueError("Query text cannot be empty")
+
+        try:
+            model = self._ensure_model()
+            logger.debug(f"Embedding {len(texts)} queries with model {self.model_name}")
+
+            vectors = model.encode(
+                texts,
+                batch_size=max(len(texts), 1),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+            return np.asarray(vectors, dtype=np.float32)
+
+        except Exception as e:
+            logger.error(f"Failed to embed queries: {e}")
+            raise RuntimeError(f"Query embedding failed: {e}")
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Return query embeddings for several questions in one encode batch."""
+        return self.embed_queries_array(texts).tolist()
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get comprehensive model information for debugging.
@@ -205,6 +332,12 @@ class SentenceTransformerEmbeddings:
         if self._device_info:
             info.update(self._device_info)
 
+        if self._cache is not None:
+            info['embedding_cache'] = self._cache.stats()
+
+        if self._batching is not None:
+            info['batching'] = self._batching.as_dict()
+
         if self._model is not None:
             try:
                 if hasattr(self._model, 'get_sentence_embedding_dimension'):
@@ -9,10 +9,13 @@ Features:
 - Dual-mode indexing (BM25 + vector embeddings)
 - Embedding model integration
 - Bulk document processing
+- Streaming chunk → embedding batch → bulk action pipeline
+- Float32 ndarray rows carried to the bulk serializer without list conversion
 - Index management (add/clear operations)
 - Document chunk optimization
-- Memory-efficient batch processing
+- Memory-efficient batch processing (peak memory bounded by batch size)
 - Error handling and recovery
+- Deterministic chunk IDs (source fingerprint + page + offset) for idempotent upserts
 - Protocol-based embedding interface
 
 Architecture:
@@ -30,11 +33,20 @@ Usage:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Protocol
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, Sequence, TypeVar
+
+import numpy as np
 
 from .opensearch_client import bulk_index_documents, clear_index_documents
+from ..ingestion.manifest import path_fingerprint
 from ..ingestion.pdf_ocr_pipeline import DocumentChunk
 
+T = TypeVar("T")
+
+DEFAULT_EMBED_BATCH_SIZE = 32
+DEFAULT_BULK_CHUNK_SIZE = 128
+
 
 class EmbeddingModel(Protocol):
     """Protocol describing the minimal surface we expect from embed models."""
@@ -51,14 +63,50 @@ class IndexedDocument:
     body: dict
 
 
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most `batch_size` items."""
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def chunk_document_id(chunk: DocumentChunk) -> str:
+    """Return a stable, collision-free index document ID for a chunk.
+
+    The ID combines the source fingerprint (the chunk's `source_id`, or a hash
+    of its resolved path), the page number and the chunk's token offset on
+    that page, so re-sending a chunk overwrites exactly the same document.
+    """
+
+    source = chunk.source_id or path_fingerprint(chunk.source_path)
+    page = chunk.page_numbers[0] if chunk.page_numbers else 0
+    return f"{source[:24]}-p{page}-t{chunk.offset}"
+
+
+def chunk_document_ids(chunks: Sequence[DocumentChunk]) -> List[str]:
+    """Document IDs for every chunk of one source, in order."""
+
+    return [chunk_document_id(chunk) for chunk in chunks]
+
+
 def prepare_documents(
-    chunks: Iterable[DocumentChunk], embeddings: Iterable[List[float]]
+    chunks: Iterable[DocumentChunk],
+    embeddings: Iterable[Sequence[float] | np.ndarray],
+    ids: Optional[Sequence[str]] = None,
 ) -> List[IndexedDocument]:
-    """Pair chunk text with embedding vectors and metadata for indexing."""
+    """Pair chunk text with embedding vectors and metadata for indexing.
+
+    Rows of an embedding matrix are stored as-is (views, not copies); the
+    client serializer turns them into JSON. Explicit `ids` override the
+    deterministic `chunk_document_id`.
+    """
 
     indexed_docs: List[IndexedDocument] = []
-    for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-        doc_id = f"{chunk.source_path.name}-{idx}"
+    for offset, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+        doc_id = ids[offset] if ids is not None else chunk_document_id(chunk)
         body = {
             "text": chunk.text,
             "embedding": embedding,
@@ -70,24 +118,61 @@ def prepare_documents(
     return indexed_docs
 
 
+def embed_texts(embedding_model: EmbeddingModel, texts: List[str]):
+    """Embed a batch of texts, preferring the model's float32-matrix API."""
+
+    embed_array = getattr(embedding_model, "embed_documents_array", None)
+    return embed_array(texts) if callable(embed_array) else embedding_model.embed_documents(texts)
+
+
+def iter_indexed_documents(
+    chunks: Iterable[DocumentChunk],
+    embedding_model: EmbeddingModel,
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    ids: Optional[Iterable[str]] = None,
+) -> Iterator[IndexedDocument]:
+    """Embed chunks in fixed-size batches and yield documents as they are ready.
+
+    Only one batch of vectors is alive at a time; the next batch is embedded
+    once the consumer (the bulk sender) has pulled the previous one. `ids`,
+    when given, supplies one document ID per chunk (e.g. a filtered subset).
+    """
+
+    id_iterator = iter(ids) if ids is not None else None
+    for batch in iter_batches(chunks, batch_size):
+        embeddings = embed_texts(embedding_model, [chunk.text for chunk in batch])
+        batch_ids = list(islice(id_iterator, len(batch))) if id_iterator is not None else None
+        yield from prepare_documents(batch, embeddings, ids=batch_ids)
+
+
 def index_chunks(
     client,
     index_name: str,
     chunks: Iterable[DocumentChunk],
     embedding_model: EmbeddingModel,
     clear_previous: bool = False,
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    bulk_chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ids: Optional[Iterable[str]] = None,
 ) -> None:
     """Embed the chunks and dispatch them to OpenSearch via the bulk API.
-    
+
+    Chunks flow through embedding and bulk requests as a generator, so peak
+    memory depends on `batch_size` / `bulk_chunk_size` rather than on the
+    size of the document.
+
     Args:
         clear_previous: If True, clear all previous documents from the index before adding new ones.
+        batch_size: Number of chunks embedded per model call.
+        bulk_chunk_size: Number of documents per bulk request.
+        ids: Optional document ID per chunk (defaults to `chunk_document_id`).
     """
     
     if clear_previous:
         clear_index_documents(client, index_name)
 
-    texts = [chunk.text for chunk in chunks]
-    embeddings = embedding_model.embed_documents(texts)
-    documents = prepare_documents(chunks, embeddings)
-    payload = ({"_id": doc.id, "_source": doc.body} for doc in documents)
-    bulk_index_documents(client=client, index_name=index_name, documents=payload)
+    documents = iter_indexed_documents(chunks, embedding_model, batch_size=batch_size, ids=ids)
+    payload: Iterator[Dict[str, Any]] = ({"_id": doc.id, "_source": doc.body} for doc in documents)
+    bulk_index_documents(
+        client=client, index_name=index_name, documents=payload, chunk_size=bulk_chunk_size
+    )
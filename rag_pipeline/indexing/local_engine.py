@@ -0,0 +1,733 @@
+"""
+Local In-Process Search Engine
+
+This module implements a small, dependency-light stand-in for the OpenSearch
+cluster that answers the same request and response shapes the retrieval and
+indexing code already uses, so single-node deployments, Lambda cold starts and
+offline benchmarks can run hybrid retrieval without a network round trip.
+
+Features:
+- `search` / `msearch` for `match`, `knn`, `match_all` and `hybrid` queries
+- BM25 (k1=1.2, b=0.75) over an in-memory inverted index
+- Exact cosine kNN on a NumPy matrix for small corpora
+- Optional HNSW graph (hnswlib) once an index grows past a threshold
+- Hybrid scoring with per-leg min-max normalization and weighted mean
+- Bulk upsert / delete, `delete_by_query` (match_all) and an `indices` facade
+- Persistence to a directory with memory-mapped float32 vectors
+- Incremental autosave: appends new rows and tombstones, compacting only
+  once dead rows outgrow `COMPACT_DEAD_FRACTION` of the files
+
+Storage Layout (one directory per index):
+- meta.json: vector field, dimension, row count and committed docs.jsonl size
+- vectors.f32: contiguous float32 rows, unit-normalized (zeros for dead rows)
+- docs.jsonl: one `{"_id", "_source"}` line per row (vector field stripped),
+  plus `{"_deleted_row": n}` tombstones appended by incremental saves
+
+Note:
+    Search hits carry `_source` without the vector field; nothing in the
+    retrieval path reads it and copying 384 floats per hit dominated latency.
+
+Usage:
+    engine = LocalSearchEngine(data_dir='./data/local_index')
+    engine.indices.create(index='docs', body=mapping)
+    engine.bulk_index('docs', [{"_id": "a-0", "_source": {...}}])
+    raw = engine.search(index='docs', body=retriever.build_query(query, vector))
+    engine.save('docs')
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - optional dependency
+    hnswlib = None  # type: ignore[assignment]
+
+DEFAULT_HNSW_THRESHOLD = 50_000
+# Documents upserted per lock acquisition in `bulk_index`.
+BULK_LOCK_BATCH = 256
+# Autosave rewrites the files once this share of their rows is dead.
+COMPACT_DEAD_FRACTION = 0.3
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, approximating OpenSearch's standard analyzer."""
+
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def min_max_normalize(scores: np.ndarray) -> np.ndarray:
+    """Scale scores into [0, 1]; a constant leg maps to all ones."""
+
+    if scores.size == 0:
+        return scores
+    low = float(scores.min())
+    span = float(scores.max()) - low
+    if span <= 0.0:
+        return np.ones_like(scores)
+    return (scores - low) / span
+
+
+@dataclass
+class _IndexState:
+    """Rows, vectors and postings for one local index."""
+
+    text_field: str = "text"
+    vector_field: str = "embedding"
+    mapping: Dict[str, Any] = field(default_factory=dict)
+    ids: List[Optional[str]] = field(default_factory=list)
+    sources: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    rows_by_id: Dict[str, int] = field(default_factory=dict)
+    vectors: Optional[np.ndarray] = None
+    has_vector: Optional[np.ndarray] = None
+    doc_lengths: Optional[np.ndarray] = None
+    postings: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    total_length: int = 0
+    hnsw: Any = None
+    hnsw_rows: int = 0
+    # What is already on disk: rows[:persisted_rows] match the files row for row.
+    persisted_rows: int = 0
+    persisted_dead: int = 0
+    persisted_dimension: int = 0
+    docs_bytes: int = 0
+    dead_since_save: List[int] = field(default_factory=list)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.ids)
+
+    @property
+    def live_count(self) -> int:
+        return len(self.rows_by_id)
+
+
+class _LocalIndices:
+    """Subset of the `client.indices` namespace used by the indexing helpers."""
+
+    def __init__(self, engine: "LocalSearchEngine") -> None:
+        self._engine = engine
+
+    def exists(self, index: str, **_: Any) -> bool:
+        return self._engine.has_index(index)
+
+    def create(self, index: str, body: Optional[Dict[str, Any]] = None, **_: Any) -> Dict[str, Any]:
+        self._engine.create_index(index, body or {})
+        return {"acknowledged": True, "index": index}
+
+    def delete(self, index: str, **_: Any) -> Dict[str, Any]:
+        self._engine.drop_index(index)
+        return {"acknowledged": True}
+
+    def get_mapping(self, index: str, **_: Any) -> Dict[str, Any]:
+        return {index: {"mappings": self._engine.mapping(index)}}
+
+    def refresh(self, index: Optional[str] = None, **_: Any) -> Dict[str, Any]:
+        return {"_shards": {"failed": 0}}
+
+
+class LocalSearchEngine:
+    """
+    In-process search backend speaking a subset of the OpenSearch API.
+
+    Each index keeps unit-normalized vectors in a growable NumPy matrix and
+    BM25 postings in a dict-of-dicts. Deleted and overwritten documents leave
+    tombstoned rows behind until the index is saved, which compacts them;
+    autosave only appends, and compacts once enough rows are dead.
+
+    Attributes:
+        data_dir: Directory holding persisted indexes (None keeps everything in memory)
+        hnsw_threshold: Live document count above which kNN uses an HNSW graph
+        hybrid_weights: Leg weights for `hybrid` queries (defaults to equal weights)
+        autosave: Append each write call's changes to disk (requires data_dir)
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[str | Path] = None,
+        hnsw_threshold: int = DEFAULT_HNSW_THRESHOLD,
+        hybrid_weights: Optional[Sequence[float]] = None,
+        hnsw_ef: int = 128,
+        autosave: bool = False,
+    ) -> None:
+        self.data_dir = Path(data_dir).expanduser() if data_dir else None
+        self.hnsw_threshold = hnsw_threshold
+        self.hybrid_weights = list(hybrid_weights) if hybrid_weights else None
+        self.hnsw_ef = hnsw_ef
+        self.autosave = autosave and data_dir is not None
+        self._indexes: Dict[str, _IndexState] = {}
+        self._lock = threading.RLock()
+        self.indices = _LocalIndices(self)
+
+    # ------------------------------------------------------------------ indices
+
+    def has_index(self, index: str) -> bool:
+        with self._lock:
+            if index in self._indexes:
+                return True
+            directory = self._index_dir(index)
+            return directory is not None and (directory / "meta.json").exists()
+
+    def create_index(self, index: str, mapping: Optional[Dict[str, Any]] = None) -> None:
+        """Create an empty index, taking the text/vector fields from the mapping."""
+
+        with self._lock:
+            if self.has_index(index):
+                raise ValueError(f"Index '{index}' already exists")
+            self._indexes[index] = self._new_state(mapping or {})
+
+    def drop_index(self, index: str) -> None:
+        with self._lock:
+            self._indexes.pop(index, None)
+            directory = self._index_dir(index)
+            if directory is not None and directory.exists():
+                for name in ("meta.json", "vectors.f32", "docs.jsonl"):
+                    (directory / name).unlink(missing_ok=True)
+
+    def mapping(self, index: str) -> Dict[str, Any]:
+        return self._state(index).mapping
+
+    def count(self, index: str, body: Optional[Dict[str, Any]] = None, **_: Any) -> Dict[str, Any]:
+        return {"count": self._state(index).live_count}
+
+    def _index_dir(self, index: str) -> Optional[Path]:
+        return self.data_dir / index if self.data_dir is not None else None
+
+    @staticmethod
+    def _new_state(mapping: Dict[str, Any]) -> _IndexState:
+        properties = mapping.get("mappings", {}).get("properties", {})
+        vector_field = next(
+            (name for name, spec in properties.items() if spec.get("type") == "knn_vector"),
+            "embedding",
+        )
+        text_field = next(
+            (name for name, spec in properties.items() if spec.get("type") == "text"),
+            "text",
+        )
+        return _IndexState(text_field=text_field, vector_field=vector_field, mapping=mapping.get("mappings", {}))
+
+    def _state(self, index: str) -> _IndexState:
+        state = self._indexes.get(index)
+        if state is None:
+            state = self._load(index)
+            if state is None:
+                raise KeyError(f"no such index [{index}]")
+            self._indexes[index] = state
+        return state
+
+    # ---------------------------------------------------------------- persistence
+
+    def save(self, index: str) -> Path:
+        """Write an index to `data_dir`, compacting tombstoned rows."""
+
+        if self.data_dir is None:
+            raise ValueError("LocalSearchEngine was created without a data_dir")
+
+        with self._lock:
+            state = self._state(index)
+            directory = self._index_dir(index)
+            directory.mkdir(parents=True, exist_ok=True)
+            live_rows = sorted(state.rows_by_id.values())
+            dimension = state.vectors.shape[1] if state.vectors is not None else 0
+
+            if dimension:
+                matrix = np.ascontiguousarray(state.vectors[live_rows], dtype=np.float32)
+                missing = ~state.has_vector[live_rows]
+                matrix[missing] = 0.0
+                tmp = directory / "vectors.f32.tmp"
+                matrix.tofile(tmp)
+                tmp.replace(directory / "vectors.f32")
+
+            tmp = directory / "docs.jsonl.tmp"
+            with tmp.open("w", encoding="utf-8") as handle:
+                for row in live_rows:
+                    handle.write(json.dumps({"_id": state.ids[row], "_source": state.sources[row]}))
+                    handle.write("\n")
+            tmp.replace(directory / "docs.jsonl")
+            docs_bytes = (directory / "docs.jsonl").stat().st_size
+            self._write_meta(directory, state, dimension, len(live_rows), docs_bytes)
+
+            if len(live_rows) != state.row_count:
+                # Reload so row numbers match the compacted layout on disk.
+                self._indexes[index] = self._load(index)
+            else:
+                self._mark_persisted(state, dimension, 0, docs_bytes)
+        return directory
+
+    @staticmethod
+    def _write_meta(directory: Path, state: _IndexState, dimension: int, count: int, docs_bytes: int) -> None:
+        meta = {
+            "text_field": state.text_field,
+            "vector_field": state.vector_field,
+            "dimension": dimension,
+            "count": count,
+            "docs_bytes": docs_bytes,
+            "mapping": state.mapping,
+        }
+        tmp = directory / "meta.json.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(directory / "meta.json")
+
+    @staticmethod
+    def _mark_persisted(state: _IndexState, dimension: int, dead: int, docs_bytes: int) -> None:
+        state.persisted_rows = state.row_count
+        state.persisted_dead = dead
+        state.persisted_dimension = dimension
+        state.docs_bytes = docs_bytes
+        state.dead_since_save = []
+
+    def _save_incremental(self, index: str) -> None:
+        """Append rows and tombstones written since the last save (autosave path).
+
+        Cost is proportional to the change, not the corpus. Falls back to a
+        compacting `save()` for a new index, a dimension change, or once dead
+        rows exceed `COMPACT_DEAD_FRACTION` of the rows on disk.
+        """
+
+        with self._lock:
+            state = self._state(index)
+            directory = self._index_dir(index)
+            rows = state.row_count
+            new_rows = range(state.persisted_rows, rows)
+            if not new_rows and not state.dead_since_save:
+                return
+            dimension = state.vectors.shape[1] if state.vectors is not None else 0
+            dead = (
+                state.persisted_dead
+                + len(state.dead_since_save)
+                + sum(1 for row in new_rows if state.ids[row] is None)
+            )
+            if (
+                not (directory / "meta.json").exists()
+                or (state.persisted_rows and dimension != state.persisted_dimension)
+                or dead > COMPACT_DEAD_FRACTION * rows
+            ):
+                self.save(index)
+                return
+
+            if dimension:
+                block = np.array(state.vectors[state.persisted_rows:rows], dtype=np.float32)
+                block[~state.has_vector[state.persisted_rows:rows]] = 0.0
+                with (directory / "vectors.f32").open("ab") as handle:
+                    # Drop anything a crashed save left past the committed rows.
+                    handle.truncate(state.persisted_rows * dimension * 4)
+                    block.tofile(handle)
+
+            lines = [json.dumps({"_id": state.ids[row], "_source": state.sources[row]}) for row in new_rows]
+            lines.extend(json.dumps({"_deleted_row": row}) for row in state.dead_since_save)
+            payload = "".join(line + "\n" for line in lines).encode("utf-8")
+            with (directory / "docs.jsonl").open("ab") as handle:
+                handle.truncate(state.docs_bytes)
+                handle.write(payload)
+
+            # meta.json is written last: it commits the appended rows.
+            self._write_meta(directory, state, dimension, rows, state.docs_bytes + len(payload))
+            self._mark_persisted(state, dimension, dead, state.docs_bytes + len(payload))
+
+    def _load(self, index: str) -> Optional[_IndexState]:
+        directory = self._index_dir(index)
+        if directory is None or not (directory / "meta.json").exists():
+            return None
+
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        state = _IndexState(
+            text_field=meta.get("text_field", "text"),
+            vector_field=meta.get("vector_field", "embedding"),
+            mapping=meta.get("mapping", {}),
+        )
+        count = int(meta.get("count", 0))
+        dimension = int(meta.get("dimension", 0))
+
+        if dimension and count:
+            # Read-only map; the first write copies it into a growable array.
+            state.vectors = np.memmap(
+                directory / "vectors.f32", dtype=np.float32, mode="r", shape=(count, dimension)
+            )
+            state.has_vector = np.any(state.vectors != 0.0, axis=1)
+        state.doc_lengths = np.zeros(max(count, 1), dtype=np.int32)
+
+        # Only the bytes committed by meta.json; older layouts omit docs_bytes.
+        docs_bytes = meta.get("docs_bytes")
+        with (directory / "docs.jsonl").open("rb") as handle:
+            data = handle.read() if docs_bytes is None else handle.read(int(docs_bytes))
+
+        for line in data.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "_deleted_row" in record:
+                self._drop_row(state, int(record["_deleted_row"]))
+                continue
+            row = state.row_count
+            if row >= count:
+                break
+            doc_id = record["_id"]
+            state.ids.append(doc_id)
+            state.sources.append(record["_source"])
+            if doc_id is None:  # dead when appended
+                if state.has_vector is not None:
+                    state.has_vector[row] = False
+                continue
+            self._index_text(state, row, record["_source"].get(state.text_field) or "")
+            previous = state.rows_by_id.get(doc_id)
+            state.rows_by_id[doc_id] = row
+            if previous is not None:  # overwritten by this later row
+                self._remove_row(state, previous)
+
+        self._mark_persisted(state, dimension, count - state.live_count, len(data))
+        logger.info(
+            "Loaded local index '%s': %d documents (dim=%d) from %s", index, state.live_count, dimension, directory
+        )
+        return state
+
+    def _drop_row(self, state: _IndexState, row: int) -> None:
+        """Tombstone `row` if it still holds the live copy of its document."""
+
+        doc_id = state.ids[row] if row < state.row_count else None
+        if doc_id is None:
+            return
+        if state.rows_by_id.get(doc_id) == row:
+            del state.rows_by_id[doc_id]
+        self._remove_row(state, row)
+
+    # ------------------------------------------------------------------ writes
+
+    def index(self, index: str, body: Dict[str, Any], id: Optional[str] = None, **_: Any) -> Dict[str, Any]:
+        """Index or overwrite one document."""
+
+        doc_id = id if id is not None else f"auto-{self._state_or_create(index).row_count}"
+        self.bulk_index(index, [{"_id": doc_id, "_source": body}])
+        return {"_index": index, "_id": doc_id, "result": "created"}
+
+    def delete(self, index: str, id: str, **_: Any) -> Dict[str, Any]:
+        """Delete one document by id."""
+
+        removed = self.delete_ids(index, [id])
+        return {"_index": index, "_id": id, "result": "deleted" if removed else "not_found"}
+
+    def bulk_index(self, index: str, documents: Iterable[Dict[str, Any]]) -> int:
+        """Upsert `{"_id", "_source"}` documents; returns the number written.
+
+        `documents` is consumed outside the engine lock (callers often embed
+        lazily while it is iterated) and applied in batches of
+        `BULK_LOCK_BATCH`, so searches interleave with a long upload.
+        """
+
+        written = 0
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        for document in documents:
+            batch.append((str(document["_id"]), dict(document["_source"])))
+            if len(batch) >= BULK_LOCK_BATCH:
+                written += self._upsert_batch(index, batch)
+                batch = []
+        if batch:
+            written += self._upsert_batch(index, batch)
+        return written
+
+    def _upsert_batch(self, index: str, batch: Sequence[Tuple[str, Dict[str, Any]]]) -> int:
+        with self._lock:
+            state = self._state_or_create(index)
+            for doc_id, source in batch:
+                self._upsert(state, doc_id, source)
+            if self.autosave:
+                self._save_incremental(index)
+        return len(batch)
+
+    def delete_ids(self, index: str, ids: Iterable[str]) -> int:
+        """Tombstone documents by id; returns how many existed."""
+
+        removed = 0
+        with self._lock:
+            state = self._state(index)
+            for doc_id in ids:
+                row = state.rows_by_id.pop(str(doc_id), None)
+                if row is not None:
+                    self._remove_row(state, row)
+                    removed += 1
+            if self.autosave and removed:
+                self._save_incremental(index)
+        return removed
+
+    def delete_by_query(self, index: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        """Support the `match_all` delete issued by `clear_index_documents`."""
+
+        if "match_all" not in body.get("query", {}):
+            raise ValueError("LocalSearchEngine.delete_by_query only supports match_all")
+        with self._lock:
+            state = self._state(index)
+            deleted = state.live_count
+            self._indexes[index] = _IndexState(
+                text_field=state.text_field, vector_field=state.vector_field, mapping=state.mapping
+            )
+            if self.autosave:
+                self.save(index)
+        return {"deleted": deleted}
+
+    def bulk(self, body: Any, index: Optional[str] = None, **_: Any) -> Dict[str, Any]:
+        """Accept the action/source pairs produced by `opensearchpy.helpers.bulk`."""
+
+        if isinstance(body, (str, bytes)):
+            lines = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            lines = list(body)
+
+        items: List[Dict[str, Any]] = []
+        position = 0
+        while position < len(lines):
+            action = lines[position]
+            op_type, meta = next(iter(action.items()))
+            target = meta.get("_index", index)
+            doc_id = str(meta.get("_id"))
+            if op_type == "delete":
+                self.delete_ids(target, [doc_id])
+                position += 1
+            else:
+                source = lines[position + 1]
+                if op_type == "update":
+                    source = source.get("doc", source)
+                self.bulk_index(target, [{"_id": doc_id, "_source": source}])
+                position += 2
+            items.append({op_type: {"_index": target, "_id": doc_id, "status": 200}})
+        return {"took": 0, "errors": False, "items": items}
+
+    def _state_or_create(self, index: str) -> _IndexState:
+        with self._lock:
+            try:
+                return self._state(index)
+            except KeyError:
+                self._indexes[index] = self._new_state({})
+                return self._indexes[index]
+
+    def _upsert(self, state: _IndexState, doc_id: str, source: Dict[str, Any]) -> None:
+        previous = state.rows_by_id.pop(doc_id, None)
+        if previous is not None:
+            self._remove_row(state, previous)
+
+        vector = source.pop(state.vector_field, None)
+        row = state.row_count
+        state.ids.append(doc_id)
+        state.sources.append(source)
+        state.rows_by_id[doc_id] = row
+        self._ensure_capacity(state, row + 1, None if vector is None else len(vector))
+
+        if vector is not None:
+            array = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(array))
+            state.vectors[row] = array / norm if norm > 0 else array
+            state.has_vector[row] = True
+        self._index_text(state, row, source.get(state.text_field) or "")
+
+    def _ensure_capacity(self, state: _IndexState, rows: int, dimension: Optional[int]) -> None:
+        if state.doc_lengths is None or state.doc_lengths.shape[0] < rows:
+            capacity = max(rows, 2 * (state.doc_lengths.shape[0] if state.doc_lengths is not None else 16))
+            lengths = np.zeros(capacity, dtype=np.int32)
+            if state.doc_lengths is not None:
+                lengths[: state.doc_lengths.shape[0]] = state.doc_lengths
+            state.doc_lengths = lengths
+
+        if state.vectors is None:
+            if dimension is None:
+                return
+            state.vectors = np.zeros((0, dimension), dtype=np.float32)
+            state.has_vector = np.zeros(0, dtype=bool)
+        elif dimension is not None and dimension != state.vectors.shape[1]:
+            raise ValueError(
+                f"Vector dimension {dimension} does not match index dimension {state.vectors.shape[1]}"
+            )
+
+        if state.vectors.shape[0] < rows or isinstance(state.vectors, np.memmap):
+            capacity = max(rows, 2 * state.vectors.shape[0], 16)
+            vectors = np.zeros((capacity, state.vectors.shape[1]), dtype=np.float32)
+            vectors[: state.vectors.shape[0]] = state.vectors
+            present = np.zeros(capacity, dtype=bool)
+            present[: state.has_vector.shape[0]] = state.has_vector
+            state.vectors, state.has_vector = vectors, present
+
+    def _index_text(self, state: _IndexState, row: int, text: str) -> None:
+        tokens = tokenize(text)
+        if state.doc_lengths is None or state.doc_lengths.shape[0] <= row:
+            self._ensure_capacity(state, row + 1, None)
+        state.doc_lengths[row] = len(tokens)
+        state.total_length += len(tokens)
+        for token in tokens:
+            postings = state.postings.setdefault(token, {})
+            postings[row] = postings.get(row, 0) + 1
+
+    def _remove_row(self, state: _IndexState, row: int) -> None:
+        source = state.sources[row] or {}
+        for token in set(tokenize(source.get(state.text_field) or "")):
+            postings = state.postings.get(token)
+            if postings is not None:
+                postings.pop(row, None)
+                if not postings:
+                    del state.postings[token]
+        state.total_length -= int(state.doc_lengths[row])
+        state.doc_lengths[row] = 0
+        state.ids[row] = None
+        state.sources[row] = None
+        if row < state.persisted_rows:
+            state.dead_since_save.append(row)
+        if state.has_vector is not None and row < state.has_vector.shape[0]:
+            state.has_vector[row] = False
+        if state.hnsw is not None and row < state.hnsw_rows:
+            state.hnsw.mark_deleted(row)
+
+    # ------------------------------------------------------------------ search
+
+    def search(self, index: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        """Answer one search request with an OpenSearch-shaped response."""
+
+        with self._lock:
+            state = self._state(index)
+            size = int(body.get("size", 10))
+            rows, scores = self._execute(state, body.get("query", {"match_all": {}}), size)
+            hits = [
+                {
+                    "_index": index,
+                    "_id": state.ids[row],
+                    "_score": float(score),
+                    "_source": state.sources[row],
+                }
+                for row, score in zip(rows[:size], scores[:size])
+            ]
+        max_score = hits[0]["_score"] if hits else None
+        return {
+            "took": 0,
+            "timed_out": False,
+            "hits": {"total": {"value": len(hits), "relation": "eq"}, "max_score": max_score, "hits": hits},
+        }
+
+    def msearch(self, body: List[Dict[str, Any]], index: Optional[str] = None, **_: Any) -> Dict[str, Any]:
+        """Answer header/body pairs like the `_msearch` endpoint."""
+
+        responses: List[Dict[str, Any]] = []
+        for header, request in zip(body[::2], body[1::2]):
+            try:
+                responses.append(self.search(index=header.get("index", index), body=request))
+            except (KeyError, ValueError) as exc:
+                responses.append({"error": {"type": type(exc).__name__, "reason": str(exc)}, "status": 400})
+        return {"took": 0, "responses": responses}
+
+    def _execute(self, state: _IndexState, query: Dict[str, Any], size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (rows, scores) sorted by descending score."""
+
+        (kind, clause), = query.items()
+        if kind == "match_all":
+            rows = np.fromiter(sorted(state.rows_by_id.values()), dtype=np.int64)
+            return rows, np.ones(rows.shape[0], dtype=np.float32)
+        if kind == "match":
+            field_name, spec = next(iter(clause.items()))
+            text = spec["query"] if isinstance(spec, dict) else str(spec)
+            return self._bm25(state, text, size)
+        if kind == "knn":
+            field_name, spec = next(iter(clause.items()))
+            return self._knn(state, spec["vector"], int(spec.get("k", size)))
+        if kind == "hybrid":
+            return self._hybrid(state, clause.get("queries", []), size)
+        raise ValueError(f"LocalSearchEngine does not support '{kind}' queries")
+
+    def _bm25(self, state: _IndexState, text: str, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        live = state.live_count
+        if not live:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        avg_length = max(state.total_length / live, 1e-9)
+        scores = np.zeros(state.row_count, dtype=np.float32)
+        for term in set(tokenize(text)):
+            postings = state.postings.get(term)
+            if not postings:
+                continue
+            rows = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            tf = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            idf = math.log(1.0 + (live - len(postings) + 0.5) / (len(postings) + 0.5))
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * state.doc_lengths[rows] / avg_length)
+            scores[rows] += idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+
+        candidates = np.flatnonzero(scores)
+        return self._top(candidates, scores[candidates], size)
+
+    def _knn(self, state: _IndexState, vector: Sequence[float], k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if state.vectors is None or not state.live_count:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            query = query / norm
+
+        if hnswlib is not None and state.live_count >= self.hnsw_threshold:
+            rows, similarity = self._hnsw_search(state, query, k)
+        else:
+            count = state.row_count
+            similarity = state.vectors[:count] @ query
+            similarity = np.where(state.has_vector[:count], similarity, -np.inf)
+            rows = np.flatnonzero(np.isfinite(similarity))
+            similarity = similarity[rows]
+        # OpenSearch's cosinesimil space reports (1 + cosine) / 2.
+        return self._top(rows, (1.0 + similarity) / 2.0, k)
+
+    def _hnsw_search(self, state: _IndexState, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate kNN, (re)building or extending the graph as rows arrive."""
+
+        count = state.row_count
+        if state.hnsw is None:
+            graph = hnswlib.Index(space="ip", dim=state.vectors.shape[1])
+            graph.init_index(max_elements=max(count * 2, 1024), ef_construction=200, M=16)
+            state.hnsw, state.hnsw_rows = graph, 0
+        if state.hnsw_rows < count:
+            if count > state.hnsw.get_max_elements():
+                state.hnsw.resize_index(count * 2)
+            new_rows = np.arange(state.hnsw_rows, count)
+            state.hnsw.add_items(state.vectors[state.hnsw_rows:count], new_rows)
+            for row in new_rows[~state.has_vector[state.hnsw_rows:count]]:
+                state.hnsw.mark_deleted(int(row))
+            state.hnsw_rows = count
+        state.hnsw.set_ef(max(self.hnsw_ef, k))
+        labels, distances = state.hnsw.knn_query(query, k=min(k, state.live_count))
+        # hnswlib's "ip" space returns 1 - dot product.
+        return labels[0].astype(np.int64), 1.0 - distances[0]
+
+    def _hybrid(
+        self, state: _IndexState, queries: List[Dict[str, Any]], size: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        weights = self.hybrid_weights or [1.0] * len(queries)
+        if len(weights) != len(queries):
+            raise ValueError(f"hybrid_weights has {len(weights)} entries for {len(queries)} sub-queries")
+
+        combined = np.zeros(state.row_count, dtype=np.float32)
+        matched = np.zeros(state.row_count, dtype=bool)
+        for weight, sub_query in zip(weights, queries):
+            rows, scores = self._execute(state, sub_query, size)
+            combined[rows] += weight * min_max_normalize(scores)
+            matched[rows] = True
+        combined /= float(sum(weights)) or 1.0
+
+        candidates = np.flatnonzero(matched)
+        return self._top(candidates, combined[candidates], size)
+
+    @staticmethod
+    def _top(rows: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Best `k` rows by score in descending order, ties broken by row."""
+
+        if k <= 0 or rows.size == 0:
+            return rows[:0], scores[:0]
+        if rows.size > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[keep], scores[keep]
+        order = np.lexsort((rows, -scores))
+        return rows[order], scores[order]
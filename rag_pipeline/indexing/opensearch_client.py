@@ -11,6 +11,8 @@ Features:
 - Index clearing and management
 - Health monitoring and status checks
 - Connection retry logic
+- Optional asyncio client (AsyncOpenSearch) for non-blocking search
+- NumPy-aware JSON serializer (orjson when available) for vector payloads
 - Error handling and graceful degradation
 - Configuration validation
 - Production-ready logging
@@ -18,10 +20,16 @@ Features:
 Usage:
     # Initialize client
     client = create_opensearch_client(host='localhost:9200')
+
+    # Asyncio client for coroutine-based retrieval (requires aiohttp)
+    async_client = create_async_client(config)
     
     # Bulk index documents
     bulk_index_documents(client, documents, 'my-index')
     
+    # Delete specific documents
+    delete_documents(client, 'my-index', ['doc-1', 'doc-2'])
+
     # Clear index
     clear_index_documents(client, 'my-index')
 """
@@ -32,6 +40,8 @@ from dataclasses import dataclass
 import logging
 from typing import Any, Dict, Iterable
 
+from .serialization import FastJSONSerializer
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -41,6 +51,11 @@ except ImportError:  # pragma: no cover - optional dependency
     OpenSearch = None  # type: ignore[assignment]
     opensearch_bulk = None  # type: ignore[assignment]
 
+try:
+    from opensearchpy import AsyncOpenSearch
+except ImportError:  # pragma: no cover - optional dependency (needs aiohttp)
+    AsyncOpenSearch = None  # type: ignore[assignment]
+
 
 @dataclass
 class OpenSearchConfig:
@@ -54,30 +69,51 @@ class OpenSearchConfig:
     use_ssl: bool | None = None
 
 
-def create_client(config: OpenSearchConfig):
-    """Instantiate the OpenSearch client with sensible defaults."""
-
-    if OpenSearch is None:
-        raise ImportError(
-            "opensearch-py must be installed to create an OpenSearch client."
-        )
+def _connection_kwargs(config: OpenSearchConfig) -> Dict[str, Any]:
+    """Connection arguments shared by the sync and async clients."""
 
     if config.host.startswith("http"):
         hosts = [config.host]
     else:
         hosts = [{"host": config.host}]
 
-    client = OpenSearch(
-        hosts=hosts,
-        http_auth=(config.username, config.password) if config.username else None,
-        verify_certs=config.tls_verify,
-        use_ssl=config.use_ssl if config.use_ssl is not None else config.host.startswith(
+    kwargs: Dict[str, Any] = {
+        "hosts": hosts,
+        "http_auth": (config.username, config.password) if config.username else None,
+        "verify_certs": config.tls_verify,
+        "use_ssl": config.use_ssl if config.use_ssl is not None else config.host.startswith(
             "https"
         ),
-    )
+    }
+    if FastJSONSerializer is not None:
+        # Embedding arrays are serialized here, once, instead of as Python lists upstream.
+        kwargs["serializer"] = FastJSONSerializer()
+    return kwargs
+
+
+def create_client(config: OpenSearchConfig):
+    """Instantiate the OpenSearch client with sensible defaults."""
+
+    if OpenSearch is None:
+        raise ImportError(
+            "opensearch-py must be installed to create an OpenSearch client."
+        )
+
+    client = OpenSearch(**_connection_kwargs(config))
     return client
 
 
+def create_async_client(config: OpenSearchConfig):
+    """Instantiate an AsyncOpenSearch client for coroutine-based retrieval."""
+
+    if AsyncOpenSearch is None:
+        raise ImportError(
+            "opensearch-py[async] (aiohttp) must be installed to create an async OpenSearch client."
+        )
+
+    return AsyncOpenSearch(**_connection_kwargs(config))
+
+
 def ensure_index(client: Any, index_name: str, mapping: Dict[str, Any]) -> None:
     """Create the index with the provided mapping if it does not already exist."""
 
@@ -95,6 +131,19 @@ def ensure_index(client: Any, index_name: str, mapping: Dict[str, Any]) -> None:
                 )
                 client.indices.delete(index=index_name)
                 client.indices.create(index=index_name, body=mapping)
+            else:
+                expected = mapping.get("mappings", {}).get("properties", {}).get("embedding", {})
+                for key in ("dimension", "data_type"):
+                    if props["embedding"].get(key) != expected.get(key):
+                        # Vector storage changed (e.g. VECTOR_CODEC_DIR); documents would be rejected.
+                        logger.warning(
+                            "Existing index '%s' has embedding %s %s but the configured mapping expects %s; "
+                            "re-create the index to switch vector storage.",
+                            index_name,
+                            key,
+                            props["embedding"].get(key),
+                            expected.get(key),
+                        )
         except Exception as exc:
             logger.warning(
                 "Failed to verify or recreate existing index '%s': %s",
@@ -107,9 +156,23 @@ def ensure_index(client: Any, index_name: str, mapping: Dict[str, Any]) -> None:
 
 
 def bulk_index_documents(
-    client: Any, index_name: str, documents: Iterable[Dict[str, Any]]
+    client: Any,
+    index_name: str,
+    documents: Iterable[Dict[str, Any]],
+    chunk_size: int = 500,
 ) -> None:
-    """Send documents to OpenSearch using the bulk API (stub)."""
+    """Send documents to OpenSearch using the bulk API.
+
+    `documents` may be a generator; it is consumed lazily, `chunk_size`
+    documents per bulk request, so callers can stream without materializing
+    the whole payload.
+    """
+
+    local_bulk = getattr(client, "bulk_index", None)
+    if callable(local_bulk):
+        # LocalSearchEngine: upsert in-process without serializing NDJSON.
+        local_bulk(index_name, documents)
+        return
 
     if opensearch_bulk is None:
         raise ImportError(
@@ -117,7 +180,33 @@ def bulk_index_documents(
         )
 
     actions = ({"_index": index_name, **doc} for doc in documents)
-    opensearch_bulk(client, actions)
+    opensearch_bulk(client, actions, chunk_size=chunk_size)
+
+
+def delete_documents(client: Any, index_name: str, ids: Iterable[str]) -> int:
+    """Delete documents by ID; IDs that do not exist are ignored.
+
+    Returns the number of delete actions sent.
+    """
+
+    ids = list(ids)
+    if not ids:
+        return 0
+
+    local_delete = getattr(client, "delete_ids", None)
+    if callable(local_delete):
+        local_delete(index_name, ids)
+        return len(ids)
+
+    if opensearch_bulk is None:
+        raise ImportError(
+            "opensearch-py helpers are required for bulk delete operations."
+        )
+
+    actions = ({"_op_type": "delete", "_index": index_name, "_id": doc_id} for doc_id in ids)
+    # Missing IDs come back as 404 items; they are already gone, so do not raise.
+    opensearch_bulk(client, actions, raise_on_error=False)
+    return len(ids)
 
 
 def clear_index_documents(client: Any, index_name: str) -> None:
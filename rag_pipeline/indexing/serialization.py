@@ -0,0 +1,74 @@
+"""
+Fast JSON Serialization for Search Requests
+
+This module turns request bodies that carry NumPy embedding arrays into JSON
+exactly once, at the HTTP boundary, so vectors can stay float32 ndarrays from
+the embedding model through indexing and search instead of being expanded into
+Python float lists along the way.
+
+Features:
+- orjson with native NumPy support when installed
+- Standard-library fallback converting arrays and NumPy scalars on demand
+- Drop-in serializer for opensearch-py clients (sync and async)
+
+Usage:
+    payload = dumps_json({"vector": np.ones(384, dtype=np.float32)})
+    client = OpenSearch(hosts=[...], serializer=FastJSONSerializer())
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from opensearchpy.serializer import JSONSerializer
+except ImportError:  # pragma: no cover - optional dependency
+    JSONSerializer = None  # type: ignore[assignment]
+
+
+def _default(value: Any) -> Any:
+    """Convert values neither encoder handles natively."""
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Unable to serialize {value!r} (type: {type(value).__name__})")
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize `data` to compact JSON, encoding ndarrays without Python floats."""
+
+    if orjson is not None:
+        # orjson writes contiguous float32/float64 arrays straight from their buffers.
+        return orjson.dumps(data, default=_default, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(data, default=_default, separators=(",", ":"), ensure_ascii=False)
+
+
+if JSONSerializer is not None:
+
+    class FastJSONSerializer(JSONSerializer):
+        """opensearch-py serializer backed by `dumps_json`."""
+
+        def dumps(self, data: Any) -> str:
+            if isinstance(data, str):
+                return data
+            return dumps_json(data)
+
+else:  # pragma: no cover - exercised only without opensearch-py
+    FastJSONSerializer = None  # type: ignore[assignment,misc]
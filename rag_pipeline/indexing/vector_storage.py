@@ -0,0 +1,329 @@
+"""
+Reduced-Dimension and Quantized Vector Storage
+
+This module shrinks the `embedding` field stored in the index. Vectors can be
+projected to fewer dimensions (PCA, or Matryoshka-style truncation for models
+trained for it) and/or stored at lower precision (fp16 via the faiss scalar
+quantizer, or signed bytes via the lucene engine). The same codec is applied to
+document vectors at indexing time and to query vectors at search time, and the
+index mapping is generated from it so the two always agree.
+
+Features:
+- Storage specs such as ``fp16``, ``byte``, ``pca:128``, ``truncate:256+byte``
+- PCA fitted on a sample of document embeddings; byte scale calibrated likewise
+- Unit-normalized outputs, so cosine / inner-product ranking is preserved
+- `storage_mapping` rewrites the schema's `knn_vector` field to match
+- Codec persisted as JSON + NPZ and loaded from ``VECTOR_CODEC_DIR``
+- `EncodedEmbeddings` wraps any embedder so indexing and retrieval share it
+- Per-vector storage and HNSW memory estimates for capacity planning
+
+Usage:
+    codec = VectorCodec(VectorStorageSpec.parse('pca:128+byte')).fit(sample_vectors)
+    codec.save('data/cache/vector_codec')
+    mapping = storage_mapping(json.loads(SCHEMA_PATH.read_text()), codec)
+    embedder = EncodedEmbeddings(build_embedder('torch', 'all-MiniLM-L6-v2'), codec)
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REDUCTIONS = ("none", "pca", "truncate")
+PRECISIONS = ("float32", "fp16", "byte")
+BYTES_PER_VALUE = {"float32": 4, "fp16": 2, "byte": 1}
+# OpenSearch k-NN sizing guide: 1.1 * (bytes_per_vector + 8 * M) per vector for HNSW.
+HNSW_M = 16
+BYTE_CLIP_QUANTILE = 0.999
+CODEC_CONFIG_FILE = "vector_codec.json"
+CODEC_ARRAYS_FILE = "vector_codec.npz"
+
+
+@dataclass(frozen=True)
+class VectorStorageSpec:
+    """How vectors are stored: optional dimension reduction plus precision."""
+
+    reduction: str = "none"
+    dimension: Optional[int] = None
+    precision: str = "float32"
+
+    def __post_init__(self) -> None:
+        if self.reduction not in REDUCTIONS:
+            raise ValueError(f"Unknown reduction '{self.reduction}'. Expected one of {REDUCTIONS}.")
+        if self.precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{self.precision}'. Expected one of {PRECISIONS}.")
+        if self.reduction != "none" and not (self.dimension and self.dimension > 0):
+            raise ValueError(f"Reduction '{self.reduction}' needs a positive target dimension.")
+
+    @classmethod
+    def parse(cls, text: str) -> "VectorStorageSpec":
+        """Parse ``[pca|truncate:<dim>][+]<float32|fp16|byte>`` (either part optional)."""
+
+        reduction, dimension, precision = "none", None, "float32"
+        for part in filter(None, (piece.strip().lower() for piece in text.split("+"))):
+            name, _, value = part.partition(":")
+            if name in PRECISIONS and not value:
+                precision = name
+            elif name in REDUCTIONS and name != "none":
+                reduction, dimension = name, int(value) if value else None
+            elif name != "none":
+                raise ValueError(f"Unrecognized vector storage spec '{text}'")
+        return cls(reduction=reduction, dimension=dimension, precision=precision)
+
+    @property
+    def label(self) -> str:
+        prefix = f"{self.reduction}:{self.dimension}+" if self.reduction != "none" else ""
+        return f"{prefix}{self.precision}"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+class VectorCodec:
+    """
+    Apply a `VectorStorageSpec` to embedding matrices.
+
+    Attributes:
+        spec: Reduction and precision to apply
+        source_dimension: Dimension of the embedder's output (set by `fit`)
+        components: PCA projection (dimension x source_dimension), if any
+        mean: PCA centering vector, if any
+        byte_scale: Multiplier mapping unit-vector components onto int8
+    """
+
+    def __init__(
+        self,
+        spec: VectorStorageSpec,
+        source_dimension: Optional[int] = None,
+        components: Optional[np.ndarray] = None,
+        mean: Optional[np.ndarray] = None,
+        byte_scale: Optional[float] = None,
+    ) -> None:
+        self.spec = spec
+        self.source_dimension = source_dimension
+        self.components = components
+        self.mean = mean
+        self.byte_scale = byte_scale
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Stored vector dimension."""
+
+        return self.spec.dimension if self.spec.reduction != "none" else self.source_dimension
+
+    @property
+    def fitted(self) -> bool:
+        if self.source_dimension is None or (self.spec.reduction == "pca" and self.components is None):
+            return False
+        return self.spec.precision != "byte" or self.byte_scale is not None
+
+    def fit(self, sample: np.ndarray) -> "VectorCodec":
+        """Record the source dimension and fit PCA / byte scale on sample document vectors."""
+
+        sample = np.asarray(sample, dtype=np.float32)
+        if sample.ndim != 2 or not len(sample):
+            raise ValueError("fit() needs a non-empty (n, dim) sample of embeddings")
+        self.source_dimension = sample.shape[1]
+        target = self.spec.dimension
+        if self.spec.reduction != "none" and target > self.source_dimension:
+            raise ValueError(f"Target dimension {target} exceeds embedding dimension {self.source_dimension}")
+
+        if self.spec.reduction == "pca":
+            if len(sample) < target:
+                raise ValueError(f"PCA to {target} dimensions needs at least {target} sample vectors")
+            self.mean = sample.mean(axis=0)
+            # Rows of vt are principal axes, ordered by explained variance.
+            _, _, vt = np.linalg.svd(sample - self.mean, full_matrices=False)
+            self.components = np.ascontiguousarray(vt[:target], dtype=np.float32)
+
+        if self.spec.precision == "byte":
+            unit = self._reduce(sample)
+            clip = float(np.quantile(np.abs(unit), BYTE_CLIP_QUANTILE))
+            self.byte_scale = 127.0 / clip if clip > 0 else 127.0
+        return self
+
+    def _reduce(self, vectors: np.ndarray) -> np.ndarray:
+        if self.spec.reduction == "pca":
+            vectors = (vectors - self.mean) @ self.components.T
+        elif self.spec.reduction == "truncate":
+            vectors = vectors[:, : self.spec.dimension]
+        return _normalize(vectors.astype(np.float32, copy=False))
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Return stored-form vectors: float32 rows, or int8 rows for ``byte``.
+
+        fp16 rows stay float32 on the wire; the faiss scalar quantizer stores
+        them at half precision server-side.
+        """
+
+        if not self.fitted:
+            raise RuntimeError(f"Vector codec '{self.spec.label}' must be fitted before use")
+        array = np.asarray(vectors, dtype=np.float32)
+        single = array.ndim == 1
+        reduced = self._reduce(array.reshape(1, -1) if single else array)
+        if self.spec.precision == "byte":
+            reduced = np.clip(np.rint(reduced * self.byte_scale), -128, 127).astype(np.int8)
+        return reduced[0] if single else reduced
+
+    def decode(self, stored: np.ndarray) -> np.ndarray:
+        """Float32 view of stored vectors as the index scores them (for benchmarks)."""
+
+        stored = np.asarray(stored)
+        if self.spec.precision == "fp16":
+            return stored.astype(np.float16).astype(np.float32)
+        if self.spec.precision == "byte":
+            return stored.astype(np.float32) / self.byte_scale
+        return stored.astype(np.float32, copy=False)
+
+    def bytes_per_vector(self) -> int:
+        return BYTES_PER_VALUE[self.spec.precision] * int(self.dimension or 0)
+
+    def estimated_index_bytes(self, count: int, m: int = HNSW_M) -> int:
+        """Native HNSW graph + vector memory for `count` vectors (OpenSearch sizing formula)."""
+
+        return int(1.1 * (self.bytes_per_vector() + 8 * m) * count)
+
+    def knn_field_mapping(self) -> Dict[str, Any]:
+        """`knn_vector` field definition matching this codec."""
+
+        field: Dict[str, Any] = {"type": "knn_vector", "dimension": self.dimension}
+        if self.spec.precision == "fp16":
+            # Vectors are unit length, so inner product ranks exactly like cosine.
+            field["method"] = {
+                "name": "hnsw",
+                "engine": "faiss",
+                "space_type": "innerproduct",
+                "parameters": {"encoder": {"name": "sq", "parameters": {"type": "fp16"}}},
+            }
+        elif self.spec.precision == "byte":
+            field["data_type"] = "byte"
+            field["method"] = {"name": "hnsw", "engine": "lucene", "space_type": "cosinesimil"}
+        else:
+            field["method"] = {"name": "hnsw", "engine": "nmslib", "space_type": "cosinesimil"}
+        return field
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "spec": self.spec.label,
+            "dimension": self.dimension,
+            "source_dimension": self.source_dimension,
+            "bytes_per_vector": self.bytes_per_vector(),
+        }
+
+    def save(self, directory: str | Path) -> Path:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        config = {
+            "reduction": self.spec.reduction,
+            "dimension": self.spec.dimension,
+            "precision": self.spec.precision,
+            "source_dimension": self.source_dimension,
+            "byte_scale": self.byte_scale,
+        }
+        (directory / CODEC_CONFIG_FILE).write_text(json.dumps(config, indent=2), encoding="utf-8")
+        if self.components is not None:
+            np.savez(directory / CODEC_ARRAYS_FILE, components=self.components, mean=self.mean)
+        return directory
+
+    @classmethod
+    def load(cls, directory: str | Path) -> "VectorCodec":
+        directory = Path(directory)
+        config = json.loads((directory / CODEC_CONFIG_FILE).read_text(encoding="utf-8"))
+        spec = VectorStorageSpec(config["reduction"], config.get("dimension"), config["precision"])
+        components = mean = None
+        arrays_path = directory / CODEC_ARRAYS_FILE
+        if arrays_path.exists():
+            with np.load(arrays_path) as arrays:
+                components, mean = arrays["components"], arrays["mean"]
+        return cls(spec, config.get("source_dimension"), components, mean, config.get("byte_scale"))
+
+    def __repr__(self) -> str:
+        return f"VectorCodec(spec={self.spec.label}, dimension={self.dimension})"
+
+
+def load_vector_codec(directory: Optional[str] = None) -> Optional[VectorCodec]:
+    """Load the codec from `directory` (defaults to ``VECTOR_CODEC_DIR``); None when unset."""
+
+    directory = directory or os.getenv("VECTOR_CODEC_DIR")
+    if not directory:
+        return None
+    codec = VectorCodec.load(directory)
+    logger.info(f"Using vector storage '{codec.spec.label}' ({codec.dimension} dims) from {directory}")
+    return codec
+
+
+def storage_mapping(mapping: Dict[str, Any], codec: Optional[VectorCodec], field: str = "embedding") -> Dict[str, Any]:
+    """Return a copy of `mapping` whose vector field matches `codec` (unchanged without one)."""
+
+    if codec is None:
+        return mapping
+    mapping = copy.deepcopy(mapping)
+    mapping["mappings"]["properties"][field] = codec.knn_field_mapping()
+    return mapping
+
+
+class EncodedEmbeddings:
+    """
+    Embedder wrapper that returns stored-form vectors for documents and queries.
+
+    Attributes:
+        embedder: Model producing full-precision vectors
+        codec: Fitted `VectorCodec` applied to every output
+    """
+
+    def __init__(self, embedder: Any, codec: VectorCodec) -> None:
+        if not codec.fitted:
+            raise RuntimeError(f"Vector codec '{codec.spec.label}' must be fitted before use")
+        self.embedder = embedder
+        self.codec = codec
+
+    def __getattr__(self, name: str) -> Any:
+        if name in {"embedder", "codec"}:
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    def _documents(self, texts: List[str]) -> np.ndarray:
+        embed_array = getattr(self.embedder, "embed_documents_array", None)
+        if callable(embed_array):
+            return embed_array(texts)
+        return np.asarray(self.embedder.embed_documents(texts), dtype=np.float32)
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        return self.codec.encode(self._documents(texts)) if texts else self._documents(texts)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents_array(texts).tolist()
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        embed_array = getattr(self.embedder, "embed_query_array", None)
+        vector = embed_array(text) if callable(embed_array) else self.embedder.embed_query(text)
+        return self.codec.encode(vector)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_query_array(text).tolist()
+
+    def embed_queries_array(self, texts: List[str]) -> np.ndarray:
+        embed_array = getattr(self.embedder, "embed_queries_array", None)
+        if callable(embed_array):
+            return self.codec.encode(embed_array(texts))
+        return np.stack([self.embed_query_array(text) for text in texts])
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_queries_array(texts).tolist()
+
+    def get_model_info(self) -> Dict[str, Any]:
+        model_info = getattr(self.embedder, "get_model_info", None)
+        info = dict(model_info()) if callable(model_info) else {}
+        info["vector_storage"] = self.codec.info()
+        return info
@@ -0,0 +1,245 @@
+"""
+Persistent Ingestion Manifest
+
+This module records what has already been indexed — per source file its
+content hash and the hash of every chunk written for it — so re-ingestion can
+skip unchanged files, re-embed only the chunks that changed, and delete chunks
+that no longer exist instead of leaving stale vectors behind.
+
+Features:
+- Streaming SHA-256 file fingerprints (content) and path fingerprints (identity)
+- Per-chunk content hashes keyed by document ID
+- Size + mtime fast path that avoids re-hashing untouched files
+- Atomic JSON persistence (write to temp file, then rename)
+- Interval checkpoints during long runs instead of a rewrite per file
+- Thread-safe updates for concurrent ingestion workers
+
+Usage:
+    manifest = IngestionManifest.load('data/ingestion_manifest.json')
+    if manifest.is_unchanged(path, index_name, file_hash):
+        ...
+    stat = file_stat(path)  # taken before the file is read
+    ...
+    manifest.record(path, index_name, file_hash, {"doc-1": "ab12..."}, *stat)
+    manifest.checkpoint()  # per file: writes at most every `save_interval` seconds
+    ...
+    manifest.save()  # end of the run
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+_READ_BLOCK = 1 << 20
+DEFAULT_SAVE_INTERVAL = 30.0
+
+
+def file_fingerprint(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        while block := handle.read(_READ_BLOCK):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_stat(path: Path) -> Tuple[int, int]:
+    """Return `(size, mtime_ns)`, the identity the manifest's fast path compares."""
+
+    stat = Path(path).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def path_fingerprint(path: Path) -> str:
+    """Return a SHA-256 hex digest of a file's resolved path.
+
+    Unlike `file_fingerprint` this stays the same when the file is edited,
+    which keeps chunk IDs stable for incremental re-ingestion.
+    """
+
+    resolved = str(Path(path).expanduser().resolve())
+    return hashlib.sha256(resolved.encode("utf-8")).hexdigest()
+
+
+def chunk_fingerprint(text: str, page_numbers: List[int], title: Optional[str], metadata: Optional[dict]) -> str:
+    """Hash everything that ends up in a chunk's indexed body except the vector."""
+
+    payload = json.dumps(
+        {"text": text, "pages": page_numbers, "title": title, "metadata": metadata or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """What was indexed for one source file."""
+
+    index_name: str
+    file_hash: str
+    size: int
+    mtime_ns: int
+    chunks: Dict[str, str] = field(default_factory=dict)
+
+
+class IngestionManifest:
+    """
+    JSON-backed record of indexed files and chunks.
+
+    Attributes:
+        path: JSON file backing the manifest (None keeps it in memory)
+        save_interval: Minimum seconds between `checkpoint` writes
+    """
+
+    def __init__(
+        self,
+        path: Optional[str | os.PathLike[str]] = None,
+        save_interval: float = DEFAULT_SAVE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = Path(path).expanduser() if path else None
+        self.save_interval = save_interval
+        self._clock = clock
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_save: Optional[float] = None
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], **options: Any) -> "IngestionManifest":
+        """Read a manifest from disk; a missing or corrupt file starts empty."""
+
+        manifest = cls(path, **options)
+        if manifest.path is None or not manifest.path.exists():
+            return manifest
+        try:
+            raw = json.loads(manifest.path.read_text(encoding="utf-8"))
+            for key, entry in raw.get("files", {}).items():
+                manifest._entries[key] = ManifestEntry(**entry)
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("Ignoring unreadable ingestion manifest %s: %s", manifest.path, exc)
+            manifest._entries.clear()
+        return manifest
+
+    @staticmethod
+    def key(path: Path) -> str:
+        return str(Path(path).expanduser().resolve())
+
+    def get(self, path: Path) -> Optional[ManifestEntry]:
+        with self._lock:
+            return self._entries.get(self.key(path))
+
+    def sources(self, index_name: Optional[str] = None) -> List[str]:
+        """Source paths recorded for `index_name` (or all indexes)."""
+
+        with self._lock:
+            return [
+                key
+                for key, entry in self._entries.items()
+                if index_name is None or entry.index_name == index_name
+            ]
+
+    def stat_matches(self, path: Path, index_name: str) -> bool:
+        """Cheap check: same size and mtime as when the file was last indexed."""
+
+        entry = self.get(path)
+        if entry is None or entry.index_name != index_name:
+            return False
+        return (entry.size, entry.mtime_ns) == file_stat(path)
+
+    def is_unchanged(self, path: Path, index_name: str, file_hash: str) -> bool:
+        entry = self.get(path)
+        return entry is not None and entry.index_name == index_name and entry.file_hash == file_hash
+
+    def record(
+        self,
+        path: Path,
+        index_name: str,
+        file_hash: str,
+        chunks: Dict[str, str],
+        size: int,
+        mtime_ns: int,
+    ) -> None:
+        """Record an indexed file.
+
+        `size` and `mtime_ns` must come from a `file_stat` taken before the
+        file was hashed and read; stat-ing again here could pair a newer
+        size/mtime with the older content, and the fast path would then
+        skip the edit forever.
+        """
+
+        with self._lock:
+            self._entries[self.key(path)] = ManifestEntry(
+                index_name=index_name,
+                file_hash=file_hash,
+                size=size,
+                mtime_ns=mtime_ns,
+                chunks=dict(chunks),
+            )
+            self._dirty = True
+
+    def forget(self, path: Path | str) -> Optional[ManifestEntry]:
+        with self._lock:
+            entry = self._entries.pop(self.key(Path(path)), None)
+            self._dirty = self._dirty or entry is not None
+            return entry
+
+    def forget_index(self, index_name: str) -> None:
+        """Drop every entry for an index (used after the index is cleared)."""
+
+        with self._lock:
+            for key in self.sources(index_name):
+                del self._entries[key]
+                self._dirty = True
+
+    def checkpoint(self) -> bool:
+        """Save pending changes if `save_interval` has passed since the last save.
+
+        Called after every file so a crash loses at most a few seconds of
+        records (those files are simply re-ingested), without rewriting the
+        whole JSON once per file on large runs. Returns True if it saved.
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return False
+            if self._last_save is not None and self._clock() - self._last_save < self.save_interval:
+                return False
+            self.save()
+            return True
+
+    def save(self) -> None:
+        """Atomically persist the manifest (no-op for in-memory manifests)."""
+
+        with self._lock:
+            if self.path is not None:
+                self._write(self.path)
+            self._dirty = False
+            self._last_save = self._clock()
+
+    def _write(self, path: Path) -> None:
+        with self._lock:
+            payload: Dict[str, Any] = {
+                "version": MANIFEST_VERSION,
+                "files": {key: asdict(entry) for key, entry in self._entries.items()},
+            }
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,185 @@
+"""
+Parallel PDF Text Extraction
+
+This module fans PDF text extraction out across a process pool, splitting each
+file into page ranges so large backfills use every core and one slow PyPDF page
+only occupies a single worker while the rest of the document keeps moving.
+
+Features:
+- Page-range tasks spread across files and cores
+- Results streamed back per file, in input order, pages in page order
+- Bounded look-ahead so only a few files' text is buffered at once
+- Per-page failure isolation (a broken page yields empty text)
+- Unreadable files reported in order, with the error, instead of dropped
+- Inline (no pool) mode for single-core hosts and tests
+- File size/mtime captured before extraction for the ingestion manifest
+
+Usage:
+    with ParallelPdfExtractor(max_workers=4) as extractor:
+        for path, page_text, stat, error in extractor.iter_documents(paths):
+            if error:
+                continue
+            chunks = build_document_chunks(path, path.stem, page_text)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .manifest import file_stat
+from .pdf_ocr_pipeline import PdfReader, extract_pages
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGES_PER_TASK = 8
+
+
+class ExtractedDocument(NamedTuple):
+    """Page text of one file and its `(size, mtime_ns)` from before extraction.
+
+    `error` is set (and `page_text` is None) when the file could not be read.
+    """
+
+    path: Path
+    page_text: Optional[List[str]]
+    stat: Optional[Tuple[int, int]] = None
+    error: Optional[str] = None
+
+
+def count_pdf_pages(path: str) -> int:
+    """Return the number of pages in the PDF at `path`."""
+
+    return len(PdfReader(path).pages)
+
+
+def extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Worker entry point: extract pages [start, stop) from the PDF at `path`.
+
+    Workers re-open the file by path rather than receiving its bytes, so only
+    page text crosses the process boundary.
+    """
+
+    return extract_pages(PdfReader(path), start, stop)
+
+
+class _InlineExecutor(Executor):
+    """Executor running tasks in the calling thread (max_workers <= 1)."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:  # pragma: no cover - surfaced via result()
+            future.set_exception(exc)
+        return future
+
+
+class ParallelPdfExtractor:
+    """
+    Process-pool PDF extractor yielding per-file page text in order.
+
+    Attributes:
+        max_workers: Worker processes (defaults to the CPU count; <= 1 runs inline)
+        pages_per_task: Pages handed to a worker per task
+        max_pending_files: Files submitted ahead of the one being consumed
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        max_pending_files: Optional[int] = None,
+    ) -> None:
+        if PdfReader is None:
+            raise NotImplementedError("pypdf is required for text extraction. Install dependencies first.")
+        if pages_per_task <= 0:
+            raise ValueError("pages_per_task must be a positive integer")
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.pages_per_task = pages_per_task
+        self.max_pending_files = max_pending_files or max(2, 2 * self.max_workers)
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "ParallelPdfExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers <= 1:
+                self._executor = _InlineExecutor()
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _submit_file(self, path: Path) -> List[Future]:
+        """Split one file into page-range tasks."""
+
+        page_count = count_pdf_pages(str(path))
+        return [
+            self._pool().submit(extract_page_range, str(path), start, min(start + self.pages_per_task, page_count))
+            for start in range(0, page_count, self.pages_per_task)
+        ]
+
+    def extract(self, path: Path) -> List[str]:
+        """Extract every page of one PDF, in page order."""
+
+        return _gather(self._submit_file(path))
+
+    def iter_documents(self, paths: Iterable[Path]) -> Iterator[ExtractedDocument]:
+        """Yield `(path, page_text, stat, error)` in input order while later files extract.
+
+        Files that cannot be opened or extracted are logged and yielded with
+        `error` set, so callers can report them.
+        """
+
+        pending: Deque[ExtractedDocument | Tuple[Path, Tuple[int, int], Sequence[Future]]] = deque()
+        iterator = iter(paths)
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < self.max_pending_files:
+                try:
+                    path = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                try:
+                    stat = file_stat(path)
+                    pending.append((path, stat, self._submit_file(path)))
+                except Exception as exc:
+                    logger.error("Failed to open %s for extraction: %s", path, exc)
+                    pending.append(ExtractedDocument(path, None, error=str(exc)))
+
+            if not pending:
+                return
+            entry = pending.popleft()
+            if isinstance(entry, ExtractedDocument):
+                yield entry
+                continue
+            path, stat, futures = entry
+            try:
+                page_text = _gather(futures)
+            except Exception as exc:
+                logger.error("Failed to extract %s: %s", path, exc)
+                yield ExtractedDocument(path, None, stat, error=str(exc))
+                continue
+            yield ExtractedDocument(path, page_text, stat)
+
+
+def _gather(futures: Sequence[Future]) -> List[str]:
+    page_text: List[str] = []
+    for future in futures:
+        page_text.extend(future.result())
+    return page_text
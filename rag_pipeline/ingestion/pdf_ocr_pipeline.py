@@ -8,16 +8,19 @@ PaddleOCR) are selected and validated.
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 try:
     from pypdf import PdfReader
 except ImportError:  # pragma: no cover - optional dependency during scaffolding
     PdfReader = None
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class DocumentChunk:
@@ -28,6 +31,8 @@ class DocumentChunk:
     source_path: Path
     title: Optional[str] = None
     metadata: Optional[dict] = None
+    source_id: Optional[str] = None  # fingerprint of the source document
+    offset: int = 0  # token offset of the chunk within its page
 
 
 def load_pdf(path: Path) -> bytes:
@@ -45,9 +50,19 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> List[str]:
         )
 
     reader = PdfReader(BytesIO(pdf_bytes))
+    return extract_pages(reader, 0, len(reader.pages))
+
+
+def extract_pages(reader, start: int, stop: int) -> List[str]:
+    """Return text for pages [start, stop); a page that fails to parse yields ""."""
+
     page_text: List[str] = []
-    for page in reader.pages:
-        text = page.extract_text() or ""
+    for page_idx in range(start, stop):
+        try:
+            text = reader.pages[page_idx].extract_text() or ""
+        except Exception as exc:
+            logger.warning("Text extraction failed on page %d: %s", page_idx + 1, exc)
+            text = ""
         page_text.append(text)
     return page_text
 
@@ -66,17 +81,17 @@ def normalize_text(text: str) -> str:
     return normalized
 
 
-def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
-    """Split large passages into overlapping chunks suitable for embeddings."""
+def chunk_spans(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[Tuple[int, str]]:
+    """Split text into overlapping chunks, returning (token offset, chunk) pairs."""
 
     tokens: List[str] = text.split()
-    chunks: List[str] = []
+    chunks: List[Tuple[int, str]] = []
     start = 0
 
     while start < len(tokens):
         end = min(start + chunk_size, len(tokens))
         chunk = " ".join(tokens[start:end])
-        chunks.append(chunk)
+        chunks.append((start, chunk))
         if end == len(tokens):
             break
         start = max(end - overlap, 0)
@@ -84,6 +99,12 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[st
     return chunks
 
 
+def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
+    """Split large passages into overlapping chunks suitable for embeddings."""
+
+    return [chunk for _, chunk in chunk_spans(text, chunk_size, overlap)]
+
+
 def build_document_chunks(
     source_path: Path,
     title: str,
@@ -91,6 +112,7 @@ def build_document_chunks(
     chunk_size: int = 1000,
     overlap: int = 200,
     metadata: Optional[dict] = None,
+    source_id: Optional[str] = None,
 ) -> List[DocumentChunk]:
     """Produce chunk objects with metadata ready for embedding + indexing."""
 
@@ -99,7 +121,7 @@ def build_document_chunks(
         normalized = normalize_text(raw_text)
         if not normalized:
             continue
-        for chunk in chunk_text(normalized, chunk_size, overlap):
+        for offset, chunk in chunk_spans(normalized, chunk_size, overlap):
             chunks.append(
                 DocumentChunk(
                     text=chunk,
@@ -107,21 +129,35 @@ def build_document_chunks(
                     source_path=source_path,
                     title=title,
                     metadata=metadata,
+                    source_id=source_id,
+                    offset=offset,
                 )
             )
     return chunks
 
 
-def ingest_pdf(path: Path, title: Optional[str] = None) -> List[DocumentChunk]:
-    """High-level ingestion entry point: load, extract, chunk, and annotate."""
+def ingest_pdf(
+    path: Path,
+    title: Optional[str] = None,
+    page_text: Optional[List[str]] = None,
+    source_id: Optional[str] = None,
+) -> List[DocumentChunk]:
+    """High-level ingestion entry point: load, extract, chunk, and annotate.
+
+    Pass `page_text` when pages were already extracted (e.g. by the parallel
+    extractor) to skip reading the file again.
+    """
 
-    pdf_bytes = load_pdf(path)
-    try:
-        page_text = extract_text_from_pdf(pdf_bytes)
-    except NotImplementedError:
-        # In the scaffold phase we simply propagate the error upward; production
-        # code will attempt OCR and merge results back into a page list.
-        raise
+    if page_text is None:
+        pdf_bytes = load_pdf(path)
+        try:
+            page_text = extract_text_from_pdf(pdf_bytes)
+        except NotImplementedError:
+            # In the scaffold phase we simply propagate the error upward; production
+            # code will attempt OCR and merge results back into a page list.
+            raise
 
     title = title or path.stem
-    return build_document_chunks(source_path=path, title=title, page_text=page_text)
+    return build_document_chunks(
+        source_path=path, title=title, page_text=page_text, source_id=source_id
+    )
@@ -0,0 +1,314 @@
+"""
+Staged Multi-File Ingestion Pipeline
+
+This module overlaps the ingestion stages across files: while one batch of
+chunks is being embedded, the next file is already being extracted and the
+previous batch is in flight to the bulk API. Stages are connected by bounded
+queues, so the slowest stage sets the pace and memory stays flat.
+
+Features:
+- Extraction/chunking, embedding and bulk-indexing stages on separate threads
+- Bounded hand-off queues (backpressure instead of unbounded buffering)
+- Concurrent bulk senders so HTTP round-trips overlap with encoding
+- Per-file finalization (stale chunk deletion, manifest record) after the
+  file's last batch is indexed; failed files are not recorded
+- Manifest checkpointed during the run and saved once at the end
+- Per-stage throughput, utilization and queue-depth metrics
+
+Pipeline Flow:
+1. extract: PDF text (optionally from a ParallelPdfExtractor), chunking, manifest diff
+2. embed: batched embedding into float32 vectors
+3. bulk: bulk requests to OpenSearch / the local engine
+
+Usage:
+    pipeline = StagedIngestionPipeline(embedder, client, 'docs', manifest=manifest)
+    results = pipeline.run(paths)
+    print(pipeline.metrics())
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .manifest import IngestionManifest
+from .parallel_extraction import ExtractedDocument, ParallelPdfExtractor
+from .pipeline import DocumentPlan, IngestionResult, finalize_document, plan_document
+from ..indexing.hybrid_indexer import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    EmbeddingModel,
+    IndexedDocument,
+    embed_texts,
+    iter_batches,
+    prepare_documents,
+)
+from ..indexing.opensearch_client import bulk_index_documents
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ("extract", "embed", "bulk")
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_BULK_WORKERS = 2
+
+_DONE = object()
+
+
+class StageMetrics:
+    """Thread-safe counters for one pipeline stage."""
+
+    def __init__(self, name: str, inbox: Optional[queue.Queue] = None) -> None:
+        self.name = name
+        self.inbox = inbox
+        self.items = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._lock = threading.Lock()
+
+    def record(self, items: int, seconds: float) -> None:
+        with self._lock:
+            self.items += items
+            self.batches += 1
+            self.busy_seconds += seconds
+            if self.inbox is not None:
+                self.max_queue_depth = max(self.max_queue_depth, self.inbox.qsize())
+
+    def snapshot(self, elapsed: float) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "items": self.items,
+                "batches": self.batches,
+                "busy_seconds": round(self.busy_seconds, 4),
+                "items_per_second": round(self.items / self.busy_seconds, 2) if self.busy_seconds else 0.0,
+                "utilization": round(self.busy_seconds / elapsed, 3) if elapsed else 0.0,
+                "queue_depth": self.inbox.qsize() if self.inbox is not None else 0,
+                "max_queue_depth": self.max_queue_depth,
+            }
+
+
+@dataclass
+class _FileState:
+    """Progress of one file through the embed and bulk stages."""
+
+    position: int
+    plan: DocumentPlan
+    pending_batches: int
+    error: Optional[str] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class _Batch:
+    file: _FileState
+    chunks: List[Any]
+    ids: List[str]
+    documents: Optional[List[IndexedDocument]] = None
+
+
+class StagedIngestionPipeline:
+    """
+    Ingest many files with extraction, embedding and bulk I/O overlapped.
+
+    Attributes:
+        embedding_model: Model used by the embedding stage
+        client: OpenSearch client (or LocalSearchEngine)
+        index_name: Target index
+        manifest: Optional ingestion manifest for incremental runs
+        extractor: Optional process-pool extractor feeding the extract stage
+        batch_size: Chunks per embedding call (and per bulk request)
+        queue_size: Capacity of each inter-stage queue, in batches
+        bulk_workers: Concurrent bulk sender threads
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        client: Any,
+        index_name: str,
+        manifest: Optional[IngestionManifest] = None,
+        extractor: Optional[ParallelPdfExtractor] = None,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        bulk_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> None:
+        if batch_size <= 0 or queue_size <= 0 or bulk_workers <= 0:
+            raise ValueError("batch_size, queue_size and bulk_workers must be positive integers")
+        self.embedding_model = embedding_model
+        self.client = client
+        self.index_name = index_name
+        self.manifest = manifest
+        self.extractor = extractor
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.bulk_workers = bulk_workers
+        self._stages: Dict[str, StageMetrics] = {name: StageMetrics(name) for name in PIPELINE_STAGES}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._results: Dict[int, IngestionResult] = {}
+        self._results_lock = threading.Lock()
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage throughput and queue depth for the current or last run."""
+
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+        return {name: stage.snapshot(elapsed) for name, stage in self._stages.items()}
+
+    def run(self, paths: Iterable[Path]) -> List[IngestionResult]:
+        """Ingest `paths` and return one result per file, in input order."""
+
+        embed_inbox: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        bulk_inbox: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._stages = {
+            "extract": StageMetrics("extract"),
+            "embed": StageMetrics("embed", embed_inbox),
+            "bulk": StageMetrics("bulk", bulk_inbox),
+        }
+        self._results = {}
+        self._started_at = time.perf_counter()
+        self._finished_at = None
+
+        threads = [
+            threading.Thread(target=self._extract_stage, args=(paths, embed_inbox), name="ingest-extract"),
+            threading.Thread(target=self._embed_stage, args=(embed_inbox, bulk_inbox), name="ingest-embed"),
+        ]
+        threads.extend(
+            threading.Thread(target=self._bulk_stage, args=(bulk_inbox,), name=f"ingest-bulk-{index}")
+            for index in range(self.bulk_workers)
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self._finished_at = time.perf_counter()
+        if self.manifest is not None:
+            self.manifest.save()
+        return [self._results[position] for position in sorted(self._results)]
+
+    def _documents(self, paths: Iterable[Path]) -> Iterable[ExtractedDocument]:
+        if self.extractor is not None:
+            return self.extractor.iter_documents(paths)
+        return (ExtractedDocument(Path(path), None) for path in paths)
+
+    def _set_result(self, position: int, result: IngestionResult) -> None:
+        with self._results_lock:
+            self._results[position] = result
+
+    def _extract_stage(self, paths: Iterable[Path], outbox: queue.Queue) -> None:
+        stage = self._stages["extract"]
+        try:
+            documents = iter(self._documents(paths))
+            position = 0
+            while True:
+                started = time.perf_counter()
+                try:
+                    path, page_text, stat, error = next(documents)
+                except StopIteration:
+                    break
+                if error is not None:
+                    self._set_result(position, IngestionResult(path=path, error=error))
+                    position += 1
+                    continue
+                try:
+                    plan = plan_document(
+                        path=path,
+                        index_name=self.index_name,
+                        page_text=page_text,
+                        manifest=self.manifest,
+                        stat=stat,
+                    )
+                except Exception as exc:
+                    logger.error("Failed to extract %s: %s", path, exc)
+                    self._set_result(position, IngestionResult(path=path, error=str(exc)))
+                    position += 1
+                    continue
+                stage.record(plan.total if plan is not None else 0, time.perf_counter() - started)
+
+                if plan is None:
+                    self._set_result(position, IngestionResult(path=path, skipped=True))
+                elif not plan.chunks:
+                    self._set_result(position, finalize_document(plan, self.client, self.index_name, self.manifest))
+                else:
+                    batches = list(
+                        zip(iter_batches(plan.chunks, self.batch_size), iter_batches(plan.ids, self.batch_size))
+                    )
+                    state = _FileState(position=position, plan=plan, pending_batches=len(batches))
+                    for chunks, ids in batches:
+                        outbox.put(_Batch(file=state, chunks=chunks, ids=ids))
+                position += 1
+        except Exception as exc:  # pragma: no cover - defensive: keep downstream stages draining
+            logger.error("Extraction stage stopped: %s", exc)
+        finally:
+            outbox.put(_DONE)
+
+    def _embed_stage(self, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        stage = self._stages["embed"]
+        try:
+            while (batch := inbox.get()) is not _DONE:
+                if batch.file.error is not None:
+                    self._batch_done(batch)
+                    continue
+                started = time.perf_counter()
+                try:
+                    embeddings = embed_texts(self.embedding_model, [chunk.text for chunk in batch.chunks])
+                    batch.documents = prepare_documents(batch.chunks, embeddings, ids=batch.ids)
+                except Exception as exc:
+                    self._batch_failed(batch, exc)
+                    continue
+                stage.record(len(batch.chunks), time.perf_counter() - started)
+                outbox.put(batch)
+        finally:
+            for _ in range(self.bulk_workers):
+                outbox.put(_DONE)
+
+    def _bulk_stage(self, inbox: queue.Queue) -> None:
+        stage = self._stages["bulk"]
+        while (batch := inbox.get()) is not _DONE:
+            if batch.file.error is None:
+                started = time.perf_counter()
+                try:
+                    bulk_index_documents(
+                        client=self.client,
+                        index_name=self.index_name,
+                        documents=[{"_id": doc.id, "_source": doc.body} for doc in batch.documents],
+                        chunk_size=len(batch.documents),
+                    )
+                except Exception as exc:
+                    self._batch_failed(batch, exc)
+                    continue
+                stage.record(len(batch.documents), time.perf_counter() - started)
+            self._batch_done(batch)
+
+    def _batch_failed(self, batch: _Batch, exc: Exception) -> None:
+        with batch.file.lock:
+            if batch.file.error is None:
+                logger.error("Failed to ingest %s: %s", batch.file.plan.path, exc)
+                batch.file.error = str(exc)
+        self._batch_done(batch)
+
+    def _batch_done(self, batch: _Batch) -> None:
+        """Finalize the file once its last batch has left the pipeline."""
+
+        state = batch.file
+        with state.lock:
+            state.pending_batches -= 1
+            if state.pending_batches:
+                return
+        if state.error is not None:
+            # Not recorded in the manifest, so the next run retries the whole file.
+            self._set_result(state.position, IngestionResult(path=state.plan.path, error=state.error))
+            return
+        try:
+            result = finalize_document(state.plan, self.client, self.index_name, self.manifest)
+        except Exception as exc:
+            logger.error("Failed to finalize %s: %s", state.plan.path, exc)
+            result = IngestionResult(path=state.plan.path, error=str(exc))
+        self._set_result(state.position, result)
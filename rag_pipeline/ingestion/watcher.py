@@ -0,0 +1,219 @@
+"""
+Directory Watcher for Continuous Ingestion
+
+This module turns file-system changes in a watched directory into ingestion
+queue events. It uses inotify (via watchdog) when available, so new PDFs are
+picked up within the debounce window, and falls back to a cheap
+`os.scandir` + mtime poll otherwise.
+
+Features:
+- watchdog (inotify / FSEvents / ReadDirectoryChangesW) event source
+- scandir + size/mtime polling fallback with no per-file hashing
+- Startup reconciliation against the ingestion manifest (catch-up after downtime)
+- Glob filtering on file names; directories and temp files ignored
+- Settle check so partially written files are deferred, not ingested
+
+Usage:
+    watcher = DirectoryWatcher(directory, "*.pdf", on_event=queue.put)
+    watcher.start()
+    ...
+    watcher.stop()
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from .manifest import IngestionManifest
+from .work_queue import DELETE, UPSERT, IngestionQueue
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+EventCallback = Callable[[str, str], None]
+Snapshot = Dict[str, Tuple[int, int]]
+
+DEFAULT_SETTLE_SECONDS = 2.0
+
+
+def scan_directory(directory: Path, pattern: str) -> Snapshot:
+    """Map each matching file's resolved path to its `(size, mtime_ns)`."""
+
+    snapshot: Snapshot = {}
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return snapshot
+    with entries:
+        for entry in entries:
+            if not fnmatch.fnmatch(entry.name, pattern):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[IngestionManifest.key(Path(entry.path))] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def diff_snapshots(previous: Snapshot, current: Snapshot) -> Dict[str, str]:
+    """Events (`upsert` / `delete`) that turn `previous` into `current`."""
+
+    events = {path: UPSERT for path, stat in current.items() if previous.get(path) != stat}
+    events.update({path: DELETE for path in previous.keys() - current.keys()})
+    return events
+
+
+def settle_delay(path: str | os.PathLike[str], quiet_seconds: float = DEFAULT_SETTLE_SECONDS) -> float:
+    """Seconds to wait before `path` has been untouched for `quiet_seconds`.
+
+    Returns 0 once the file looks fully written (or has vanished).
+    """
+
+    try:
+        modified = Path(path).stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+    return max(0.0, modified + quiet_seconds - time.time())
+
+
+def reconcile(
+    directory: Path,
+    pattern: str,
+    manifest: IngestionManifest,
+    index_name: str,
+    queue: IngestionQueue,
+) -> Snapshot:
+    """Queue whatever changed while nothing was watching; return the scan.
+
+    New or modified files (per the manifest's size/mtime record) are queued
+    for ingestion and manifest entries whose file disappeared for deletion.
+    """
+
+    directory = directory.expanduser().resolve()
+    snapshot = scan_directory(directory, pattern)
+    for path, (size, mtime_ns) in snapshot.items():
+        entry = manifest.get(Path(path))
+        if entry is None or entry.index_name != index_name or (entry.size, entry.mtime_ns) != (size, mtime_ns):
+            queue.put(path, UPSERT)
+    for source in manifest.sources(index_name):
+        if source not in snapshot and Path(source).is_relative_to(directory):
+            queue.put(source, DELETE)
+    return snapshot
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "DirectoryWatcher") -> None:
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event) -> None:
+        if not event.is_directory:
+            self.watcher.emit(event.src_path, UPSERT)
+
+    def on_modified(self, event) -> None:
+        if not event.is_directory:
+            self.watcher.emit(event.src_path, UPSERT)
+
+    def on_closed(self, event) -> None:
+        if not event.is_directory:
+            self.watcher.emit(event.src_path, UPSERT)
+
+    def on_deleted(self, event) -> None:
+        if not event.is_directory:
+            self.watcher.emit(event.src_path, DELETE)
+
+    def on_moved(self, event) -> None:
+        if not event.is_directory:
+            self.watcher.emit(event.src_path, DELETE)
+            self.watcher.emit(event.dest_path, UPSERT)
+
+
+class DirectoryWatcher:
+    """
+    Emit `(path, event)` callbacks for matching files in one directory.
+
+    Attributes:
+        directory: Directory to watch (not recursive)
+        pattern: Glob matched against file names
+        on_event: Callback receiving the resolved path and `upsert` / `delete`
+        interval: Poll interval in seconds for the scandir fallback
+        use_polling: Force the fallback even when watchdog is installed
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        pattern: str,
+        on_event: EventCallback,
+        interval: float = 5.0,
+        use_polling: bool = False,
+        snapshot: Optional[Snapshot] = None,
+    ) -> None:
+        self.directory = Path(directory).expanduser().resolve()
+        self.pattern = pattern
+        self.on_event = on_event
+        self.interval = interval
+        self.use_polling = use_polling or Observer is None
+        self._snapshot: Snapshot = dict(snapshot) if snapshot is not None else {}
+        self._stop = threading.Event()
+        self._observer = None
+        self._poller: Optional[threading.Thread] = None
+
+    @property
+    def mode(self) -> str:
+        return "polling" if self.use_polling else "watchdog"
+
+    def emit(self, path: str, event: str) -> None:
+        if not fnmatch.fnmatch(os.path.basename(path), self.pattern):
+            return
+        self.on_event(IngestionManifest.key(Path(path)), event)
+
+    def poll_once(self) -> None:
+        """Scan the directory once and emit events for anything that changed."""
+
+        current = scan_directory(self.directory, self.pattern)
+        for path, event in diff_snapshots(self._snapshot, current).items():
+            self.on_event(path, event)
+        self._snapshot = current
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll_once()
+            except Exception as exc:  # pragma: no cover - runtime logging only
+                logger.error("Directory scan of %s failed: %s", self.directory, exc)
+
+    def start(self) -> None:
+        self._stop.clear()
+        if self.use_polling:
+            self._poller = threading.Thread(target=self._poll_loop, name="ingest-poller", daemon=True)
+            self._poller.start()
+            return
+        self._observer = Observer()
+        self._observer.schedule(_WatchdogHandler(self), str(self.directory), recursive=False)
+        self._observer.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._poller is not None:
+            self._poller.join()
+            self._poller = None
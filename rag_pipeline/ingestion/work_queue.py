@@ -0,0 +1,304 @@
+"""
+Durable Ingestion Work Queue
+
+This module persists pending ingestion work in a local SQLite database so file
+events seen by the directory watcher survive crashes and restarts, and feeds
+them to a pool of ingestion worker threads.
+
+Features:
+- One row per source path; repeated events coalesce instead of piling up
+- Debouncing: every new event pushes the job's ready time forward
+- Events arriving while a job runs trigger exactly one follow-up run
+- Exponential retry backoff with a maximum attempt count
+- Crash resume: jobs left `running` are re-queued on startup
+- Worker pool that claims, runs and acknowledges jobs
+
+Usage:
+    queue = IngestionQueue('data/ingestion_queue.sqlite3')
+    queue.recover()
+    queue.put('/data/raw/report.pdf', delay=2.0)
+    with IngestionWorkerPool(queue, handle_job, workers=2):
+        ...
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+UPSERT = "upsert"
+DELETE = "delete"
+JOB_EVENTS = (UPSERT, DELETE)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    path TEXT PRIMARY KEY,
+    event TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    ready_at REAL NOT NULL,
+    generation INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (state, ready_at);
+"""
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """A claimed unit of work: ingest (`upsert`) or remove (`delete`) a path."""
+
+    path: str
+    event: str
+    generation: int
+    attempts: int
+
+
+class IngestionQueue:
+    """
+    SQLite-backed queue of per-path ingestion jobs.
+
+    Attributes:
+        path: Database file (``":memory:"`` for a non-durable queue)
+        max_attempts: Failures after which a job is parked as ``failed``
+        retry_delay: Base delay in seconds for exponential retry backoff
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ":memory:",
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def put(self, path: str | os.PathLike[str], event: str = UPSERT, delay: float = 0.0) -> None:
+        """Queue `event` for `path`, replacing any pending event for it.
+
+        The job becomes claimable `delay` seconds from now; a burst of events
+        for one file therefore runs once, after the burst goes quiet.
+        """
+
+        if event not in JOB_EVENTS:
+            raise ValueError(f"Unknown job event '{event}'. Expected one of {JOB_EVENTS}.")
+        with self._ready:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (path, event, ready_at) VALUES (?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    event = excluded.event,
+                    ready_at = excluded.ready_at,
+                    generation = generation + 1,
+                    attempts = 0,
+                    last_error = NULL,
+                    state = CASE WHEN state = 'running' THEN 'running' ELSE 'pending' END
+                """,
+                (str(path), event, time.time() + delay),
+            )
+            self._ready.notify()
+
+    def claim(self, timeout: Optional[float] = None) -> Optional[QueuedJob]:
+        """Take the next ready job, waiting up to `timeout` seconds for one."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._ready:
+            while True:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT path, event, generation, attempts FROM jobs "
+                    "WHERE state = 'pending' AND ready_at <= ? ORDER BY ready_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE jobs SET state = 'running' WHERE path = ?", (row[0],))
+                    return QueuedJob(*row)
+
+                next_ready = self._conn.execute(
+                    "SELECT MIN(ready_at) FROM jobs WHERE state = 'pending'"
+                ).fetchone()[0]
+                wait = None if next_ready is None else max(0.0, next_ready - now)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._ready.wait(wait)
+
+    def complete(self, job: QueuedJob) -> None:
+        """Acknowledge a job; re-queue it if a newer event arrived meanwhile."""
+
+        with self._ready:
+            deleted = self._conn.execute(
+                "DELETE FROM jobs WHERE path = ? AND generation = ?", (job.path, job.generation)
+            ).rowcount
+            if not deleted:
+                self._conn.execute("UPDATE jobs SET state = 'pending' WHERE path = ?", (job.path,))
+                self._ready.notify()
+
+    def defer(self, job: QueuedJob, delay: float) -> None:
+        """Return a job unprocessed, e.g. because its file is still being written."""
+
+        with self._ready:
+            self._conn.execute(
+                "UPDATE jobs SET state = 'pending', ready_at = MAX(ready_at, ?) WHERE path = ?",
+                (time.time() + delay, job.path),
+            )
+            self._ready.notify()
+
+    def fail(self, job: QueuedJob, error: BaseException | str) -> None:
+        """Record a failure and schedule a retry, or park the job as ``failed``."""
+
+        attempts = job.attempts + 1
+        parked = attempts >= self.max_attempts
+        with self._ready:
+            # A newer event supersedes the failed run: keep its schedule and budget.
+            self._conn.execute(
+                """
+                UPDATE jobs SET last_error = :error,
+                    attempts = CASE WHEN generation = :generation THEN :attempts ELSE attempts END,
+                    ready_at = CASE WHEN generation = :generation THEN :ready_at ELSE ready_at END,
+                    state = CASE WHEN generation = :generation AND :parked THEN 'failed' ELSE 'pending' END
+                WHERE path = :path
+                """,
+                {
+                    "error": str(error),
+                    "generation": job.generation,
+                    "attempts": attempts,
+                    "ready_at": time.time() + self.retry_delay * (2 ** job.attempts),
+                    "parked": parked,
+                    "path": job.path,
+                },
+            )
+            self._ready.notify()
+        if parked:
+            logger.error("Giving up on %s after %d attempts: %s", job.path, attempts, error)
+
+    def recover(self) -> int:
+        """Re-queue jobs a previous process was running when it stopped."""
+
+        with self._ready:
+            count = self._conn.execute(
+                "UPDATE jobs SET state = 'pending' WHERE state = 'running'"
+            ).rowcount
+            self._ready.notify_all()
+        if count:
+            logger.info("Resuming %d interrupted ingestion jobs", count)
+        return count
+
+    def retry_failed(self) -> int:
+        """Move parked jobs back to pending with a fresh attempt budget."""
+
+        with self._ready:
+            count = self._conn.execute(
+                "UPDATE jobs SET state = 'pending', attempts = 0, ready_at = ? WHERE state = 'failed'",
+                (time.time(),),
+            ).rowcount
+            self._ready.notify_all()
+        return count
+
+    def wake(self) -> None:
+        """Wake every waiting `claim` (used on shutdown)."""
+
+        with self._ready:
+            self._ready.notify_all()
+
+    def counts(self) -> dict:
+        """Number of jobs per state."""
+
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {state: count for state, count in rows}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE state != 'failed'").fetchone()[0]
+
+
+class IngestionWorkerPool:
+    """
+    Threads that drain an `IngestionQueue` through a job handler.
+
+    The handler returns normally on success, returns a positive number of
+    seconds to defer the job, or raises to have it retried with backoff.
+    """
+
+    def __init__(
+        self,
+        queue: IngestionQueue,
+        handler: Callable[[QueuedJob], Optional[float]],
+        workers: int = 2,
+        poll_interval: float = 1.0,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def __enter__(self) -> "IngestionWorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._stop.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"ingest-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop claiming new jobs and wait for in-flight ones to finish."""
+
+        self._stop.set()
+        self.queue.wake()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            job = self.queue.claim(timeout=self.poll_interval)
+            if job is None:
+                continue
+            try:
+                deferral = self.handler(job)
+            except Exception as exc:
+                logger.warning("Ingestion job %s %s failed: %s", job.event, job.path, exc)
+                self.queue.fail(job, exc)
+                continue
+            if deferral:
+                self.queue.defer(job, deferral)
+            else:
+                self.queue.complete(job)
@@ -0,0 +1,87 @@
+"""
+In-Process Metrics Primitives
+
+This module provides the small, thread-safe histogram used by the RAG
+pipeline's serving components to export latency and size distributions
+through the JSON status endpoint without pulling in a metrics client library.
+
+Features:
+- Fixed (non-cumulative) bucket counts with an overflow bucket
+- Count, sum, mean and max tracking
+- Approximate quantiles from bucket upper bounds
+- Thread-safe observation for concurrent Gradio sessions
+- Stats snapshot suitable for JSON status endpoints
+
+Usage:
+    latency = Histogram((1, 5, 10, 50, 100))
+    latency.observe(7.2)
+    print(latency.stats())
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any, Dict, List, Sequence
+
+LATENCY_MS_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+# LLM generation: time-to-first-token / full completion, and decode throughput.
+GENERATION_MS_BUCKETS = (50, 100, 250, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+TOKENS_PER_SECOND_BUCKETS = (1, 2, 5, 10, 20, 30, 50, 75, 100, 200)
+
+
+class Histogram:
+    """Bucketed distribution of observed values."""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_MS_BUCKETS) -> None:
+        if list(bounds) != sorted(bounds) or not bounds:
+            raise ValueError("Histogram bounds must be a non-empty ascending sequence")
+        self.bounds = tuple(bounds)
+        self._counts: List[int] = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the `q` quantile (max for overflow)."""
+
+        with self._lock:
+            if not self._count:
+                return 0.0
+            target = q * self._count
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= target and count:
+                    return float(self.bounds[index]) if index < len(self.bounds) else self._max
+            return self._max
+
+    def stats(self) -> Dict[str, Any]:
+        """Return bucket counts keyed by upper bound plus summary figures."""
+
+        with self._lock:
+            buckets = {f"le_{bound:g}": count for bound, count in zip(self.bounds, self._counts)}
+            buckets["overflow"] = self._counts[-1]
+            count, total, maximum = self._count, self._sum, self._max
+        return {
+            "count": count,
+            "mean": round(total / count, 4) if count else 0.0,
+            "max": round(maximum, 4),
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "buckets": buckets,
+        }
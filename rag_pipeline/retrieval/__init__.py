@@ -17,6 +17,8 @@ Features:
 
 Components:
 - HybridRetriever for multi-modal search
+- AsyncHybridRetriever for coroutine-based serving
+- Client-side score fusion (RRF, weighted min-max)
 - Reranker implementations (PassThrough, CrossEncoder)
 - Document scoring and ranking
 - Query processing pipeline
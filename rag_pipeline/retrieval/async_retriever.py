@@ -0,0 +1,129 @@
+"""
+Asyncio Hybrid Retrieval
+
+This module exposes the hybrid retrieval flow as coroutines so event-loop based
+servers (Gradio async handlers, FastAPI) can await OpenSearch instead of parking
+a worker thread on every search.
+
+Features:
+- Awaitable single and batched hybrid retrieval
+- Native async OpenSearch client support (AsyncOpenSearch)
+- Thread offloading for CPU-bound embedding and reranking
+- Query-vector cache hits served inline without a thread hop
+- Client-side fusion legs awaited concurrently
+- Graceful fallback to the blocking client when no async client exists
+
+Architecture:
+- AsyncSearchClient protocol for awaitable search backends
+- AsyncHybridRetriever wraps a HybridRetriever, reusing its query building,
+  embedding cache, response parsing and reranker configuration
+
+Usage:
+    retriever = HybridRetriever(client=sync_client, index_name='docs', query_embedder=embedder)
+    async_retriever = AsyncHybridRetriever(retriever, client=async_opensearch_client)
+    documents = await async_retriever.retrieve('machine learning', top_k=5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+from .reranker import RetrievedDocument, rerank_batch
+from .retriever import SEARCH_LEGS, HybridRetriever, documents_from_response
+
+
+class AsyncSearchClient(Protocol):
+    """Awaitable counterpart of `SearchClient`."""
+
+    async def search(self, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        ...
+
+
+@dataclass
+class AsyncHybridRetriever:
+    """Coroutine front-end for a configured `HybridRetriever`."""
+
+    retriever: HybridRetriever
+    client: Optional[AsyncSearchClient] = None
+
+    async def embed_query(self, query: str) -> np.ndarray:
+        """Return the query vector, encoding in a worker thread on cache misses."""
+
+        cached = self.retriever.cached_query_vector(query)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.retriever.embed_query_uncached, query)
+
+    async def search(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one search on the async client, or the sync client off-loop."""
+
+        if self.client is None:
+            return await asyncio.to_thread(
+                self.retriever.client.search, index=self.retriever.index_name, body=body
+            )
+        return await self.client.search(index=self.retriever.index_name, body=body)
+
+    async def _timed_search(self, leg: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return await self.search(body)
+        finally:
+            self.retriever.record_leg_timing(leg, (time.perf_counter() - start) * 1000.0)
+
+    async def hybrid_search(self, query: str, vector: np.ndarray) -> Dict[str, Any]:
+        """Run the hybrid search for one query in the retriever's fusion mode."""
+
+        if not self.retriever.fuses_client_side:
+            return await self.search(self.retriever.build_query(query, vector))
+
+        bodies = self.retriever.build_leg_queries(query, vector)
+        legs = await asyncio.gather(
+            *(self._timed_search(leg, body) for leg, body in zip(SEARCH_LEGS, bodies))
+        )
+        return self.retriever.fuse(legs)
+
+    async def retrieve(self, query: str, top_k: int = 5) -> List[RetrievedDocument]:
+        """Execute hybrid search, rerank results, and return top hits."""
+
+        vector = await self.embed_query(query)
+        raw = await self.hybrid_search(query, vector)
+        documents = documents_from_response(raw)
+        return await asyncio.to_thread(
+            self.retriever.reranker.rerank, query=query, documents=documents, top_k=top_k
+        )
+
+    async def retrieve_many(
+        self, queries: Sequence[str], top_k: int = 5
+    ) -> List[List[RetrievedDocument]]:
+        """Batched retrieval; searches for all queries are in flight concurrently."""
+
+        queries = list(queries)
+        if not queries:
+            return []
+
+        vectors = await asyncio.to_thread(self.retriever.embed_queries, queries)
+        responses = await asyncio.gather(
+            *(self.hybrid_search(query, vector) for query, vector in zip(queries, vectors))
+        )
+        documents = [documents_from_response(raw) for raw in responses]
+        return await asyncio.to_thread(
+            rerank_batch, self.retriever.reranker, queries, documents, top_k
+        )
+
+    async def retrieve_as_dicts(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """Helper returning LangChain-friendly dictionaries."""
+
+        docs = await self.retrieve(query=query, top_k=top_k)
+        return [
+            {
+                "page_content": doc.text,
+                "metadata": doc.metadata,
+                "score": doc.score,
+            }
+            for doc in docs
+        ]
@@ -0,0 +1,113 @@
+"""
+Client-Side Hybrid Score Fusion
+
+This module merges independently executed lexical (BM25) and dense (kNN) result
+lists in Python, so hybrid ranking no longer depends on an OpenSearch search
+pipeline with a normalization processor being configured on the cluster, and
+the configured BM25 / semantic weights take effect per request.
+
+Features:
+- Reciprocal-rank fusion (RRF) with per-leg weights
+- Weighted min-max score fusion
+- Vectorized scoring over a (legs x candidates) NumPy matrix
+- OpenSearch-shaped output so existing response parsing is reused
+
+Usage:
+    fused = fuse_responses(
+        [lexical_raw, knn_raw],
+        weights=[0.6, 0.4],
+        method="rrf",
+        size=20,
+    )
+    documents = documents_from_response(fused)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+FUSION_METHODS = ("rrf", "min_max")
+DEFAULT_RRF_K = 60
+
+
+def _hits(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return raw.get("hits", {}).get("hits", []) if raw else []
+
+
+def fusion_scores(
+    scores: np.ndarray,
+    present: np.ndarray,
+    weights: Sequence[float],
+    method: str = "rrf",
+    rrf_k: int = DEFAULT_RRF_K,
+) -> np.ndarray:
+    """Combine a (legs x candidates) score matrix into one score per candidate.
+
+    `present[i, j]` marks whether leg `i` returned candidate `j`; missing
+    entries contribute nothing to the fused score.
+    """
+
+    weight_column = np.asarray(weights, dtype=np.float64)[:, None]
+    if method == "rrf":
+        # Rank within each leg (1 = best); missing candidates sort last.
+        masked = np.where(present, scores, -np.inf)
+        ranks = np.empty_like(masked)
+        order = np.argsort(-masked, axis=1, kind="stable")
+        np.put_along_axis(ranks, order, np.arange(1, masked.shape[1] + 1, dtype=np.float64)[None, :], axis=1)
+        contributions = np.where(present, 1.0 / (rrf_k + ranks), 0.0)
+    elif method == "min_max":
+        masked_low = np.where(present, scores, np.inf).min(axis=1, keepdims=True)
+        masked_high = np.where(present, scores, -np.inf).max(axis=1, keepdims=True)
+        span = masked_high - masked_low
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normalized = np.where(span > 0, (scores - masked_low) / span, 1.0)
+        contributions = np.where(present, normalized, 0.0)
+    else:
+        raise ValueError(f"Unknown fusion method '{method}'. Expected one of {FUSION_METHODS}.")
+    return (weight_column * contributions).sum(axis=0)
+
+
+def fuse_responses(
+    responses: Sequence[Dict[str, Any]],
+    weights: Sequence[float],
+    method: str = "rrf",
+    size: int = 20,
+    rrf_k: int = DEFAULT_RRF_K,
+) -> Dict[str, Any]:
+    """Fuse per-leg search responses into a single OpenSearch-shaped response."""
+
+    if len(weights) != len(responses):
+        raise ValueError(f"Got {len(weights)} weights for {len(responses)} result lists")
+
+    columns: Dict[str, int] = {}
+    sources: List[Dict[str, Any]] = []
+    for raw in responses:
+        for hit in _hits(raw):
+            if hit.get("_id") not in columns:
+                columns[hit.get("_id")] = len(sources)
+                sources.append(hit)
+
+    if not sources:
+        return {"hits": {"hits": []}}
+
+    scores = np.zeros((len(responses), len(sources)), dtype=np.float64)
+    present = np.zeros_like(scores, dtype=bool)
+    for leg, raw in enumerate(responses):
+        for hit in _hits(raw):
+            column = columns[hit.get("_id")]
+            if not present[leg, column]:
+                scores[leg, column] = float(hit.get("_score") or 0.0)
+                present[leg, column] = True
+
+    fused = fusion_scores(scores, present, weights, method=method, rrf_k=rrf_k)
+    keep = min(size, fused.shape[0])
+    top = np.argpartition(-fused, keep - 1)[:keep] if keep < fused.shape[0] else np.arange(fused.shape[0])
+    top = top[np.argsort(-fused[top], kind="stable")]
+
+    return {
+        "hits": {
+            "hits": [{**sources[column], "_score": float(fused[column])} for column in top],
+        }
+    }
@@ -7,34 +7,62 @@ and lightweight heuristics for improved relevance ranking.
 
 Features:
 - Multiple reranking strategies (PassThrough, CrossEncoder)
-- Cross-encoder relevance scoring
+- Cross-encoder relevance scoring in one predict call per request, bounded batches
+- Per (query, passage text) score caching for repeated questions
+- Cascades of cheap-to-expensive stages under a latency budget
 - Lightweight heuristic reranking
 - Pluggable reranker architecture
 - Performance optimization
 - Document scoring normalization
 - Extensible reranker interface
+- Batched reranking across several queries
 - Production-ready implementations
 
 Reranker Types:
 - PassThroughReranker: Preserves original ordering (baseline)
 - CrossEncoderReranker: Deep learning relevance scoring
+- CascadeReranker: Staged reranking bounded by a per-request time budget
 - Custom rerankers: Extensible protocol-based interface
 
 Usage:
     # Basic pass-through reranking
     reranker = PassThroughReranker()
     
-    # Advanced cross-encoder reranking
-    reranker = CrossEncoderReranker(model_name='cross-encoder/model')
+    # Advanced cross-encoder reranking (model loads on first use)
+    reranker = CrossEncoderReranker(model_name='cross-encoder/ms-marco-MiniLM-L-6-v2')
     
+    # Keyword overlap trims to 10, cross-encoder orders those, within 120 ms
+    reranker = CascadeReranker(
+        stages=[CascadeStage(KeywordOverlapReranker(), keep=10), CascadeStage(CrossEncoderReranker(), keep=5)],
+        budget_ms=120,
+    )
+
     # Apply reranking
     ranked_docs = reranker.rerank(query='search text', documents=retrieved_docs)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Protocol, Sequence
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from ..cache import LRUCache
+
+try:
+    from sentence_transformers import CrossEncoder
+except ImportError:  # pragma: no cover - handled during runtime
+    CrossEncoder = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CROSS_ENCODER_BATCH_SIZE = 32
 
 
 @dataclass
@@ -44,6 +72,21 @@ class RetrievedDocument:
     text: str
     score: float
     metadata: dict
+    doc_id: Optional[str] = None
+
+    @property
+    def text_hash(self) -> str:
+        """Digest of the chunk text; changes whenever the passage is re-ingested with edits."""
+
+        return hashlib.sha1(self.text.encode("utf-8")).hexdigest()
+
+    @property
+    def chunk_key(self) -> str:
+        """Stable identifier for caching: the index `_id`, else a text digest."""
+
+        if self.doc_id:
+            return self.doc_id
+        return self.text_hash
 
 
 class Reranker(Protocol):
@@ -55,6 +98,28 @@ class Reranker(Protocol):
         ...
 
 
+def rerank_batch(
+    reranker: Reranker,
+    queries: Sequence[str],
+    documents: Sequence[Sequence[RetrievedDocument]],
+    top_k: int = 5,
+) -> List[List[RetrievedDocument]]:
+    """Rerank one result list per query, batching when the reranker supports it.
+
+    Rerankers that can score several queries in one pass expose a
+    ``rerank_many(queries, documents, top_k)`` method; the rest are applied
+    query by query.
+    """
+
+    batched = getattr(reranker, "rerank_many", None)
+    if callable(batched):
+        return batched(queries, documents, top_k=top_k)
+    return [
+        reranker.rerank(query=query, documents=docs, top_k=top_k)
+        for query, docs in zip(queries, documents)
+    ]
+
+
 class PassThroughReranker:
     """Default implementation that keeps the original retrieval order intact."""
 
@@ -80,29 +145,302 @@ class KeywordOverlapReranker:
             doc_tokens = set(doc.text.split())
             overlap = len(keywords & {token.lower() for token in doc_tokens})
             scored.append(
-                RetrievedDocument(
-                    text=doc.text,
-                    score=doc.score + overlap,
-                    metadata=doc.metadata,
-                )
+                replace(doc, score=doc.score + overlap)
             )
         scored.sort(key=lambda item: item.score, reverse=True)
         return scored[:top_k]
 
 
+def top_k_order(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the `top_k` highest scores, best first, via argpartition."""
+
+    if top_k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if top_k < scores.size:
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
 class CrossEncoderReranker:
-    """Placeholder for a future cross-encoder (e.g. sentence-transformers)."""
+    """Cross-encoder reranker (sentence-transformers) with score caching.
 
-    def __init__(self, model_name: str) -> None:
-        """Store model details; actual loading happens once we pick a backend."""
+    The model is loaded lazily on the first call. All uncached (query, passage)
+    pairs of a call, across every query in a batch, go to a single `predict`
+    call in forward batches of at most `batch_size` pairs, so a large
+    multi-query request cannot blow up activation memory. Scores are cached
+    per (query hash, passage text hash): a repeated query over the same
+    passages skips the forward pass, while a chunk re-ingested under the same
+    ID with new text is scored afresh.
+    """
 
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        device: Optional[str] = None,
+        max_length: int = 512,
+        cache_size: int = 8192,
+        cache_ttl_seconds: Optional[float] = None,
+        batch_size: int = DEFAULT_CROSS_ENCODER_BATCH_SIZE,
+    ) -> None:
+        """Store model details; the model itself loads on first use."""
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
         self.model_name = model_name
+        self.device = device
+        self.max_length = max_length
+        self.batch_size = batch_size
+        self._model = None
+        self._scores: LRUCache[float] = LRUCache(max_size=cache_size, ttl_seconds=cache_ttl_seconds)
+
+    def _ensure_model(self):
+        """Lazy-load the cross-encoder so import time stays light."""
+
+        if CrossEncoder is None:
+            raise ImportError(
+                "sentence-transformers must be installed to use cross-encoder reranking. "
+                "Install with: pip install sentence-transformers"
+            )
+        if self._model is None:
+            logger.info("Loading cross-encoder model: %s", self.model_name)
+            self._model = CrossEncoder(self.model_name, max_length=self.max_length, device=self.device)
+        return self._model
+
+    @staticmethod
+    def _query_hash(query: str) -> str:
+        normalized = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def rerank(
+        self, query: str, documents: Sequence[RetrievedDocument], top_k: int = 5
+    ) -> List[RetrievedDocument]:
+        """Score documents against the query and return the best `top_k`."""
+
+        return self.rerank_many([query], [documents], top_k=top_k)[0]
+
+    def rerank_many(
+        self,
+        queries: Sequence[str],
+        documents: Sequence[Sequence[RetrievedDocument]],
+        top_k: int = 5,
+    ) -> List[List[RetrievedDocument]]:
+        """Rerank several result lists with one forward pass over all cache misses."""
+
+        scores: List[np.ndarray] = []
+        pending: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        pairs: List[Tuple[str, str]] = []
+
+        for q_idx, (query, docs) in enumerate(zip(queries, documents)):
+            query_hash = self._query_hash(query)
+            row = np.empty(len(docs), dtype=np.float32)
+            for d_idx, doc in enumerate(docs):
+                key = (query_hash, doc.text_hash)
+                cached = self._scores.get(key)
+                if cached is not None:
+                    row[d_idx] = cached
+                    continue
+                if key not in pending:
+                    pending[key] = []
+                    pairs.append((query, doc.text))
+                pending[key].append((q_idx, d_idx))
+            scores.append(row)
+
+        if pairs:
+            model = self._ensure_model()
+            predicted = np.asarray(
+                model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False),
+                dtype=np.float32,
+            ).reshape(-1)
+            for (key, positions), value in zip(pending.items(), predicted):
+                self._scores.put(key, float(value))
+                for q_idx, d_idx in positions:
+                    scores[q_idx][d_idx] = value
+
+        results: List[List[RetrievedDocument]] = []
+        for docs, row in zip(documents, scores):
+            order = top_k_order(row, top_k)
+            results.append([replace(docs[idx], score=float(row[idx])) for idx in order])
+        return results
+
+    def cache_stats(self) -> Dict[str, object]:
+        """Expose score-cache counters for monitoring."""
+
+        return self._scores.stats()
+
+
+@dataclass
+class CascadeStage:
+    """One step of a cascade: a reranker and how many candidates it passes on."""
+
+    reranker: Reranker
+    keep: int
+    name: str = ""
+
+    def __post_init__(self) -> None:
+        if self.keep <= 0:
+            raise ValueError("CascadeStage.keep must be positive")
+        if not self.name:
+            self.name = type(self.reranker).__name__
+
+
+@dataclass
+class CascadeReranker:
+    """Chain cheap and expensive rerankers under a per-query latency budget.
+
+    Stages run in order, each narrowing the candidate list to its `keep`
+    size. Before starting a stage the cascade compares the remaining budget
+    with that stage's recent latency (an exponential moving average); when
+    the stage would not fit, or the budget is already spent, the cascade stops
+    and returns the best ordering produced so far.
+
+    A stage's first call is not measured, since it pays one-off costs such as
+    the cross-encoder's lazy model load. A stage skipped `probe_every` times
+    in a row runs once anyway as a probe, and its estimate is reset to the
+    probe's latency, so one slow call cannot lock a stage out for good.
+
+    `budget_ms` and the latency estimates are per query: a batch of N queries
+    gets N times the budget, and a batched stage call is recorded as its
+    elapsed time divided by N.
+    """
+
+    stages: Sequence[CascadeStage]
+    budget_ms: float = 150.0
+    smoothing: float = 0.2
+    probe_every: int = 20
+    clock: Callable[[], float] = time.perf_counter
+    _latency_ms: Dict[int, float] = field(default_factory=dict, init=False, repr=False)
+    _runs: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _skipped: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _probes: int = field(default=0, init=False, repr=False)
+    _stopped_before: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _completed: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.stages:
+            raise ValueError("CascadeReranker requires at least one stage")
+
+    def _fits_budget(self, stage_idx: int, remaining_ms: float, queries: int = 1) -> bool:
+        """Whether the stage's expected latency for `queries` fits in what is left of the budget."""
+
+        expected_ms = self._latency_ms.get(stage_idx, 0.0) * queries
+        return remaining_ms > 0 and expected_ms <= remaining_ms
+
+    def _probe_due(self, stage_idx: int) -> bool:
+        """Count a skip of the stage; True when it should run anyway to re-measure."""
+
+        with self._lock:
+            skipped = self._skipped.get(stage_idx, 0) + 1
+            if skipped > self.probe_every:
+                self._skipped[stage_idx] = 0
+                self._probes += 1
+                return True
+            self._skipped[stage_idx] = skipped
+            return False
+
+    def _record(self, stage_idx: int, elapsed_ms: float, probe: bool = False) -> None:
+        with self._lock:
+            runs = self._runs.get(stage_idx, 0) + 1
+            self._runs[stage_idx] = runs
+            self._skipped[stage_idx] = 0
+            if runs == 1:
+                return  # first call includes warm-up (e.g. model load)
+            previous = self._latency_ms.get(stage_idx)
+            self._latency_ms[stage_idx] = (
+                elapsed_ms if previous is None or probe
+                else (1 - self.smoothing) * previous + self.smoothing * elapsed_ms
+            )
+
+    def _stopped(self, stage_idx: int) -> None:
+        name = self.stages[stage_idx].name
+        with self._lock:
+            self._stopped_before[name] = self._stopped_before.get(name, 0) + 1
+        logger.debug("Cascade budget of %.0f ms exhausted before stage '%s'", self.budget_ms, name)
+
+    def _stage_keep(self, stage_idx: int, top_k: int) -> int:
+        if stage_idx == len(self.stages) - 1:
+            return top_k
+        return max(self.stages[stage_idx].keep, top_k)
 
     def rerank(
         self, query: str, documents: Sequence[RetrievedDocument], top_k: int = 5
     ) -> List[RetrievedDocument]:
-        """Stub that reminds us to implement cross-encoder scoring."""
+        """Run the cascade for one query and return the best `top_k` documents."""
+
+        return self.rerank_many([query], [documents], top_k=top_k)[0]
+
+    def rerank_many(
+        self,
+        queries: Sequence[str],
+        documents: Sequence[Sequence[RetrievedDocument]],
+        top_k: int = 5,
+    ) -> List[List[RetrievedDocument]]:
+        """Run each stage across all queries at once, within `budget_ms` per query."""
+
+        started = self.clock()
+        count = max(1, len(queries))
+        current = [list(docs) for docs in documents]
+        for stage_idx, stage in enumerate(self.stages):
+            remaining_ms = self.budget_ms * count - (self.clock() - started) * 1000.0
+            probe = False
+            if not self._fits_budget(stage_idx, remaining_ms, count):
+                probe = remaining_ms > 0 and self._probe_due(stage_idx)
+                if not probe:
+                    self._stopped(stage_idx)
+                    break
+            stage_start = self.clock()
+            current = rerank_batch(
+                stage.reranker, queries, current, top_k=self._stage_keep(stage_idx, top_k)
+            )
+            self._record(stage_idx, (self.clock() - stage_start) * 1000.0 / count, probe=probe)
+        else:
+            with self._lock:
+                self._completed += 1
+
+        return [docs[:top_k] for docs in current]
+
+    def stats(self) -> Dict[str, Any]:
+        """Stage latency estimates and how often the budget cut the cascade short."""
+
+        with self._lock:
+            return {
+                "budget_ms": self.budget_ms,
+                "completed": self._completed,
+                "probes": self._probes,
+                "stopped_before": dict(self._stopped_before),
+                "stage_latency_ms": {
+                    self.stages[idx].name: round(value, 2) for idx, value in self._latency_ms.items()
+                },
+            }
+
+
+def build_reranker(kind: str = "passthrough", **options: Any) -> Reranker:
+    """Create a reranker from a configuration name.
+
+    Supported kinds: ``passthrough``, ``keyword``, ``cross_encoder`` and
+    ``cascade`` (keyword overlap trimming to ``cascade_keep`` candidates,
+    then the cross-encoder, within ``budget_ms``). Cross-encoders take
+    ``model_name``, ``device`` and ``batch_size`` options.
+    """
+
+    cross_encoder_options = {k: v for k, v in options.items() if k in {"model_name", "device", "batch_size"}}
 
-        raise NotImplementedError(
-            "Cross-encoder reranking requires model integration."
+    kind = (kind or "passthrough").lower()
+    if kind == "passthrough":
+        return PassThroughReranker()
+    if kind == "keyword":
+        return KeywordOverlapReranker()
+    if kind == "cross_encoder":
+        return CrossEncoderReranker(**cross_encoder_options)
+    if kind == "cascade":
+        cross_encoder = CrossEncoderReranker(**cross_encoder_options)
+        return CascadeReranker(
+            stages=[
+                CascadeStage(KeywordOverlapReranker(), keep=int(options.get("cascade_keep", 10))),
+                CascadeStage(cross_encoder, keep=int(options.get("cascade_keep", 10))),
+            ],
+            budget_ms=float(options.get("budget_ms", 150.0)),
         )
+    raise ValueError(f"Unknown reranker kind: {kind}")
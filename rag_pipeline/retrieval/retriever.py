@@ -9,9 +9,12 @@ Features:
 - Hybrid BM25 + vector similarity search
 - Configurable retrieval weights (BM25 vs semantic)
 - Multiple reranker integration
-- Query embedding optimization
+- Query embedding optimization (float32 vectors, serialized once by the client)
+- Shared query-vector cache (LRU + TTL) with hit-rate stats
 - OpenSearch protocol integration
 - Flexible top-k retrieval
+- Batched multi-query retrieval via the _msearch API
+- Optional client-side fusion (RRF / weighted min-max) with per-leg timings
 - Document scoring and ranking
 - Production-ready error handling
 
@@ -28,14 +31,38 @@ Usage:
         reranker=CrossEncoderReranker()
     )
     results = retriever.retrieve('machine learning', top_k=5)
+
+    # Evaluation-style batches: one encode call and one _msearch round trip
+    batches = retriever.retrieve_many(['query one', 'query two'], top_k=5)
+
+    # Run BM25 and kNN separately and fuse them in Python with configured weights
+    retriever = HybridRetriever(..., fusion='rrf', bm25_weight=0.6, semantic_weight=0.4)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Protocol
+import logging
+import statistics
+import threading
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+from ..cache import LRUCache
+from .fusion import DEFAULT_RRF_K, FUSION_METHODS, fuse_responses
+from .reranker import PassThroughReranker, Reranker, RetrievedDocument, rerank_batch
+
+logger = logging.getLogger(__name__)
 
-from .reranker import PassThroughReranker, Reranker, RetrievedDocument
+DEFAULT_QUERY_CACHE_SIZE = 1024
+DEFAULT_QUERY_CACHE_TTL_SECONDS = 3600.0
+LEG_TIMING_WINDOW = 512
+SEARCH_LEGS = ("bm25", "knn")
 
 
 class SearchClient(Protocol):
@@ -45,6 +72,13 @@ class SearchClient(Protocol):
         ...
 
 
+class MultiSearchClient(SearchClient, Protocol):
+    """Search clients that can also answer several searches in one request."""
+
+    def msearch(self, body: List[Dict[str, Any]], index: Optional[str] = None) -> Dict[str, Any]:
+        ...
+
+
 class QueryEmbeddingModel(Protocol):
     """Protocol for models that transform a text query into an embedding vector."""
 
@@ -52,6 +86,50 @@ class QueryEmbeddingModel(Protocol):
         ...
 
 
+def documents_from_response(raw: Dict[str, Any]) -> List[RetrievedDocument]:
+    """Convert an OpenSearch search response into retrieved documents."""
+
+    hits = raw.get("hits", {}).get("hits", [])
+    return [
+        RetrievedDocument(
+            text=hit["_source"]["text"],
+            score=hit.get("_score", 0.0),
+            metadata={
+                **hit["_source"].get("metadata", {}),
+                "page_numbers": hit["_source"].get("page_numbers", []),
+                "title": hit["_source"].get("title"),
+            },
+            doc_id=hit.get("_id"),
+        )
+        for hit in hits
+    ]
+
+
+def normalize_query(text: str) -> str:
+    """Canonical form used as the query-vector cache key."""
+
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def as_query_vector(vector: Iterable[float] | np.ndarray) -> np.ndarray:
+    """Return `vector` as a read-only float32 array (no copy if it already is one)."""
+
+    array = np.asarray(vector, dtype=np.float32)
+    if array.flags.writeable:
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+def default_query_cache() -> LRUCache[np.ndarray]:
+    """Build the bounded query-vector cache used when none is supplied."""
+
+    return LRUCache(
+        max_size=DEFAULT_QUERY_CACHE_SIZE,
+        ttl_seconds=DEFAULT_QUERY_CACHE_TTL_SECONDS,
+    )
+
+
 @dataclass
 class HybridRetriever:
     """Coordinates sparse + dense retrieval and optional reranking."""
@@ -63,9 +141,34 @@ class HybridRetriever:
     hybrid_size: int = 20
     knn_field: str = "embedding"
     knn_k: int = 20
+    query_cache: Optional[LRUCache[np.ndarray]] = field(default_factory=default_query_cache)
+    fusion: str = "server"
+    bm25_weight: float = 0.5
+    semantic_weight: float = 0.5
+    rrf_k: int = DEFAULT_RRF_K
+    _leg_timings: Dict[str, Deque[float]] = field(init=False, repr=False)
+    _leg_executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    _leg_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.fusion not in ("server", *FUSION_METHODS):
+            raise ValueError(
+                f"Unknown fusion mode '{self.fusion}'. Expected 'server' or one of {FUSION_METHODS}."
+            )
+        self._leg_timings = {
+            name: deque(maxlen=LEG_TIMING_WINDOW) for name in (*SEARCH_LEGS, "fusion")
+        }
 
-    def build_query(self, query: str, vector: Iterable[float]) -> Dict[str, Any]:
-        """Return the hybrid search body sent to OpenSearch."""
+    @property
+    def fuses_client_side(self) -> bool:
+        return self.fusion != "server"
+
+    def build_query(self, query: str, vector: Iterable[float] | np.ndarray) -> Dict[str, Any]:
+        """Return the hybrid search body sent to OpenSearch.
+
+        The vector is embedded as-is (an ndarray stays an ndarray); the
+        client's serializer converts it when the request is written.
+        """
 
         return {
             "size": self.hybrid_size,
@@ -76,7 +179,7 @@ class HybridRetriever:
                         {
                             "knn": {
                                 self.knn_field: {
-                                    "vector": list(vector),
+                                    "vector": vector,
                                     "k": self.knn_k,
                                 }
                             }
@@ -86,34 +189,206 @@ class HybridRetriever:
             },
         }
 
-    def embed_query(self, query: str) -> List[float]:
-        """Delegate to the configured embedding model for query vectors."""
+    def build_leg_queries(self, query: str, vector: Iterable[float] | np.ndarray) -> List[Dict[str, Any]]:
+        """Return the separate BM25 and kNN bodies used for client-side fusion."""
+
+        return [
+            {"size": self.hybrid_size, "query": {"match": {"text": {"query": query}}}},
+            {
+                "size": self.knn_k,
+                "query": {"knn": {self.knn_field: {"vector": vector, "k": self.knn_k}}},
+            },
+        ]
+
+    def fuse(self, responses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fuse BM25 and kNN responses with the configured method and weights."""
 
-        return self.query_embedder.embed_query(query)
+        start = time.perf_counter()
+        fused = fuse_responses(
+            responses,
+            weights=[self.bm25_weight, self.semantic_weight],
+            method=self.fusion,
+            size=self.hybrid_size,
+            rrf_k=self.rrf_k,
+        )
+        self.record_leg_timing("fusion", (time.perf_counter() - start) * 1000.0)
+        return fused
+
+    def record_leg_timing(self, leg: str, elapsed_ms: float) -> None:
+        self._leg_timings[leg].append(elapsed_ms)
+
+    def leg_stats(self) -> Dict[str, Any]:
+        """Mean / p95 latency per search leg over the recent timing window."""
+
+        stats: Dict[str, Any] = {"fusion": self.fusion}
+        for leg, samples in self._leg_timings.items():
+            values = sorted(samples)
+            if not values:
+                continue
+            stats[f"{leg}_ms"] = {
+                "count": len(values),
+                "mean": round(statistics.fmean(values), 3),
+                "p95": round(values[min(len(values) - 1, int(0.95 * len(values)))], 3),
+            }
+        return stats
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._leg_lock:
+            if self._leg_executor is None:
+                self._leg_executor = ThreadPoolExecutor(
+                    max_workers=len(SEARCH_LEGS) * 4, thread_name_prefix="hybrid-leg"
+                )
+            return self._leg_executor
+
+    def _timed_search(self, leg: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return self.client.search(index=self.index_name, body=body)
+        finally:
+            self.record_leg_timing(leg, (time.perf_counter() - start) * 1000.0)
+
+    def search(self, query: str, vector: Iterable[float] | np.ndarray) -> Dict[str, Any]:
+        """Run the hybrid search for one query in the configured fusion mode."""
+
+        if not self.fuses_client_side:
+            return self.client.search(index=self.index_name, body=self.build_query(query, vector))
+
+        bodies = self.build_leg_queries(query, vector)
+        futures = [
+            self._executor().submit(self._timed_search, leg, body)
+            for leg, body in zip(SEARCH_LEGS, bodies)
+        ]
+        return self.fuse([future.result() for future in futures])
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Return the query vector, serving repeated questions from the cache."""
+
+        cached = self.cached_query_vector(query)
+        if cached is not None:
+            return cached
+        return self.embed_query_uncached(query)
+
+    def cached_query_vector(self, query: str) -> Optional[np.ndarray]:
+        """Return the cached vector for `query` without touching the model."""
+
+        if self.query_cache is None:
+            return None
+        return self.query_cache.get(normalize_query(query))
+
+    def embed_query_uncached(self, query: str) -> np.ndarray:
+        """Run the embedding model for `query` and remember the result."""
+
+        embed_array = getattr(self.query_embedder, "embed_query_array", None)
+        if callable(embed_array):
+            vector = as_query_vector(embed_array(query))
+        else:
+            vector = as_query_vector(self.query_embedder.embed_query(query))
+        if self.query_cache is not None:
+            self.query_cache.put(normalize_query(query), vector)
+        return vector
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Expose query-vector cache counters for status endpoints."""
+
+        if self.query_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.query_cache.stats()}
+
+    def embed_queries(self, queries: Sequence[str]) -> List[np.ndarray]:
+        """Return vectors for several queries, encoding all cache misses in one batch."""
+
+        vectors: List[Optional[np.ndarray]] = [None] * len(queries)
+        missing: Dict[str, List[int]] = {}
+        for idx, query in enumerate(queries):
+            cached = self.cached_query_vector(query)
+            if cached is not None:
+                vectors[idx] = cached
+            else:
+                missing.setdefault(query, []).append(idx)
+
+        if missing:
+            pending = list(missing)
+            batch_embed = getattr(self.query_embedder, "embed_queries_array", None)
+            if not callable(batch_embed):
+                batch_embed = getattr(self.query_embedder, "embed_queries", None)
+            if callable(batch_embed):
+                encoded = batch_embed(pending)
+            else:
+                encoded = [self.query_embedder.embed_query(query) for query in pending]
+            for query, raw_vector in zip(pending, encoded):
+                vector = as_query_vector(raw_vector)
+                if self.query_cache is not None:
+                    self.query_cache.put(normalize_query(query), vector)
+                for idx in missing[query]:
+                    vectors[idx] = vector
+
+        return vectors  # type: ignore[return-value]
+
+    def search_many(self, bodies: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send several search bodies, using one _msearch request when available."""
+
+        msearch = getattr(self.client, "msearch", None)
+        if not callable(msearch):
+            return [self.client.search(index=self.index_name, body=body) for body in bodies]
+
+        payload: List[Dict[str, Any]] = []
+        for body in bodies:
+            payload.append({"index": self.index_name})
+            payload.append(body)
+        raw = msearch(body=payload, index=self.index_name)
+        responses = raw.get("responses", [])
+        if len(responses) != len(bodies):
+            raise RuntimeError(
+                f"_msearch returned {len(responses)} responses for {len(bodies)} queries"
+            )
+
+        results: List[Dict[str, Any]] = []
+        for position, response in enumerate(responses):
+            if response.get("error"):
+                logger.warning("Search %d in _msearch batch failed: %s", position, response["error"])
+                results.append({})
+            else:
+                results.append(response)
+        return results
 
     def retrieve(self, query: str, top_k: int = 5) -> List[RetrievedDocument]:
         """Execute hybrid search, rerank results, and return top hits."""
 
         query_vector = self.embed_query(query)
-        body = self.build_query(query, query_vector)
-        raw = self.client.search(index=self.index_name, body=body)
-        hits = raw.get("hits", {}).get("hits", [])
-
-        documents = [
-            RetrievedDocument(
-                text=hit["_source"]["text"],
-                score=hit.get("_score", 0.0),
-                metadata={
-                    **hit["_source"].get("metadata", {}),
-                    "page_numbers": hit["_source"].get("page_numbers", []),
-                    "title": hit["_source"].get("title"),
-                },
-            )
-            for hit in hits
-        ]
+        raw = self.search(query, query_vector)
+        documents = documents_from_response(raw)
 
         return self.reranker.rerank(query=query, documents=documents, top_k=top_k)
 
+    def retrieve_many(
+        self, queries: Sequence[str], top_k: int = 5
+    ) -> List[List[RetrievedDocument]]:
+        """Retrieve for a batch of queries with one encode call and one _msearch.
+
+        Results come back in the same order as `queries`.
+        """
+
+        queries = list(queries)
+        if not queries:
+            return []
+
+        vectors = self.embed_queries(queries)
+        if self.fuses_client_side:
+            # Both legs of every query travel in the same _msearch request.
+            bodies = [
+                body
+                for query, vector in zip(queries, vectors)
+                for body in self.build_leg_queries(query, vector)
+            ]
+            legs = self.search_many(bodies)
+            responses = [self.fuse(legs[i : i + 2]) for i in range(0, len(legs), 2)]
+        else:
+            bodies = [self.build_query(query, vector) for query, vector in zip(queries, vectors)]
+            responses = self.search_many(bodies)
+        documents = [documents_from_response(raw) for raw in responses]
+
+        return rerank_batch(self.reranker, queries, documents, top_k=top_k)
+
     def retrieve_as_dicts(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Helper returning LangChain-friendly dictionaries."""
 
@@ -0,0 +1,77 @@
+"""
+Application Settings Loader
+
+This module reads `configs/app_settings.yaml`, expanding shell-style
+`${VAR:-default}` placeholders from the environment, so runtime components can
+take tuning values (retrieval weights, cache TTLs, Ollama options) from the same
+file the deployment and A/B tooling already write.
+
+Features:
+- `${VAR}` and `${VAR:-default}` expansion in string values
+- Numeric and boolean coercion of fully substituted values
+- Dotted-path lookups with defaults
+- Missing or unreadable files degrade to an empty mapping
+
+Usage:
+    settings = load_app_settings()
+    bm25_weight = get_setting(settings, 'rag.retrieval.bm25_weight', 0.5)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS_PATH = Path(__file__).resolve().parent.parent / "configs" / "app_settings.yaml"
+
+_PLACEHOLDER = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}")
+
+
+def expand_env(value: Any) -> Any:
+    """Recursively substitute `${VAR:-default}` placeholders in strings."""
+
+    if isinstance(value, dict):
+        return {key: expand_env(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [expand_env(item) for item in value]
+    if not isinstance(value, str) or "${" not in value:
+        return value
+
+    expanded = _PLACEHOLDER.sub(lambda match: os.getenv(match.group(1), match.group(2) or ""), value)
+    # Re-parse so "${OPENSEARCH_PORT:-9200}" becomes 9200 rather than "9200".
+    try:
+        parsed = yaml.safe_load(expanded) if expanded else expanded
+    except yaml.YAMLError:
+        return expanded
+    return parsed if isinstance(parsed, (int, float, bool)) else expanded
+
+
+def load_app_settings(path: Optional[str | os.PathLike[str]] = None) -> Dict[str, Any]:
+    """Load and env-expand the application settings file."""
+
+    settings_path = Path(path or os.getenv("APP_SETTINGS_PATH") or DEFAULT_SETTINGS_PATH)
+    try:
+        with settings_path.open("r", encoding="utf-8") as handle:
+            raw = yaml.safe_load(handle) or {}
+    except (OSError, yaml.YAMLError) as exc:
+        logger.warning("Could not load settings from %s (%s); using defaults.", settings_path, exc)
+        return {}
+    return expand_env(raw)
+
+
+def get_setting(settings: Dict[str, Any], dotted_path: str, default: Any = None) -> Any:
+    """Return `settings['a']['b']` for `'a.b'`, or `default` when absent."""
+
+    node: Any = settings
+    for part in dotted_path.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
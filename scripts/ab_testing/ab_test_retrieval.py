@@ -47,7 +47,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from rag_pipeline.retrieval.retriever import HybridRetriever
-from rag_pipeline.retrieval.reranker import CrossEncoderReranker, PassThroughReranker
+from rag_pipeline.retrieval.reranker import PassThroughReranker, build_reranker
 from rag_pipeline.embeddings.sentence_transformer import SentenceTransformerEmbeddings
 
 
@@ -123,11 +123,14 @@ class ABTestFramework:
             
             # Setup reranker
             reranker_type = config.get('reranker', 'passthrough')
-            if reranker_type == 'cross_encoder':
-                reranker = CrossEncoderReranker(
-                    model_name=config.get('reranker_model', 'ms-marco-MiniLM-L-6-v2')
+            try:
+                reranker = build_reranker(
+                    reranker_type,
+                    model_name=config.get('reranker_model', 'cross-encoder/ms-marco-MiniLM-L-6-v2'),
+                    budget_ms=config.get('reranker_budget_ms', 150),
+                    cascade_keep=config.get('cascade_keep', 10),
                 )
-            else:
+            except ValueError:
                 reranker = PassThroughReranker()
             
             # Setup retriever
@@ -25,6 +25,7 @@ from rag_pipeline.indexing.opensearch_client import (
     create_client,
     ensure_index,
 )
+from rag_pipeline.indexing.vector_storage import load_vector_codec, storage_mapping
 
 
 def load_schema(schema_path: Path) -> dict:
@@ -93,7 +94,8 @@ def bootstrap_indices(index_names: list[str]) -> None:
     
     # Load schema
     schema_path = PROJECT_ROOT / "rag_pipeline" / "indexing" / "schema.json"
-    schema = load_schema(schema_path)
+    # VECTOR_CODEC_DIR switches the embedding field to reduced / quantized storage.
+    schema = storage_mapping(load_schema(schema_path), load_vector_codec())
     
     # Connect and create indices
     try:
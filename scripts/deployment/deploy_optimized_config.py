@@ -73,7 +73,10 @@ def deploy_optimized_configuration():
             'bm25_weight': new_config.get('bm25_weight', 0.6),
             'semantic_weight': new_config.get('semantic_weight', 0.4), 
             'top_k_retrieval': new_config.get('top_k_retrieval', 25),
-            'top_k_final': new_config.get('top_k_final', 5)
+            'top_k_final': new_config.get('top_k_final', 5),
+            'fusion': new_config.get(
+                'fusion', app_config['rag'].get('retrieval', {}).get('fusion', 'rrf')
+            ),
         }
         
         # Add optimization metadata
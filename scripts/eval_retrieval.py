@@ -13,7 +13,7 @@ Features:
 - Command-line interface for quick testing
 - JSON output for integration
 - Simple metric computation
-- Fast evaluation cycles
+- Fast evaluation cycles (batched embedding + _msearch retrieval)
 
 Usage:
     # Evaluate retrieval quality with standard metrics
@@ -24,6 +24,9 @@ Usage:
     
     # Custom top-k evaluation
     python scripts/eval_retrieval.py queries.jsonl --top-k 10 --detailed
+
+    # Larger retrieval batches for big query sets
+    python scripts/eval_retrieval.py data/evaluation/scale_test_set.jsonl --batch-size 64
 """
 
 from __future__ import annotations
@@ -118,38 +121,44 @@ def evaluate_queries(
     retriever: HybridRetriever,
     queries: Iterable[Dict[str, str]],
     top_k: int,
+    batch_size: int = 32,
 ) -> Dict[str, float]:
     """Run retrieval evaluation across a set of labelled queries."""
 
     precisions: List[float] = []
     mrrs: List[float] = []
     miss_counter: Counter[str] = Counter()
-
-    for sample in queries:
-        question = sample["question"]
-        expected = sample.get("expected_answer_snippet") or ""
-        relevant_keywords = sample.get("keywords", [])
-
-        docs = retriever.retrieve(question, top_k=top_k)
-        relevances: List[bool] = []
-        for doc in docs:
-            text = doc.text.lower()
-            hit = False
-            if expected and expected.lower() in text:
-                hit = True
-            else:
-                for keyword in relevant_keywords:
-                    if keyword.lower() in text:
-                        hit = True
-                        break
-            relevances.append(hit)
-
-        if not relevances:
-            miss_counter[question] += 1
-            continue
-
-        precisions.append(precision_at_k(relevances, top_k))
-        mrrs.append(mean_reciprocal_rank(relevances))
+    samples = list(queries)
+
+    for start in range(0, len(samples), max(batch_size, 1)):
+        batch = samples[start:start + max(batch_size, 1)]
+        questions = [sample["question"] for sample in batch]
+        batch_docs = retriever.retrieve_many(questions, top_k=top_k)
+
+        for sample, docs in zip(batch, batch_docs):
+            question = sample["question"]
+            expected = sample.get("expected_answer_snippet") or ""
+            relevant_keywords = sample.get("keywords", [])
+
+            relevances: List[bool] = []
+            for doc in docs:
+                text = doc.text.lower()
+                hit = False
+                if expected and expected.lower() in text:
+                    hit = True
+                else:
+                    for keyword in relevant_keywords:
+                        if keyword.lower() in text:
+                            hit = True
+                            break
+                relevances.append(hit)
+
+            if not relevances:
+                miss_counter[question] += 1
+                continue
+
+            precisions.append(precision_at_k(relevances, top_k))
+            mrrs.append(mean_reciprocal_rank(relevances))
 
     return {
         "precision@k": sum(precisions) / len(precisions) if precisions else 0.0,
@@ -175,11 +184,17 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         default=5,
         help="Number of documents to retrieve for evaluation.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Queries embedded and searched per _msearch request.",
+    )
     args = parser.parse_args(argv)
 
     retriever = ensure_retriever(index_name=args.index)
     queries = load_queries(args.dataset)
-    metrics = evaluate_queries(retriever, queries, top_k=args.top_k)
+    metrics = evaluate_queries(retriever, queries, top_k=args.top_k, batch_size=args.batch_size)
     print(json.dumps(metrics, indent=2))
 
 
@@ -6,24 +6,24 @@ for new PDF documents and automatically processes them through the RAG ingestion
 pipeline with real-time document indexing.
 
 Features:
-- Real-time directory monitoring
-- Automatic PDF detection and processing
-- Duplicate file handling
-- Error recovery and retry mechanisms
-- Configurable watch directories
-- Batch processing optimization
-- Status logging and monitoring
+- Event-driven directory monitoring (inotify via watchdog, scandir polling fallback)
+- Durable SQLite work queue; interrupted jobs resume after a crash or restart
+- Debouncing and settle checks for partially written files
+- Pool of ingestion workers draining the queue concurrently
+- Duplicate file handling via a persistent manifest (survives restarts)
+- Incremental re-indexing of edited files and cleanup of deleted ones
+- Retries with exponential backoff for failed files
 - Graceful shutdown handling
 
 Usage:
     # Watch directory for automatic PDF ingestion
-    python scripts/ingest_watch.py --watch-dir /path/to/pdfs --index quest-research
-    
-    # Monitor with custom polling interval
-    python scripts/ingest_watch.py --watch-dir ./documents --interval 30
-    
-    # Batch processing mode
-    python scripts/ingest_watch.py --watch-dir ./pdfs --batch-size 10 --index docs
+    python scripts/ingest_watch.py --directory /path/to/pdfs --index quest-research
+
+    # Force the polling fallback with a custom scan interval
+    python scripts/ingest_watch.py --directory ./documents --polling --interval 10
+
+    # More workers, longer debounce for slow network copies
+    python scripts/ingest_watch.py --directory ./pdfs --workers 4 --debounce 5
 """
 
 from __future__ import annotations
@@ -33,22 +33,37 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Set
+from typing import Optional
 
 from dotenv import load_dotenv
 
-from rag_pipeline.embeddings.sentence_transformer import (
-    SentenceTransformerEmbeddings,
-)
+from rag_pipeline.embeddings.backends import build_embedder
 from rag_pipeline.indexing.opensearch_client import (
     OpenSearchConfig,
     create_client,
     ensure_index,
 )
-from rag_pipeline.ingestion.pipeline import ingest_and_index_document
+from rag_pipeline.indexing.vector_storage import (
+    EncodedEmbeddings,
+    VectorCodec,
+    load_vector_codec,
+    storage_mapping,
+)
+from rag_pipeline.ingestion.manifest import IngestionManifest
+from rag_pipeline.ingestion.pipeline import ingest_and_index_document, remove_indexed_document
+from rag_pipeline.ingestion.watcher import DirectoryWatcher, reconcile, settle_delay
+from rag_pipeline.ingestion.work_queue import (
+    DELETE,
+    IngestionQueue,
+    IngestionWorkerPool,
+    QueuedJob,
+)
+
+DEFAULT_MANIFEST_PATH = "data/ingestion_manifest.json"
+DEFAULT_QUEUE_PATH = "data/ingestion_queue.sqlite3"
 
 
-def ensure_opensearch(index_name: str) -> any:
+def ensure_opensearch(index_name: str, codec: Optional[VectorCodec] = None) -> any:
     host = os.getenv("OPENSEARCH_HOST")
     if not host:
         raise RuntimeError("OPENSEARCH_HOST environment variable is required.")
@@ -66,7 +81,7 @@ def ensure_opensearch(index_name: str) -> any:
     schema_path = Path(__file__).resolve().parents[1] / "rag_pipeline" / "indexing" / "schema.json"
     if schema_path.exists():
         schema = json.loads(schema_path.read_text())
-        ensure_index(client, index_name, schema)
+        ensure_index(client, index_name, storage_mapping(schema, codec))
 
     return client
 
@@ -76,34 +91,84 @@ def ingest_directory(
     pattern: str,
     index_name: str,
     sleep_interval: int,
+    manifest_path: Path = Path(DEFAULT_MANIFEST_PATH),
+    queue_path: Path = Path(DEFAULT_QUEUE_PATH),
+    workers: int = 2,
+    debounce: float = 2.0,
+    use_polling: bool = False,
 ) -> None:
-    seen: Set[Path] = set()
+    manifest = IngestionManifest.load(manifest_path)
+    queue = IngestionQueue(queue_path)
+    queue.recover()
     embedder_name = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
-    embedder = SentenceTransformerEmbeddings(model_name=embedder_name)
-    client = ensure_opensearch(index_name)
+    embedder = build_embedder(
+        os.getenv("EMBEDDING_BACKEND"),
+        model_name=embedder_name,
+        cache_dir=os.getenv("EMBEDDING_CACHE_DIR") or None,
+    )
+    codec = load_vector_codec()
+    if codec is not None:
+        embedder = EncodedEmbeddings(embedder, codec)
+    client = ensure_opensearch(index_name, codec)
+
+    def handle(job: QueuedJob) -> Optional[float]:
+        path = Path(job.path)
+        if job.event == DELETE or not path.exists():
+            deleted = remove_indexed_document(path, client, index_name, manifest)
+            if deleted:
+                print(f"[ok] Removed {deleted} chunks for deleted file {path}")
+            return None
+        # Still being written (or copied): try again once it has been quiet.
+        wait = settle_delay(path, debounce)
+        if wait:
+            return wait
+        if manifest.stat_matches(path, index_name):
+            return None
+        result = ingest_and_index_document(
+            path=path,
+            embedding_model=embedder,
+            opensearch_client=client,
+            index_name=index_name,
+            manifest=manifest,
+        )
+        if not result.skipped:
+            print(
+                f"[ok] Ingested {path.name}: {result.indexed} indexed, "
+                f"{result.unchanged} unchanged, {result.deleted} deleted"
+            )
+        return None
 
     directory = directory.expanduser().resolve()
-    print(f"Watching {directory} for pattern '{pattern}'...")
+    snapshot = reconcile(directory, pattern, manifest, index_name, queue)
+    watcher = DirectoryWatcher(
+        directory,
+        pattern,
+        on_event=lambda path, event: queue.put(path, event, delay=debounce),
+        interval=sleep_interval,
+        use_polling=use_polling,
+        snapshot=snapshot,
+    )
+    print(
+        f"Watching {directory} for pattern '{pattern}' ({watcher.mode}, {workers} workers, "
+        f"{len(queue)} queued; manifest: {manifest_path}, queue: {queue_path})..."
+    )
 
+    pool = IngestionWorkerPool(queue, handle, workers=workers)
+    pool.start()
+    watcher.start()
     try:
         while True:
-            for path in directory.glob(pattern):
-                if path in seen:
-                    continue
-                try:
-                    ingest_and_index_document(
-                        path=path,
-                        embedding_model=embedder,
-                        opensearch_client=client,
-                        index_name=index_name,
-                    )
-                    seen.add(path)
-                    print(f"[ok] Ingested {path.name}")
-                except Exception as exc:  # pragma: no cover - runtime logging only
-                    print(f"[error] Failed to ingest {path}: {exc}")
-            time.sleep(sleep_interval)
+            # Workers checkpoint as they finish files; this flushes the tail
+            # once the directory goes quiet.
+            time.sleep(manifest.save_interval)
+            manifest.checkpoint()
     except KeyboardInterrupt:
         print("Interrupted; stopping watcher.")
+    finally:
+        watcher.stop()
+        pool.stop()
+        manifest.save()
+        queue.close()
 
 
 def main() -> None:
@@ -126,7 +191,24 @@ def main() -> None:
         "--interval",
         type=int,
         default=int(os.getenv("INGESTION_POLL_INTERVAL", "30")),
-        help="Polling interval in seconds",
+        help="Scan interval in seconds for the polling fallback",
+    )
+    parser.add_argument(
+        "--polling",
+        action="store_true",
+        help="Use scandir polling even when watchdog (inotify) is available",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=float(os.getenv("INGESTION_DEBOUNCE_SECONDS", "2")),
+        help="Seconds a file must be quiet before it is ingested",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("INGESTION_WORKERS", "2")),
+        help="Concurrent ingestion workers",
     )
     parser.add_argument(
         "--index",
@@ -134,6 +216,18 @@ def main() -> None:
         default=os.getenv("OPENSEARCH_INDEX", "quest-research"),
         help="Target OpenSearch index",
     )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=Path(os.getenv("INGESTION_MANIFEST_PATH", DEFAULT_MANIFEST_PATH)),
+        help="Ingestion manifest used to skip unchanged files across restarts",
+    )
+    parser.add_argument(
+        "--queue",
+        type=Path,
+        default=Path(os.getenv("INGESTION_QUEUE_PATH", DEFAULT_QUEUE_PATH)),
+        help="SQLite work queue; pending jobs resume from here after a restart",
+    )
     args = parser.parse_args()
 
     ingest_directory(
@@ -141,6 +235,11 @@ def main() -> None:
         pattern=args.pattern,
         index_name=args.index,
         sleep_interval=args.interval,
+        manifest_path=args.manifest,
+        queue_path=args.queue,
+        workers=args.workers,
+        debounce=args.debounce,
+        use_polling=args.polling,
     )
 
 
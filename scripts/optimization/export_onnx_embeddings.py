@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+ONNX Embedding Export and Parity Benchmark
+==========================================
+
+Exports a sentence-transformer model to ONNX (optionally int8-quantized),
+verifies the ONNX vectors against PyTorch (cosine >= threshold) and compares
+cold start, resident memory and per-query latency of both backends.
+
+Each backend is measured in a fresh subprocess so cold start and RSS are not
+polluted by the other backend's imports.
+
+Usage:
+    python scripts/optimization/export_onnx_embeddings.py \\
+        --model all-MiniLM-L6-v2 \\
+        --output-dir data/cache/onnx \\
+        --output results/onnx_embedding_benchmark.json
+
+    # fp32 export only, stricter parity gate
+    python scripts/optimization/export_onnx_embeddings.py --no-quantize --threshold 0.999
+"""
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rag_pipeline.embeddings.onnx_backend import (
+    PARITY_THRESHOLD,
+    OnnxEmbeddings,
+    check_parity,
+    export_onnx_model,
+    model_slug,
+)
+from rag_pipeline.embeddings.sentence_transformer import SentenceTransformerEmbeddings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SAMPLE_TEXTS = [
+    "What is retrieval-augmented generation?",
+    "Hybrid search combines BM25 lexical matching with dense vector similarity.",
+    "Quarterly revenue grew 12% year over year, driven by subscription renewals.",
+    "The transformer encoder maps each token to a contextual embedding.",
+    "Results",
+    "Table 3 reports precision@5 and recall@10 for every configuration tested "
+    "across the three evaluation datasets, with confidence intervals.",
+]
+
+# Runs in a fresh interpreter: load backend, embed one query, report timings + RSS.
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import psutil
+from rag_pipeline.embeddings.backends import build_embedder
+import os
+os.environ.update({env!r})
+embedder = build_embedder({backend!r}, {model!r})
+embedder.embed_query("warm up")
+cold_start = time.perf_counter() - start
+latencies = []
+for text in {texts!r} * {repeats}:
+    t0 = time.perf_counter()
+    embedder.embed_query(text)
+    latencies.append((time.perf_counter() - t0) * 1000.0)
+latencies.sort()
+print(json.dumps({{
+    "cold_start_s": cold_start,
+    "rss_mb": psutil.Process().memory_info().rss / (1024 * 1024),
+    "query_ms_p50": latencies[len(latencies) // 2],
+    "query_ms_p95": latencies[int(0.95 * (len(latencies) - 1))],
+}}))
+"""
+
+
+def probe_backend(backend: str, model: str, env: Dict[str, str], repeats: int) -> Dict[str, float]:
+    """Measure one backend in a separate Python process."""
+
+    code = _PROBE.format(
+        root=str(PROJECT_ROOT), env=env, backend=backend, model=model, texts=SAMPLE_TEXTS, repeats=repeats
+    )
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export embeddings to ONNX and benchmark against PyTorch")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="Sentence-transformer model name")
+    parser.add_argument("--output-dir", default="data/cache/onnx", help="Parent directory for exported models")
+    parser.add_argument("--no-quantize", action="store_true", help="Serve fp32 ONNX weights instead of int8")
+    parser.add_argument("--threshold", type=float, default=PARITY_THRESHOLD, help="Minimum cosine vs PyTorch")
+    parser.add_argument("--texts", type=Path, help="Optional file with one parity text per line")
+    parser.add_argument("--repeats", type=int, default=20, help="Latency samples per text")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    quantize = not args.no_quantize
+    model_dir = Path(args.output_dir) / model_slug(args.model)
+    started = time.perf_counter()
+    export_onnx_model(args.model, model_dir, quantize=quantize)
+    logger.info(f"Export finished in {time.perf_counter() - started:.1f}s")
+
+    texts: List[str] = SAMPLE_TEXTS
+    if args.texts:
+        texts = [line.strip() for line in args.texts.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    onnx_embedder = OnnxEmbeddings(args.model, onnx_dir=args.output_dir, quantize=quantize, auto_export=False)
+    torch_embedder = SentenceTransformerEmbeddings(args.model, device="cpu")
+    parity = check_parity(onnx_embedder, torch_embedder, texts, threshold=args.threshold)
+    logger.info(f"Parity: min cosine {parity['min_cosine']} (threshold {args.threshold})")
+
+    env = {"ONNX_MODEL_DIR": args.output_dir, "ONNX_QUANTIZE": str(quantize).lower()}
+    report = {
+        "model": args.model,
+        "quantized": quantize,
+        "model_path": str(onnx_embedder.model_path),
+        "parity": parity,
+        "torch": probe_backend("torch", args.model, env, args.repeats),
+        "onnx": probe_backend("onnx", args.model, env, args.repeats),
+    }
+    for metric in ("cold_start_s", "rss_mb", "query_ms_p50"):
+        before, after = report["torch"][metric], report["onnx"][metric]
+        report.setdefault("improvement", {})[metric] = round(1 - after / before, 4) if before else None
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if not parity["passed"]:
+        logger.error(f"ONNX parity check failed: min cosine {parity['min_cosine']} < {args.threshold}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
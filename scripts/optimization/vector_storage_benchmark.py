@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Vector Storage Recall-vs-Size Benchmark
+=======================================
+
+Compares reduced-dimension (PCA / truncation) and quantized (fp16 / byte)
+vector storage against the full-precision float32 index. Recall@k is measured
+against exact float32 cosine top-k over the same corpus, alongside bytes per
+vector, the estimated HNSW memory footprint and exact-search latency.
+
+With --opensearch every mode is also built as a real index on the cluster
+(OPENSEARCH_HOST), so store size, kNN `took` latency and recall come from the
+engine that serves production traffic.
+
+Usage:
+    python scripts/optimization/vector_storage_benchmark.py \\
+        --corpus data/evaluation/corpus.jsonl \\
+        --modes float32 fp16 byte pca:128 pca:128+byte \\
+        --output results/vector_storage_benchmark.json
+
+    # Reuse cached embeddings and measure real indices
+    python scripts/optimization/vector_storage_benchmark.py --corpus corpus.txt \\
+        --embeddings data/cache/corpus_vectors.npy --opensearch
+
+    # Fit and save the codec picked for production (then set VECTOR_CODEC_DIR)
+    python scripts/optimization/vector_storage_benchmark.py --corpus corpus.txt \\
+        --export pca:128+byte --codec-dir data/cache/vector_codec
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rag_pipeline.embeddings.backends import build_embedder
+from rag_pipeline.indexing.vector_storage import VectorCodec, VectorStorageSpec, storage_mapping
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODES = ["float32", "fp16", "byte", "pca:192", "pca:128", "pca:128+byte", "truncate:192"]
+SCHEMA_PATH = PROJECT_ROOT / "rag_pipeline" / "indexing" / "schema.json"
+
+
+def load_texts(path: Path) -> List[str]:
+    """One text per line, or JSON lines with a ``text`` field."""
+
+    texts = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if path.suffix == ".jsonl":
+            line = json.loads(line).get("text", "")
+        if line:
+            texts.append(line)
+    return texts
+
+
+def exact_top_k(matrix: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Row indices of the k highest dot products per query, best first."""
+
+    scores = queries @ matrix.T
+    k = min(k, matrix.shape[0])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(scores, top, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(top, order, axis=1)
+
+
+def recall_at_k(truth: np.ndarray, found: np.ndarray) -> float:
+    hits = [len(set(expected) & set(got)) / len(expected) for expected, got in zip(truth, found)]
+    return float(np.mean(hits)) if hits else 0.0
+
+
+def _percentile_ms(samples: Sequence[float], q: float) -> float:
+    return round(float(np.percentile(samples, q)) * 1000.0, 3) if samples else 0.0
+
+
+def evaluate_mode(
+    spec: VectorStorageSpec,
+    corpus: np.ndarray,
+    queries: np.ndarray,
+    truth: Dict[int, np.ndarray],
+    fit_sample: int,
+) -> Dict[str, Any]:
+    """Fit the codec, encode corpus and queries, and score exact search on stored vectors."""
+
+    rng = np.random.default_rng(0)
+    sample = corpus[rng.choice(len(corpus), size=min(fit_sample, len(corpus)), replace=False)]
+    codec = VectorCodec(spec).fit(sample)
+    stored = codec.decode(codec.encode(corpus))
+    encoded_queries = codec.decode(codec.encode(queries))
+
+    latencies = []
+    for query in encoded_queries:
+        started = time.perf_counter()
+        exact_top_k(stored, query[None, :], max(truth))
+        latencies.append(time.perf_counter() - started)
+
+    return {
+        "mode": spec.label,
+        "dimension": codec.dimension,
+        "bytes_per_vector": codec.bytes_per_vector(),
+        "vector_mb": round(codec.bytes_per_vector() * len(corpus) / 2**20, 3),
+        "estimated_hnsw_mb": round(codec.estimated_index_bytes(len(corpus)) / 2**20, 3),
+        "recall": {f"@{k}": round(recall_at_k(ids, exact_top_k(stored, encoded_queries, k)), 4) for k, ids in truth.items()},
+        "exact_search_ms_p50": _percentile_ms(latencies, 50),
+        "codec": codec,
+    }
+
+
+def _opensearch_client():
+    from rag_pipeline.indexing.opensearch_client import OpenSearchConfig, create_client
+
+    host = os.getenv("OPENSEARCH_HOST")
+    if not host:
+        raise RuntimeError("OPENSEARCH_HOST is not set; --opensearch needs a cluster.")
+    return create_client(
+        OpenSearchConfig(
+            host=host,
+            username=os.getenv("OPENSEARCH_USERNAME", ""),
+            password=os.getenv("OPENSEARCH_PASSWORD", ""),
+            index_name="",
+            tls_verify=os.getenv("OPENSEARCH_TLS_VERIFY", "true").lower() not in {"false", "0"},
+        )
+    )
+
+
+def measure_opensearch(
+    client: Any,
+    codec: VectorCodec,
+    corpus: np.ndarray,
+    queries: np.ndarray,
+    truth: Dict[int, np.ndarray],
+    index_prefix: str,
+    keep: bool,
+) -> Dict[str, Any]:
+    """Build a real index for `codec`, then measure store size, kNN latency and recall."""
+
+    from rag_pipeline.indexing.opensearch_client import bulk_index_documents, ensure_index
+
+    index_name = f"{index_prefix}-{codec.spec.label.replace(':', '-').replace('+', '-')}"
+    if client.indices.exists(index=index_name):
+        client.indices.delete(index=index_name)
+    ensure_index(client, index_name, storage_mapping(json.loads(SCHEMA_PATH.read_text()), codec))
+
+    stored = codec.encode(corpus)
+    documents = ({"_id": str(row), "_source": {"text": "", "embedding": vector}} for row, vector in enumerate(stored))
+    bulk_index_documents(client, index_name, documents)
+    client.indices.refresh(index=index_name)
+    client.indices.forcemerge(index=index_name, max_num_segments=1)
+
+    k = max(truth)
+    took, found = [], []
+    for query in codec.encode(queries):
+        response = client.search(
+            index=index_name,
+            body={"size": k, "_source": False, "query": {"knn": {"embedding": {"vector": query, "k": k}}}},
+        )
+        took.append(response.get("took", 0) / 1000.0)
+        found.append([int(hit["_id"]) for hit in response["hits"]["hits"]])
+
+    stats = client.indices.stats(index=index_name, metric="store")
+    store_bytes = stats["indices"][index_name]["total"]["store"]["size_in_bytes"]
+    report = {
+        "index": index_name,
+        "store_mb": round(store_bytes / 2**20, 3),
+        "knn_took_ms_p50": _percentile_ms(took, 50),
+        "knn_took_ms_p95": _percentile_ms(took, 95),
+        "recall": {
+            f"@{cutoff}": round(recall_at_k(ids, [row[:cutoff] for row in found]), 4) for cutoff, ids in truth.items()
+        },
+    }
+    if not keep:
+        client.indices.delete(index=index_name)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recall vs size for reduced / quantized vector storage")
+    parser.add_argument("--corpus", type=Path, required=True, help="Text file (one chunk per line) or .jsonl with 'text'")
+    parser.add_argument("--queries", type=Path, help="Query file (defaults to sampled corpus chunks)")
+    parser.add_argument("--num-queries", type=int, default=200, help="Queries sampled from the corpus without --queries")
+    parser.add_argument("--embeddings", type=Path, help="Cache corpus vectors in this .npy file")
+    parser.add_argument("--model", default=os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2"))
+    parser.add_argument("--backend", default=os.getenv("EMBEDDING_BACKEND"), help="Embedding backend (torch | onnx)")
+    parser.add_argument("--modes", nargs="+", default=DEFAULT_MODES, help="Storage specs, e.g. fp16 byte pca:128+byte")
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10, 25], help="Recall cutoffs")
+    parser.add_argument("--fit-sample", type=int, default=5000, help="Vectors used to fit PCA / byte scale")
+    parser.add_argument("--opensearch", action="store_true", help="Also build and query real indices on OPENSEARCH_HOST")
+    parser.add_argument("--index-prefix", default="vector-storage-bench", help="Index name prefix for --opensearch")
+    parser.add_argument("--keep-indices", action="store_true", help="Do not delete --opensearch indices afterwards")
+    parser.add_argument("--export", help="Fit this spec on the corpus and save it to --codec-dir instead of benchmarking")
+    parser.add_argument("--codec-dir", type=Path, default=Path("data/cache/vector_codec"))
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    texts = load_texts(args.corpus)
+    embedder = build_embedder(args.backend, model_name=args.model)
+    if args.embeddings and args.embeddings.exists():
+        corpus = np.load(args.embeddings)
+    else:
+        started = time.perf_counter()
+        corpus = np.asarray(embedder.embed_documents_array(texts), dtype=np.float32)
+        logger.info(f"Embedded {len(texts)} chunks in {time.perf_counter() - started:.1f}s")
+        if args.embeddings:
+            args.embeddings.parent.mkdir(parents=True, exist_ok=True)
+            np.save(args.embeddings, corpus)
+
+    if args.export:
+        rng = np.random.default_rng(0)
+        sample = corpus[rng.choice(len(corpus), size=min(args.fit_sample, len(corpus)), replace=False)]
+        codec = VectorCodec(VectorStorageSpec.parse(args.export)).fit(sample)
+        codec.save(args.codec_dir)
+        logger.info(f"Saved {codec} to {args.codec_dir}; set VECTOR_CODEC_DIR and re-create the index")
+        return 0
+
+    if args.queries:
+        query_texts = load_texts(args.queries)
+    else:
+        rng = np.random.default_rng(1)
+        picks = rng.choice(len(texts), size=min(args.num_queries, len(texts)), replace=False)
+        query_texts = [" ".join(texts[idx].split()[:16]) for idx in picks]
+    queries = np.stack([np.asarray(embedder.embed_query(text), dtype=np.float32) for text in query_texts])
+
+    unit_corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    unit_queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = {k: exact_top_k(unit_corpus, unit_queries, k) for k in sorted(args.k)}
+
+    client = _opensearch_client() if args.opensearch else None
+    results: List[Dict[str, Any]] = []
+    for mode in args.modes:
+        spec = VectorStorageSpec.parse(mode)
+        result = evaluate_mode(spec, corpus, queries, truth, args.fit_sample)
+        codec: Optional[VectorCodec] = result.pop("codec")
+        if client is not None:
+            result["opensearch"] = measure_opensearch(
+                client, codec, corpus, queries, truth, args.index_prefix, args.keep_indices
+            )
+        logger.info(f"{spec.label:<16} {result['bytes_per_vector']:>5} B/vector  recall {result['recall']}")
+        results.append(result)
+
+    baseline = next((result for result in results if result["mode"] == "float32"), None)
+    if baseline is not None:
+        for result in results:
+            result["size_vs_float32"] = round(result["bytes_per_vector"] / baseline["bytes_per_vector"], 4)
+
+    report = {
+        "model": args.model,
+        "corpus_size": len(corpus),
+        "queries": len(queries),
+        "source_dimension": int(corpus.shape[1]),
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
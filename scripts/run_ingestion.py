@@ -8,12 +8,16 @@ and parallel processing optimization.
 Features:
 - Batch PDF document processing
 - Automatic index clearing and management
-- Parallel processing support
+- Parallel processing support (process-pool PDF extraction via --workers)
+- Core-pinned multi-process embedding for large backfills (--embed-workers)
+- Pipelined stages: extraction, embedding and bulk requests overlap across files
+- Per-stage throughput and queue-depth report at the end of a run
 - Progress tracking and logging
 - Error handling and recovery
 - Metadata extraction integration
 - Configurable processing parameters
-- Resume capability for interrupted jobs
+- Resume capability for interrupted jobs (persistent ingestion manifest)
+- Reduced-dimension / quantized vector storage when VECTOR_CODEC_DIR is set
 
 Usage:
     # Ingest PDFs with automatic index clearing
@@ -24,6 +28,9 @@ Usage:
     
     # Parallel processing with custom workers
     python scripts/run_ingestion.py pdfs/ --workers 4 --batch-size 10
+
+    # Large backfill: four embedding processes, each pinned to its own cores
+    python scripts/run_ingestion.py pdfs/ --embed-workers 4
 """
 
 from __future__ import annotations
@@ -33,7 +40,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 from dotenv import load_dotenv
 
@@ -44,20 +51,35 @@ if str(PROJECT_ROOT) not in sys.path:
 
 load_dotenv(PROJECT_ROOT / ".env", override=False)
 
-from rag_pipeline.embeddings.sentence_transformer import (
-    SentenceTransformerEmbeddings,
-)
+from rag_pipeline.embeddings.backends import build_embedder
+from rag_pipeline.embeddings.process_pool import EmbeddingProcessPool
 from rag_pipeline.indexing.opensearch_client import (
     OpenSearchConfig,
     create_client,
     ensure_index,
 )
-from rag_pipeline.ingestion.pipeline import ingest_and_index_document
+from rag_pipeline.indexing.hybrid_indexer import DEFAULT_EMBED_BATCH_SIZE
+from rag_pipeline.indexing.vector_storage import (
+    EncodedEmbeddings,
+    VectorCodec,
+    load_vector_codec,
+    storage_mapping,
+)
+from rag_pipeline.ingestion.parallel_extraction import (
+    DEFAULT_PAGES_PER_TASK,
+    ParallelPdfExtractor,
+)
+from rag_pipeline.ingestion.manifest import IngestionManifest
+from rag_pipeline.ingestion.staged_pipeline import (
+    DEFAULT_BULK_WORKERS,
+    DEFAULT_QUEUE_SIZE,
+    StagedIngestionPipeline,
+)
 
 SCHEMA_PATH = Path(__file__).resolve().parent.parent / "rag_pipeline" / "indexing" / "schema.json"
 
 
-def _ensure_client(index_name: str):
+def _ensure_client(index_name: str, codec: Optional[VectorCodec] = None):
     host = os.getenv("OPENSEARCH_HOST")
     if not host:
         raise RuntimeError("OPENSEARCH_HOST is not set. Unable to connect to OpenSearch.")
@@ -77,31 +99,103 @@ def _ensure_client(index_name: str):
     client = create_client(config)
     if SCHEMA_PATH.exists():
         schema = json.loads(SCHEMA_PATH.read_text())
-        ensure_index(client, index_name, schema)
+        ensure_index(client, index_name, storage_mapping(schema, codec))
     return client
 
 
-def ingest_paths(paths: Iterable[Path], index_name: str) -> None:
-    """Ingest each provided PDF path into OpenSearch for retrieval."""
-
-    embedding_model_name = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
-    embedding_model = SentenceTransformerEmbeddings(model_name=embedding_model_name)
-    client = _ensure_client(index_name=index_name)
+def expand_pdf_paths(paths: Iterable[Path]) -> List[Path]:
+    """Expand directories to the PDFs they contain; keep files as given."""
 
+    expanded: List[Path] = []
     for path in paths:
-        if not path.exists():
+        if path.is_dir():
+            expanded.extend(sorted(path.rglob("*.pdf")))
+        elif path.exists():
+            expanded.append(path)
+        else:
             print(f"[skip] {path} does not exist.")
-            continue
-        try:
-            ingest_and_index_document(
-                path=path,
-                embedding_model=embedding_model,
-                opensearch_client=client,
-                index_name=index_name,
+    return expanded
+
+
+def ingest_paths(
+    paths: Iterable[Path],
+    index_name: str,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+    manifest_path: Optional[Path] = None,
+    bulk_workers: int = DEFAULT_BULK_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    embed_workers: int = 1,
+) -> None:
+    """Ingest each provided PDF path into OpenSearch for retrieval.
+
+    Text extraction runs on a process pool (`workers` processes) and feeds a
+    staged pipeline in which embedding and bulk indexing of earlier files
+    overlap with extraction of later ones. With a manifest, files untouched
+    since their last ingestion are not re-read.
+
+    With `embed_workers` > 1, embedding runs on that many core-pinned worker
+    processes and each embedding batch (default `DEFAULT_EMBED_BATCH_SIZE`
+    per worker) is sharded across them.
+    """
+
+    embedding_model_name = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
+    embed_workers = max(1, embed_workers)
+    if batch_size is None:
+        batch_size = DEFAULT_EMBED_BATCH_SIZE * embed_workers
+    if embed_workers > 1:
+        embedding_model = EmbeddingProcessPool(
+            embedding_model_name,
+            backend=os.getenv("EMBEDDING_BACKEND"),
+            workers=embed_workers,
+            cache_dir=os.getenv("EMBEDDING_CACHE_DIR") or None,
+        )
+    else:
+        embedding_model = build_embedder(
+            os.getenv("EMBEDDING_BACKEND"),
+            model_name=embedding_model_name,
+            cache_dir=os.getenv("EMBEDDING_CACHE_DIR") or None,
+        )
+    codec = load_vector_codec()
+    client = _ensure_client(index_name=index_name, codec=codec)
+    pipeline_model = EncodedEmbeddings(embedding_model, codec) if codec is not None else embedding_model
+    manifest = IngestionManifest.load(manifest_path) if manifest_path else None
+
+    pending = expand_pdf_paths(paths)
+    if manifest is not None:
+        pending = [path for path in pending if not manifest.stat_matches(path, index_name)]
+
+    try:
+        with ParallelPdfExtractor(max_workers=workers, pages_per_task=pages_per_task) as extractor:
+            pipeline = StagedIngestionPipeline(
+                pipeline_model,
+                client,
+                index_name,
+                manifest=manifest,
+                extractor=extractor,
+                batch_size=batch_size,
+                queue_size=queue_size,
+                bulk_workers=bulk_workers,
             )
-            print(f"[ok] Ingested {path}")
-        except Exception as exc:  # pragma: no cover - CLI surface
-            print(f"[error] Failed to ingest {path}: {exc}")
+            results = pipeline.run(pending)
+    finally:
+        if isinstance(embedding_model, EmbeddingProcessPool):
+            embedding_model.close()
+
+    for result in results:
+        if result.error:
+            print(f"[error] Failed to ingest {result.path}: {result.error}")
+        elif result.skipped:
+            print(f"[skip] {result.path} unchanged.")
+        else:
+            print(f"[ok] Ingested {result.path} ({result.indexed} chunks indexed, {result.deleted} deleted)")
+
+    for stage, stats in pipeline.metrics().items():
+        print(
+            f"[stage] {stage:<8} {stats['items']:>7} items  {stats['items_per_second']:>9.1f}/s  "
+            f"utilization {stats['utilization']:.0%}  max queue {stats['max_queue_depth']}"
+        )
 
 
 def main(argv: Optional[Iterable[str]] = None) -> None:
@@ -112,15 +206,67 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         "paths",
         nargs="+",
         type=Path,
-        help="One or more PDF files to ingest.",
+        help="One or more PDF files (or directories of PDFs) to ingest.",
     )
     parser.add_argument(
         "--index",
         default=os.getenv("OPENSEARCH_INDEX", "quest-research"),
         help="Target OpenSearch index (defaults to OPENSEARCH_INDEX).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="PDF extraction processes (defaults to the CPU count; 1 disables the pool).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Chunks embedded per model call (defaults to {DEFAULT_EMBED_BATCH_SIZE} per embedding worker).",
+    )
+    parser.add_argument(
+        "--embed-workers",
+        type=int,
+        default=int(os.getenv("EMBEDDING_WORKERS", "1")),
+        help="Core-pinned embedding processes (defaults to EMBEDDING_WORKERS or 1; 1 embeds in-process).",
+    )
+    parser.add_argument(
+        "--pages-per-task",
+        type=int,
+        default=DEFAULT_PAGES_PER_TASK,
+        help="PDF pages extracted per worker task.",
+    )
+    parser.add_argument(
+        "--bulk-workers",
+        type=int,
+        default=DEFAULT_BULK_WORKERS,
+        help="Concurrent bulk request senders.",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="Batches buffered between pipeline stages.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=os.getenv("INGESTION_MANIFEST_PATH") or None,
+        help="Ingestion manifest for incremental runs (defaults to INGESTION_MANIFEST_PATH; unset re-indexes everything).",
+    )
     args = parser.parse_args(argv)
-    ingest_paths(args.paths, index_name=args.index)
+    ingest_paths(
+        args.paths,
+        index_name=args.index,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        pages_per_task=args.pages_per_task,
+        manifest_path=args.manifest,
+        bulk_workers=args.bulk_workers,
+        queue_size=args.queue_size,
+        embed_workers=args.embed_workers,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+"""
+Embedding Layer Test Suite
+
+This module tests the embedding utilities that sit between ingestion and the
+vector index, using a fake sentence-transformer so the suite runs without
+downloading model weights.
+
+Features:
+- Persistent embedding cache round-trips
+- Cache-aware document embedding
+- Zero-copy ndarray outputs and JSON-boundary serialization
+- Length-bucketed token-budget batching
+- Query micro-batching across concurrent callers
+- ONNX backend pooling, parity checking and backend selection
+
+Test Coverage:
+- EmbeddingCache persistence and normalization
+- SentenceTransformerEmbeddings.embed_documents with cache_dir
+- embed_documents_array / embed_query_array and dumps_json
+- length_bucketed_batches and order restoration in embed_documents
+- QueryMicroBatcher futures, error propagation and histograms
+- pool_embeddings, check_parity, build_embedder
+
+Usage:
+    # Run embedding tests
+    pytest tests/test_embeddings.py -v
+"""
+
+import multiprocessing
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rag_pipeline.embeddings import sentence_transformer
+from rag_pipeline.embeddings.backends import build_embedder
+from rag_pipeline.embeddings.batching import estimate_tokens, length_bucketed_batches
+from rag_pipeline.embeddings.cache import EmbeddingCache
+from rag_pipeline.embeddings.micro_batcher import QueryMicroBatcher
+from rag_pipeline.embeddings.onnx_backend import OnnxEmbeddings, check_parity, pool_embeddings
+from rag_pipeline.embeddings.process_pool import EmbeddingProcessPool, core_slices
+from rag_pipeline.embeddings.sentence_transformer import SentenceTransformerEmbeddings
+from rag_pipeline.indexing.serialization import dumps_json
+
+
+class FakeSentenceTransformer:
+    """Deterministic stand-in that records every text it encodes."""
+
+    encoded: list = []
+
+    batches: list = []
+
+    def __init__(self, model_name, device="cpu"):
+        self.model_name = model_name
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        FakeSentenceTransformer.encoded.extend(batch)
+        FakeSentenceTransformer.batches.append(batch)
+        vectors = np.array([[len(t), t.count(" "), 1.0] for t in batch], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    FakeSentenceTransformer.encoded = []
+    FakeSentenceTransformer.batches = []
+    monkeypatch.setattr(sentence_transformer, "SentenceTransformer", FakeSentenceTransformer)
+    return FakeSentenceTransformer
+
+
+def test_embedding_cache_persists_across_instances(tmp_path: Path):
+    """Vectors written by one cache instance are readable by the next."""
+    cache = EmbeddingCache(tmp_path, "test-model")
+    cache.put_many(["alpha  beta", "gamma"], np.array([[1, 2], [3, 4]], dtype=np.float32))
+
+    reopened = EmbeddingCache(tmp_path, "test-model")
+    hits = reopened.get_many(["alpha beta", "gamma", "delta"])
+
+    assert np.allclose(hits[0], [1, 2])
+    assert np.allclose(hits[1], [3, 4])
+    assert hits[2] is None
+    stats = reopened.stats()
+    assert stats["disk_hits"] == 2
+    assert stats["misses"] == 1
+
+
+def _write_cache_rows(directory: str, worker: int) -> None:
+    cache = EmbeddingCache(directory, "test-model")
+    for start in range(0, 40, 4):
+        texts = [f"w{worker}-{idx}" for idx in range(start, start + 4)] + ["shared"]
+        cache.put_many(texts, [[worker, idx] for idx in range(start, start + 4)] + [[-1, -1]])
+
+
+def test_embedding_cache_is_safe_with_several_writer_processes(tmp_path: Path):
+    """Processes sharing a directory never serve another text's vector."""
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_write_cache_rows, args=(str(tmp_path), worker)) for worker in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    reopened = EmbeddingCache(tmp_path, "test-model")
+    assert len(reopened) == 4 * 40 + 1
+    for worker in range(4):
+        vectors = reopened.get_many([f"w{worker}-{idx}" for idx in range(40)])
+        assert np.allclose(np.stack(vectors), [[worker, idx] for idx in range(40)])
+    assert np.allclose(reopened.get("shared"), [-1, -1])
+
+    # A long-lived instance sees rows another instance appended after it loaded.
+    other = EmbeddingCache(tmp_path, "test-model")
+    other.put_many(["late"], [[7, 7]])
+    assert np.allclose(reopened.get("late"), [7, 7])
+
+
+def test_embed_documents_only_encodes_cache_misses(tmp_path: Path, fake_model):
+    """Re-embedding the same corpus is served from the cache."""
+    embedder = SentenceTransformerEmbeddings("test-model", device="cpu", cache_dir=str(tmp_path))
+    first = embedder.embed_documents(["one two", "three", "one two"])
+    assert fake_model.encoded == ["one two", "three"]
+
+    fake_model.encoded = []
+    fresh = SentenceTransformerEmbeddings("test-model", device="cpu", cache_dir=str(tmp_path))
+    second = fresh.embed_documents(["one two", "three", "four"])
+
+    assert fake_model.encoded == ["four"]
+    assert second[:2] == first[:2]
+
+
+def test_array_outputs_are_float32_and_serialize_once(fake_model):
+    """Array APIs return float32 ndarrays that the JSON boundary encodes directly."""
+    embedder = SentenceTransformerEmbeddings("test-model", device="cpu")
+    matrix = embedder.embed_documents_array(["a b", "c"])
+    query = embedder.embed_query_array("a b c")
+
+    assert matrix.dtype == np.float32 and matrix.shape == (2, 3)
+    assert query.dtype == np.float32 and query.shape == (3,)
+    assert embedder.embed_documents(["a b", "c"]) == matrix.tolist()
+
+    payload = dumps_json({"embedding": matrix[0], "k": np.int64(5), "column": matrix[:, 0]})
+    assert payload == '{"embedding":[3.0,1.0,1.0],"k":5,"column":[3.0,1.0]}'
+
+
+def test_length_bucketed_batches_respect_token_budget():
+    lengths = np.array([5, 100, 6, 90, 4, 200])
+    batches = length_bucketed_batches(lengths, max_tokens=200, max_batch_size=3)
+
+    assert [batch.tolist() for batch in batches] == [[5], [1, 3], [2, 0, 4]]
+    assert all(lengths[batch].max() * batch.size <= 200 for batch in batches)
+
+
+def test_embed_documents_groups_similar_lengths_and_restores_order(fake_model):
+    embedder = SentenceTransformerEmbeddings("test-model", device="cpu", max_batch_tokens=40)
+    texts = ["short", " ".join(["long"] * 20), "tiny", " ".join(["long"] * 18), "mini"]
+
+    matrix = embedder.embed_documents_array(texts)
+
+    assert matrix[:, 0].tolist() == [float(len(text)) for text in texts]
+    assert [len(batch) for batch in fake_model.batches] == [1, 1, 3]
+    assert fake_model.batches[-1] == ["short", "tiny", "mini"]
+    assert embedder.get_model_info()["batching"]["padding_efficiency"] == 1.0
+
+
+class GatedQueryEmbedder:
+    """Blocks the first encode until released so later queries pile up."""
+
+    def __init__(self):
+        self.batches = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def embed_queries_array(self, texts):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        if "boom" in texts:
+            raise RuntimeError("encoder failed")
+        self.batches.append(list(texts))
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+def test_micro_batcher_coalesces_concurrent_queries():
+    embedder = GatedQueryEmbedder()
+    batcher = QueryMicroBatcher(embedder, max_wait_ms=50, max_batch_size=8)
+
+    first = batcher.submit("warm")
+    assert embedder.entered.wait(timeout=5)
+    futures = [batcher.submit(text) for text in ["a", "bb", "a", "cccc"]]
+    embedder.release.set()
+
+    assert first.result(timeout=5)[0] == 4.0
+    assert [future.result(timeout=5)[0] for future in futures] == [1.0, 2.0, 1.0, 4.0]
+    # The first query runs alone; the ones queued behind it share one call, deduplicated.
+    assert embedder.batches[-1] == ["a", "bb", "cccc"]
+
+    failing = [batcher.submit("boom"), batcher.submit("ok")]
+    for future in failing:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+
+    stats = batcher.stats()
+    assert stats["batch_size"]["count"] == 3
+    assert stats["wait_ms"]["count"] == 7
+    batcher.close()
+
+
+def test_pool_embeddings_ignores_padding_and_normalizes():
+    hidden = np.array([[[1.0, 0.0], [3.0, 4.0], [100.0, 100.0]]], dtype=np.float32)
+    mask = np.array([[1, 1, 0]])
+
+    mean = pool_embeddings(hidden, mask, mode="mean", normalize=False)
+    assert mean.tolist() == [[2.0, 2.0]]
+    assert pool_embeddings(hidden, mask, mode="max", normalize=False).tolist() == [[3.0, 4.0]]
+    assert np.allclose(np.linalg.norm(pool_embeddings(hidden, mask), axis=1), 1.0)
+
+
+class StaticEmbedder:
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float32)
+
+    def embed_documents(self, texts):
+        return self.matrix[: len(texts)].tolist()
+
+
+def test_check_parity_flags_drifting_vectors():
+    reference = StaticEmbedder([[1.0, 0.0], [0.0, 1.0]])
+    close = StaticEmbedder([[0.999, 0.01], [0.01, 0.999]])
+    drifted = StaticEmbedder([[1.0, 0.0], [1.0, 1.0]])
+
+    assert check_parity(close, reference, ["a", "b"])["passed"]
+    report = check_parity(drifted, reference, ["a", "b"])
+    assert not report["passed"] and report["worst_text"] == "b"
+
+
+def test_build_embedder_selects_backend(fake_model, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("ONNX_MODEL_DIR", str(tmp_path))
+    assert type(build_embedder(None, "test-model")) is SentenceTransformerEmbeddings
+
+    onnx = build_embedder("onnx", "org/test-model")
+    assert isinstance(onnx, OnnxEmbeddings) and onnx.device == "cpu"
+    assert onnx.model_path == tmp_path / "org__test-model" / "model_int8.onnx"
+    with pytest.raises(ValueError):
+        build_embedder("tensorflow", "test-model")
+
+
+def test_core_slices_partition_cores():
+    assert core_slices(2, [0, 1, 2, 3, 4]) == [[0, 1, 2], [3, 4]]
+    assert core_slices(3, [0, 1]) == [[0], [1], [0]]
+
+
+class LengthEmbedder:
+    """Picklable worker-side embedder: vector is (len(text), worker pid)."""
+
+    def embed_documents(self, texts):
+        return [[float(len(text)), float(os.getpid())] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), float(os.getpid())]
+
+
+def test_process_pool_shards_and_restores_order(tmp_path: Path):
+    texts = [("x" * (idx * 7 % 23 + 1)) for idx in range(40)]
+    with EmbeddingProcessPool(
+        "test-model",
+        workers=2,
+        min_shard_size=4,
+        cache_dir=str(tmp_path),
+        embedder_factory=LengthEmbedder,
+        mp_context="fork",
+    ) as pool:
+        vectors = pool.embed_documents_array(texts)
+        assert vectors.dtype == np.float32
+        assert vectors[:, 0].tolist() == [float(len(text)) for text in texts]
+        assert pool.embed_query("abc")[0] == 3.0
+        assert pool.get_model_info()["embedding_cache"]["stored_vectors"] == len(set(texts))
+
+    with EmbeddingProcessPool(
+        "test-model", workers=1, cache_dir=str(tmp_path), embedder_factory=LengthEmbedder, mp_context="fork"
+    ) as pool:
+        assert pool.embed_documents_array(texts).tolist() == vectors.tolist()
+        assert pool.get_model_info()["embedding_cache"]["disk_hits"] == len(set(texts))
+
+
+def test_process_pool_shards_balance_tokens_across_workers(tmp_path: Path):
+    texts = [" ".join(["word"] * (idx + 1)) for idx in range(64)]
+    with EmbeddingProcessPool(
+        "test-model", workers=4, min_shard_size=4, embedder_factory=LengthEmbedder, mp_context="fork"
+    ) as pool:
+        shards = pool._shards(texts)
+
+    assert len(shards) == 4
+    assert sorted(np.concatenate(shards).tolist()) == list(range(64))
+    tokens = [[estimate_tokens(texts[idx]) for idx in shard] for shard in shards]
+    assert all(lengths == sorted(lengths) for lengths in tokens)
+    totals = [sum(lengths) for lengths in tokens]
+    assert max(totals) - min(totals) <= max(estimate_tokens(text) for text in texts)
+
+
+def test_onnx_export_matches_pytorch(tmp_path: Path):
+    """End-to-end export + parity; needs the real model and optional deps."""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("sentence_transformers")
+
+    texts = ["hybrid search with BM25", "Results", "a much longer sentence about retrieval augmented generation"]
+    onnx = OnnxEmbeddings("all-MiniLM-L6-v2", onnx_dir=str(tmp_path), auto_export=True)
+    reference = SentenceTransformerEmbeddings("all-MiniLM-L6-v2", device="cpu")
+
+    assert check_parity(onnx, reference, texts)["passed"]
@@ -0,0 +1,307 @@
+"""
+Local Search Engine Test Suite
+
+This module validates the in-process OpenSearch stand-in used for single-node
+deployments and offline benchmarks, covering query shapes consumed by the
+hybrid retriever, write operations and on-disk persistence.
+
+Test Coverage:
+- BM25 match queries
+- Exact kNN queries
+- Hybrid queries built by HybridRetriever
+- Upsert, delete and msearch handling
+- Memory-mapped persistence round trip
+- Streaming chunk embedding and bulk indexing
+- Reduced-dimension / quantized vector storage codecs and mappings
+
+Usage:
+    pytest tests/test_indexing.py -v
+"""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rag_pipeline.indexing.hybrid_indexer import chunk_document_id, index_chunks, iter_indexed_documents
+from rag_pipeline.indexing import local_engine
+from rag_pipeline.indexing.local_engine import LocalSearchEngine
+from rag_pipeline.indexing.opensearch_client import bulk_index_documents, clear_index_documents
+from rag_pipeline.indexing.vector_storage import (
+    EncodedEmbeddings,
+    VectorCodec,
+    VectorStorageSpec,
+    storage_mapping,
+)
+from rag_pipeline.ingestion.pdf_ocr_pipeline import DocumentChunk
+from rag_pipeline.retrieval.retriever import HybridRetriever
+
+
+class FixedQueryEmbedder:
+    def embed_query(self, text: str):
+        return [1.0, 0.0, 0.0]
+
+
+def _documents():
+    return [
+        {"_id": "a", "_source": {"text": "revenue growth in the retail sector", "embedding": [1.0, 0.0, 0.0], "title": "A"}},
+        {"_id": "b", "_source": {"text": "supply chain disruption", "embedding": [0.0, 1.0, 0.0], "title": "B"}},
+        {"_id": "c", "_source": {"text": "retail revenue and retail margins", "embedding": [0.6, 0.8, 0.0], "title": "C"}},
+    ]
+
+
+def _engine(tmp_path=None):
+    engine = LocalSearchEngine(data_dir=tmp_path)
+    bulk_index_documents(engine, "docs", _documents())
+    return engine
+
+
+def test_match_query_ranks_by_bm25():
+    engine = _engine()
+    raw = engine.search(index="docs", body={"size": 5, "query": {"match": {"text": {"query": "retail revenue"}}}})
+    ids = [hit["_id"] for hit in raw["hits"]["hits"]]
+    assert ids == ["c", "a"]
+    assert "embedding" not in raw["hits"]["hits"][0]["_source"]
+
+
+def test_knn_query_uses_cosine_similarity():
+    engine = _engine()
+    raw = engine.search(index="docs", body={"size": 2, "query": {"knn": {"embedding": {"vector": [0.0, 2.0, 0.0], "k": 2}}}})
+    hits = raw["hits"]["hits"]
+    assert [hit["_id"] for hit in hits] == ["b", "c"]
+    assert np.isclose(hits[0]["_score"], 1.0)
+
+
+def test_hybrid_retriever_runs_against_local_engine():
+    engine = _engine()
+    retriever = HybridRetriever(client=engine, index_name="docs", query_embedder=FixedQueryEmbedder(), query_cache=None)
+
+    single = retriever.retrieve("retail revenue", top_k=3)
+    batched = retriever.retrieve_many(["retail revenue", "supply chain"], top_k=3)
+
+    assert [doc.doc_id for doc in single] == ["c", "a", "b"]
+    assert [doc.doc_id for doc in batched[0]] == [doc.doc_id for doc in single]
+    assert batched[1][0].doc_id in {"a", "b"}
+    assert single[0].metadata["title"] == "C"
+
+
+def test_upsert_delete_and_clear():
+    engine = _engine()
+    engine.index(index="docs", id="b", body={"text": "retail logistics", "embedding": [0.0, 1.0, 0.0]})
+    engine.delete(index="docs", id="a")
+
+    raw = engine.search(index="docs", body={"size": 5, "query": {"match": {"text": {"query": "retail"}}}})
+    assert sorted(hit["_id"] for hit in raw["hits"]["hits"]) == ["b", "c"]
+    assert engine.count(index="docs")["count"] == 2
+
+    clear_index_documents(engine, "docs")
+    assert engine.count(index="docs")["count"] == 0
+
+
+def test_persistence_round_trip(tmp_path):
+    engine = _engine(tmp_path)
+    engine.delete_ids("docs", ["b"])
+    engine.save("docs")
+
+    reloaded = LocalSearchEngine(data_dir=tmp_path)
+    assert reloaded.indices.exists(index="docs")
+    raw = reloaded.search(index="docs", body={"size": 5, "query": {"knn": {"embedding": {"vector": [1.0, 0.0, 0.0], "k": 5}}}})
+    assert [hit["_id"] for hit in raw["hits"]["hits"]] == ["a", "c"]
+
+    reloaded.index(index="docs", id="d", body={"text": "new retail note", "embedding": [0.0, 0.0, 1.0]})
+    raw = reloaded.search(index="docs", body={"size": 5, "query": {"match": {"text": {"query": "retail"}}}})
+    assert {hit["_id"] for hit in raw["hits"]["hits"]} == {"a", "c", "d"}
+
+
+def test_bulk_index_consumes_documents_outside_the_lock(monkeypatch):
+    monkeypatch.setattr(local_engine, "BULK_LOCK_BATCH", 2)
+    engine = _engine()
+    searched_during_upload = []
+
+    def lazy_documents():
+        for idx in range(5):
+            # A search from another thread must not wait for the whole upload.
+            worker = threading.Thread(
+                target=lambda: searched_during_upload.append(
+                    len(engine.search(index="docs", body={"size": 20, "query": {"match_all": {}}})["hits"]["hits"])
+                )
+            )
+            worker.start()
+            worker.join(timeout=1.0)
+            assert not worker.is_alive()
+            yield {"_id": f"n{idx}", "_source": {"text": "lazy", "embedding": [0.0, 0.0, 1.0]}}
+
+    assert engine.bulk_index("docs", lazy_documents()) == 5
+    assert searched_during_upload == [3, 3, 5, 5, 7]
+    assert engine.count(index="docs")["count"] == 8
+
+
+def test_autosave_appends_and_compacts_when_rows_die(tmp_path):
+    engine = LocalSearchEngine(data_dir=tmp_path, autosave=True)
+    bulk_index_documents(engine, "docs", _documents())
+    docs_file = tmp_path / "docs" / "docs.jsonl"
+    inode = docs_file.stat().st_ino
+
+    engine.index(index="docs", id="d", body={"text": "retail outlook", "embedding": [0.0, 0.0, 1.0]})
+    engine.index(index="docs", id="b", body={"text": "supply retail", "embedding": [0.0, 1.0, 0.0]})
+    # Appended in place: no rewrite of the existing rows.
+    assert docs_file.stat().st_ino == inode
+    assert len(docs_file.read_text().splitlines()) == 6
+
+    reloaded = LocalSearchEngine(data_dir=tmp_path)
+    raw = reloaded.search(index="docs", body={"size": 5, "query": {"match": {"text": {"query": "retail"}}}})
+    assert {hit["_id"] for hit in raw["hits"]["hits"]} == {"a", "b", "c", "d"}
+    assert reloaded.count(index="docs")["count"] == 4
+
+    # Second dead row crosses COMPACT_DEAD_FRACTION of 6 rows: files are rewritten.
+    engine.delete_ids("docs", ["a"])
+    assert docs_file.stat().st_ino != inode
+    assert len(docs_file.read_text().splitlines()) == 3
+
+    reloaded = LocalSearchEngine(data_dir=tmp_path)
+    raw = reloaded.search(index="docs", body={"size": 5, "query": {"knn": {"embedding": {"vector": [0.0, 1.0, 0.0], "k": 5}}}})
+    assert [hit["_id"] for hit in raw["hits"]["hits"]][:2] == ["b", "c"]
+    assert reloaded.count(index="docs")["count"] == 3
+
+
+class RecordingEmbedder:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def embed_documents(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+
+def _chunks(count):
+    for idx in range(count):
+        yield DocumentChunk(
+            text=f"chunk number {idx}",
+            page_numbers=[idx // 3 + 1],
+            source_path=Path("/tmp/report.pdf"),
+            title="Report",
+            source_id="abc123",
+            offset=(idx % 3) * 100,
+        )
+
+
+def test_streaming_index_embeds_in_bounded_batches():
+    embedder = RecordingEmbedder()
+    documents = iter_indexed_documents(_chunks(10), embedder, batch_size=4)
+
+    first = next(documents)
+    assert embedder.batch_sizes == [4]
+    assert first.id == "abc123-p1-t0"
+
+    remaining = list(documents)
+    assert embedder.batch_sizes == [4, 4, 2]
+    assert [doc.id for doc in remaining][-1] == "abc123-p4-t0"
+
+
+def test_chunk_ids_are_deterministic_and_source_scoped():
+    def chunk(path, source_id=None):
+        return DocumentChunk(
+            text="same text",
+            page_numbers=[2],
+            source_path=Path(path),
+            source_id=source_id,
+            offset=160,
+        )
+
+    assert chunk_document_id(chunk("/a/report.pdf")) == chunk_document_id(chunk("/a/report.pdf"))
+    assert chunk_document_id(chunk("/a/report.pdf")) != chunk_document_id(chunk("/b/report.pdf"))
+    assert chunk_document_id(chunk("/tmp/x.pdf", "f" * 64)) == chunk_document_id(chunk("/tmp/y.pdf", "f" * 64))
+    assert chunk_document_id(chunk("/tmp/x.pdf", "f" * 64)).endswith("-p2-t160")
+
+
+def test_index_chunks_streams_into_bulk_api():
+    engine = LocalSearchEngine()
+    embedder = RecordingEmbedder()
+
+    index_chunks(engine, "docs", _chunks(7), embedder, batch_size=3)
+
+    assert embedder.batch_sizes == [3, 3, 1]
+    assert engine.count(index="docs")["count"] == 7
+
+
+def test_vector_storage_spec_parsing():
+    assert VectorStorageSpec.parse("pca:128+byte") == VectorStorageSpec("pca", 128, "byte")
+    assert VectorStorageSpec.parse("fp16").label == "fp16"
+    assert VectorStorageSpec.parse("truncate:64").label == "truncate:64+float32"
+    with pytest.raises(ValueError):
+        VectorStorageSpec.parse("pca")
+    with pytest.raises(ValueError):
+        VectorStorageSpec.parse("int4")
+
+
+def _clustered_vectors(rows=400, dim=32, rank=6, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(rows, rank)) @ rng.normal(size=(rank, dim)) + 0.05 * rng.normal(size=(rows, dim))
+    return vectors.astype(np.float32)
+
+
+def test_pca_byte_codec_preserves_neighbours_and_round_trips(tmp_path):
+    corpus = _clustered_vectors()
+    codec = VectorCodec(VectorStorageSpec.parse("pca:8+byte")).fit(corpus)
+
+    stored = codec.encode(corpus)
+    assert stored.dtype == np.int8 and stored.shape == (400, 8)
+    assert codec.bytes_per_vector() == 8
+
+    unit = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    truth = np.argsort(-(unit[:20] @ unit.T), axis=1)[:, :10]
+    decoded = codec.decode(stored)
+    found = np.argsort(-(decoded[:20] @ decoded.T), axis=1)[:, :10]
+    recall = np.mean([len(set(a) & set(b)) / 10 for a, b in zip(truth, found)])
+    assert recall >= 0.8
+
+    reloaded = VectorCodec.load(codec.save(tmp_path / "codec"))
+    assert np.array_equal(reloaded.encode(corpus[:5]), stored[:5])
+
+
+def test_storage_mapping_matches_codec():
+    schema = {"mappings": {"properties": {"embedding": {"type": "knn_vector", "dimension": 32}}}}
+    sample = _clustered_vectors()
+
+    byte_field = storage_mapping(schema, VectorCodec(VectorStorageSpec.parse("truncate:16+byte")).fit(sample))
+    assert byte_field["mappings"]["properties"]["embedding"]["dimension"] == 16
+    assert byte_field["mappings"]["properties"]["embedding"]["data_type"] == "byte"
+
+    fp16_field = storage_mapping(schema, VectorCodec(VectorStorageSpec.parse("fp16")).fit(sample))
+    method = fp16_field["mappings"]["properties"]["embedding"]["method"]
+    assert method["engine"] == "faiss" and method["parameters"]["encoder"]["parameters"]["type"] == "fp16"
+    assert storage_mapping(schema, None) is schema
+    assert schema["mappings"]["properties"]["embedding"] == {"type": "knn_vector", "dimension": 32}
+
+
+class MatrixEmbedder:
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def embed_documents(self, texts):
+        return self.matrix[[int(text) for text in texts]].tolist()
+
+    def embed_query(self, text):
+        return self.matrix[int(text)].tolist()
+
+
+def test_encoded_embeddings_index_and_query_in_reduced_space():
+    corpus = _clustered_vectors(rows=50)
+    codec = VectorCodec(VectorStorageSpec.parse("pca:8")).fit(corpus)
+    embedder = EncodedEmbeddings(MatrixEmbedder(corpus), codec)
+
+    engine = LocalSearchEngine()
+    index_chunks(
+        engine,
+        "docs",
+        (DocumentChunk(text=str(idx), page_numbers=[1], source_path=Path("/tmp/m.pdf"), offset=idx) for idx in range(50)),
+        embedder,
+    )
+    retriever = HybridRetriever(client=engine, index_name="docs", query_embedder=embedder, query_cache=None)
+    vector = retriever.embed_query("7")
+    assert vector.shape == (8,)
+    raw = engine.search(index="docs", body={"size": 1, "query": {"knn": {"embedding": {"vector": vector, "k": 1}}}})
+    assert raw["hits"]["hits"][0]["_source"]["text"] == "7"
+    with pytest.raises(RuntimeError):
+        EncodedEmbeddings(MatrixEmbedder(corpus), VectorCodec(VectorStorageSpec.parse("byte")))
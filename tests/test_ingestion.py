@@ -19,6 +19,11 @@ Test Coverage:
 - normalize_text() - Text preprocessing and cleaning
 - chunk_text() - Text segmentation strategies
 - build_document_chunks() - Document chunk creation
+- ParallelPdfExtractor - Ordered process-pool page extraction
+- IngestionManifest - Incremental skip / partial re-embed / delete
+- StagedIngestionPipeline - Overlapped stages, per-file finalization, metrics
+- IngestionQueue - Debounce, coalescing, retry and crash resume
+- DirectoryWatcher - scandir polling fallback
 - DocumentChunk data structure validation
 - Edge cases and error conditions
 
@@ -34,6 +39,13 @@ from pathlib import Path
 
 import pytest
 
+from rag_pipeline.indexing.local_engine import LocalSearchEngine
+from rag_pipeline.ingestion.manifest import IngestionManifest
+from rag_pipeline.ingestion.parallel_extraction import ParallelPdfExtractor
+from rag_pipeline.ingestion.pipeline import ingest_and_index_document, remove_indexed_document
+from rag_pipeline.ingestion.staged_pipeline import StagedIngestionPipeline
+from rag_pipeline.ingestion.watcher import DirectoryWatcher
+from rag_pipeline.ingestion.work_queue import DELETE, UPSERT, IngestionQueue
 from rag_pipeline.ingestion.pdf_ocr_pipeline import (
     build_document_chunks,
     chunk_text,
@@ -82,3 +94,252 @@ def test_build_document_chunks_attaches_metadata(tmp_path: Path):
     assert all(chunk.metadata == metadata for chunk in chunks)
     assert chunks[0].page_numbers == [1]
     assert chunks[1].page_numbers == [2]
+
+
+def _write_pdf(path: Path, pages):
+    """Write a minimal PDF whose pages contain the given text lines."""
+    pypdf = pytest.importorskip("pypdf")
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = pypdf.PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in pages:
+        page = writer.add_blank_page(200, 200)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 20 100 Td ({text}) Tj ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    with path.open("wb") as handle:
+        writer.write(handle)
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_extractor_streams_files_and_pages_in_order(tmp_path: Path, workers):
+    """Page ranges fan out across workers but come back in document order."""
+    first = _write_pdf(tmp_path / "first.pdf", [f"first page {i}" for i in range(5)])
+    second = _write_pdf(tmp_path / "second.pdf", [f"second page {i}" for i in range(3)])
+
+    with ParallelPdfExtractor(max_workers=workers, pages_per_task=2) as extractor:
+        results = list(extractor.iter_documents([first, tmp_path / "missing.pdf", second]))
+
+    assert [doc.path.name for doc in results] == ["first.pdf", "missing.pdf", "second.pdf"]
+    assert results[0].page_text == [f"first page {i}" for i in range(5)]
+    assert results[1].page_text is None and results[1].error
+    assert results[2].page_text == [f"second page {i}" for i in range(3)]
+    assert results[0].error is None and results[2].error is None
+    assert results[0].stat == (first.stat().st_size, first.stat().st_mtime_ns)
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.texts = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return [[1.0, float(len(text))] for text in texts]
+
+
+def test_manifest_makes_reingestion_incremental(tmp_path: Path):
+    """Unchanged files are skipped; edits re-embed only changed chunks."""
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"version one")
+    manifest_path = tmp_path / "manifest.json"
+    engine = LocalSearchEngine()
+    embedder = CountingEmbedder()
+
+    def ingest(pages):
+        return ingest_and_index_document(
+            path=source,
+            embedding_model=embedder,
+            opensearch_client=engine,
+            index_name="docs",
+            page_text=pages,
+            manifest=IngestionManifest.load(manifest_path),
+        )
+
+    first = ingest(["alpha page", "beta page", "gamma page"])
+    assert (first.indexed, first.unchanged, first.deleted) == (3, 0, 0)
+
+    assert ingest(["alpha page", "beta page", "gamma page"]).skipped
+
+    source.write_bytes(b"version two")
+    embedder.texts = []
+    second = ingest(["alpha page", "beta edited"])
+    assert (second.indexed, second.unchanged, second.deleted) == (1, 1, 1)
+    assert embedder.texts == ["beta edited"]
+    assert engine.count(index="docs")["count"] == 2
+
+    manifest = IngestionManifest.load(manifest_path)
+    assert remove_indexed_document(source, engine, "docs", manifest) == 2
+    assert engine.count(index="docs")["count"] == 0
+    assert len(IngestionManifest.load(manifest_path)) == 0
+
+
+def test_manifest_skips_files_edited_during_ingestion(tmp_path: Path):
+    """A file that changes mid-ingestion stays unrecorded so the edit is picked up."""
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"version one")
+    stat = (source.stat().st_size, source.stat().st_mtime_ns)
+    manifest = IngestionManifest()
+
+    source.write_bytes(b"version two, longer")
+    result = ingest_and_index_document(
+        path=source,
+        embedding_model=CountingEmbedder(),
+        opensearch_client=LocalSearchEngine(),
+        index_name="docs",
+        page_text=["alpha page"],
+        manifest=manifest,
+        stat=stat,
+    )
+
+    assert result.indexed == 1
+    assert manifest.get(source) is None
+    assert not manifest.stat_matches(source, "docs")
+
+
+def test_manifest_checkpoints_at_most_once_per_interval(tmp_path: Path):
+    now = [0.0]
+    manifest = IngestionManifest(tmp_path / "manifest.json", save_interval=10.0, clock=lambda: now[0])
+
+    manifest.record(tmp_path / "a.pdf", "docs", "hash-a", {}, 1, 1)
+    assert manifest.checkpoint()
+    manifest.record(tmp_path / "b.pdf", "docs", "hash-b", {}, 1, 1)
+    assert not manifest.checkpoint()
+    assert len(IngestionManifest.load(tmp_path / "manifest.json")) == 1
+
+    now[0] = 10.0
+    assert manifest.checkpoint()
+    assert not manifest.checkpoint()  # nothing new to write
+    assert len(IngestionManifest.load(tmp_path / "manifest.json")) == 2
+
+
+class FailingEmbedder(CountingEmbedder):
+    def embed_documents(self, texts):
+        if any("poison" in text for text in texts):
+            raise RuntimeError("model crashed")
+        return super().embed_documents(texts)
+
+
+def test_staged_pipeline_indexes_files_and_reports_stage_metrics(tmp_path: Path):
+    paths = [
+        _write_pdf(tmp_path / "a.pdf", ["alpha one", "alpha two", "alpha three"]),
+        _write_pdf(tmp_path / "b.pdf", ["poison page"]),
+        _write_pdf(tmp_path / "c.pdf", ["gamma one", "gamma two"]),
+    ]
+    engine = LocalSearchEngine()
+    manifest = IngestionManifest()
+    pipeline = StagedIngestionPipeline(
+        FailingEmbedder(), engine, "docs", manifest=manifest, batch_size=2, queue_size=1
+    )
+
+    results = pipeline.run(paths)
+
+    assert [(r.path.name, r.indexed, r.error) for r in results] == [
+        ("a.pdf", 3, None),
+        ("b.pdf", 0, "model crashed"),
+        ("c.pdf", 2, None),
+    ]
+    assert engine.count(index="docs")["count"] == 5
+    # The failed file is not recorded, so the next run retries it.
+    assert manifest.get(paths[1]) is None and manifest.get(paths[0]) is not None
+
+    metrics = pipeline.metrics()
+    assert metrics["extract"]["items"] == 6
+    assert metrics["embed"]["items"] == 5
+    assert metrics["bulk"]["batches"] == 3
+    assert metrics["bulk"]["max_queue_depth"] <= 1
+
+    rerun = pipeline.run(paths)
+    assert [r.skipped for r in rerun] == [True, False, True]
+
+
+def test_staged_pipeline_reports_files_the_extractor_cannot_read(tmp_path: Path):
+    good = _write_pdf(tmp_path / "good.pdf", ["alpha one"])
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    manifest = IngestionManifest()
+
+    with ParallelPdfExtractor(max_workers=1) as extractor:
+        pipeline = StagedIngestionPipeline(
+            CountingEmbedder(), LocalSearchEngine(), "docs", manifest=manifest, extractor=extractor
+        )
+        results = pipeline.run([broken, good])
+
+    assert [r.path.name for r in results] == ["broken.pdf", "good.pdf"]
+    assert results[0].error and results[1].error is None and results[1].indexed == 1
+    assert manifest.get(broken) is None
+
+
+def test_queue_coalesces_events_and_resumes_after_crash(tmp_path: Path):
+    db_path = tmp_path / "queue.sqlite3"
+    queue = IngestionQueue(db_path, retry_delay=0.0)
+    queue.put("/docs/a.pdf")
+    queue.put("/docs/a.pdf")
+    queue.put("/docs/b.pdf", delay=60)
+    assert len(queue) == 2
+
+    job = queue.claim(timeout=0)
+    assert (job.path, job.event) == ("/docs/a.pdf", UPSERT)
+    assert queue.claim(timeout=0) is None  # b.pdf is still debouncing
+
+    # An event while the job runs schedules exactly one follow-up run.
+    queue.put("/docs/a.pdf", DELETE)
+    queue.complete(job)
+    follow_up = queue.claim(timeout=0)
+    assert (follow_up.path, follow_up.event) == ("/docs/a.pdf", DELETE)
+
+    # Simulate a crash: the claimed job survives in the database.
+    queue.close()
+    reopened = IngestionQueue(db_path)
+    assert reopened.claim(timeout=0) is None
+    assert reopened.recover() == 1
+    resumed = reopened.claim(timeout=0)
+    assert resumed.path == "/docs/a.pdf"
+    reopened.complete(resumed)
+    assert reopened.counts() == {"pending": 1}
+
+
+def test_queue_retries_then_parks_failed_jobs():
+    queue = IngestionQueue(max_attempts=2, retry_delay=0.0)
+    queue.put("/docs/broken.pdf")
+
+    queue.fail(queue.claim(timeout=0), RuntimeError("boom"))
+    queue.fail(queue.claim(timeout=0), RuntimeError("boom"))
+
+    assert queue.claim(timeout=0) is None
+    assert queue.counts() == {"failed": 1}
+    assert queue.retry_failed() == 1
+
+
+def test_polling_watcher_emits_upserts_and_deletes(tmp_path: Path):
+    events = []
+    watcher = DirectoryWatcher(
+        tmp_path,
+        "*.pdf",
+        on_event=lambda path, event: events.append((Path(path).name, event)),
+        use_polling=True,
+    )
+
+    (tmp_path / "new.pdf").write_bytes(b"%PDF-1.4")
+    (tmp_path / "notes.txt").write_text("ignored")
+    watcher.poll_once()
+    assert events == [("new.pdf", UPSERT)]
+
+    watcher.poll_once()
+    assert len(events) == 1  # unchanged files produce no events
+
+    (tmp_path / "new.pdf").unlink()
+    watcher.poll_once()
+    assert events[-1] == ("new.pdf", DELETE)
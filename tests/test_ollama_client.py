@@ -22,6 +22,11 @@ Test Coverage:
 - Error propagation handling
 - Client initialization
 - Request/response cycles
+- Async client fallback over a mocked transport
+- Keep-alive connection reuse and retry/backoff in the sync client
+- NDJSON token streaming (sync and async) with TTFT / tokens-per-second stats
+- Batched /api/embed requests and the per-text fallback for older servers
+- keep_alive on requests, model warm-up and the residency keeper
 
 Usage:
     # Run Ollama client tests
@@ -31,7 +36,16 @@ Usage:
     pytest tests/test_ollama_client.py --mock-ollama
 """
 
-from llm_ollama.client import OllamaClient, OllamaConfig
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from llm_ollama.async_client import AsyncOllamaClient
+from llm_ollama.client import ModelNotFoundError, OllamaClient, OllamaConfig, keep_alive_seconds
+from llm_ollama.residency import ModelResidencyKeeper
 
 
 def test_generate_falls_back(monkeypatch):
@@ -57,3 +71,218 @@ def test_generate_falls_back(monkeypatch):
 
     assert result == "hello"
     assert attempts == ["primary", "fallback"]
+
+
+def test_async_generate_uses_pooled_client_and_falls_back():
+    config = OllamaConfig(
+        base_url="http://ollama.test",
+        model="primary",
+        timeout=5,
+        fallback_model="fallback",
+    )
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        attempts.append(payload["model"])
+        if payload["model"] == "primary":
+            return httpx.Response(500)
+        return httpx.Response(200, json={"message": {"content": "async hello"}})
+
+    async def run():
+        http_client = httpx.AsyncClient(
+            base_url=config.base_url, transport=httpx.MockTransport(handler)
+        )
+        async with AsyncOllamaClient(config, http_client=http_client) as client:
+            return await client.generate(messages=[{"role": "user", "content": "hi"}])
+
+    assert asyncio.run(run()) == "async hello"
+    assert attempts == ["primary", "fallback"]
+    assert config.model == "fallback"
+
+
+class _OllamaStub(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 stub: records client ports and fails the first N chats with 503."""
+
+    protocol_version = "HTTP/1.1"
+    ports = []
+    failures = 0
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        _OllamaStub.ports.append(self.client_address[1])
+        self._reply(200, {"models": []})
+
+    def do_POST(self):
+        _OllamaStub.ports.append(self.client_address[1])
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        if _OllamaStub.failures:
+            _OllamaStub.failures -= 1
+            self._reply(503, {"error": "loading"})
+            return
+        if payload.get("stream"):
+            self._stream(["Hel", "lo", "!"])
+            return
+        self._reply(200, {"message": {"content": "pooled"}})
+
+    def _stream(self, pieces):
+        lines = [{"message": {"content": piece}, "done": False} for piece in pieces]
+        lines.append({"message": {"content": ""}, "done": True, "eval_count": 30, "eval_duration": 1_500_000_000})
+        data = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def _stub_server(failures=0):
+    _OllamaStub.ports = []
+    _OllamaStub.failures = failures
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = OllamaConfig(
+        base_url=f"http://127.0.0.1:{server.server_port}",
+        model="primary",
+        timeout=5,
+        fallback_model=None,
+        backoff_factor=0,
+    )
+    return server, config
+
+
+def test_sync_client_reuses_connections_and_retries_transient_errors():
+    server, config = _stub_server(failures=2)
+    try:
+        with OllamaClient(config) as client:
+            assert client.generate(messages=[{"role": "user", "content": "hi"}]) == "pooled"
+            assert client.health_check().healthy
+            assert client.generate(messages=[{"role": "user", "content": "again"}]) == "pooled"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Two 503s retried, then three successful calls, all over one TCP connection.
+    assert len(_OllamaStub.ports) == 5
+    assert len(set(_OllamaStub.ports)) == 1
+
+
+def test_stream_chat_yields_deltas_and_records_throughput():
+    server, config = _stub_server()
+    try:
+        with OllamaClient(config) as client:
+            stream = client.stream_chat(messages=[{"role": "user", "content": "hi"}])
+            assert list(stream) == ["Hel", "lo", "!"]
+            assert client.generate(messages=[{"role": "user", "content": "hi"}], stream=True) == "Hello!"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = stream.stats
+    assert stats.model == "primary" and stats.done
+    assert 0 < stats.ttft_ms <= stats.total_ms
+    assert stats.tokens == 30 and stats.tokens_per_second == 20.0
+
+
+def test_async_stream_falls_back_before_first_token():
+    config = OllamaConfig(base_url="http://ollama.test", model="primary", timeout=5, fallback_model="fallback")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        if payload["model"] == "primary":
+            return httpx.Response(500)
+        assert payload["stream"] is True
+        body = "".join(
+            json.dumps(line) + "\n"
+            for line in (
+                {"message": {"content": "a"}, "done": False},
+                {"message": {"content": "b"}, "done": False},
+                {"message": {"content": ""}, "done": True},
+            )
+        )
+        return httpx.Response(200, content=body.encode("utf-8"))
+
+    async def run():
+        http_client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+        async with AsyncOllamaClient(config, http_client=http_client) as client:
+            stream = await client.stream_chat(messages=[{"role": "user", "content": "hi"}])
+            return [delta async for delta in stream], stream.stats
+
+    deltas, stats = asyncio.run(run())
+    assert deltas == ["a", "b"]
+    assert stats.model == "fallback" and stats.tokens == 2 and stats.tokens_per_second is not None
+    assert config.model == "fallback"
+
+
+def test_embed_batches_requests_and_keeps_order(monkeypatch):
+    config = OllamaConfig(base_url="http://localhost", model="embedder", embed_batch_size=4, embed_concurrency=2)
+    client = OllamaClient(config)
+    calls = []
+
+    def fake_post(self, endpoint, payload):
+        calls.append((endpoint, len(payload["input"])))
+        return {"embeddings": [[float(len(text))] for text in payload["input"]]}
+
+    monkeypatch.setattr(OllamaClient, "_post", fake_post)
+    texts = ["x" * size for size in range(1, 11)]
+
+    assert client.embed(texts) == [[float(size)] for size in range(1, 11)]
+    assert sorted(calls) == [("/api/embed", 2), ("/api/embed", 4), ("/api/embed", 4)]
+    assert client.embed([]) == []
+
+
+def test_embed_falls_back_to_per_text_endpoint_on_old_servers(monkeypatch):
+    client = OllamaClient(OllamaConfig(base_url="http://localhost", model="embedder", embed_batch_size=8))
+    endpoints = []
+
+    def fake_post(self, endpoint, payload):
+        endpoints.append(endpoint)
+        if endpoint == "/api/embed":
+            raise ModelNotFoundError("Ollama endpoint /api/embed returned HTTP 404.")
+        return {"embedding": [float(len(payload["prompt"]))]}
+
+    monkeypatch.setattr(OllamaClient, "_post", fake_post)
+
+    assert client.embed(["a", "bb", "ccc"]) == [[1.0], [2.0], [3.0]]
+    assert client.embed(["dddd"]) == [[4.0]]
+    # The 404 is remembered: later calls skip straight to /api/embeddings.
+    assert endpoints == ["/api/embed"] + ["/api/embeddings"] * 4
+
+
+def test_keep_alive_is_sent_and_keeper_warms_models(monkeypatch):
+    assert keep_alive_seconds("1h30m") == 5400.0
+    assert keep_alive_seconds(None) == 300.0
+    assert keep_alive_seconds(-1) is None
+
+    config = OllamaConfig(base_url="http://localhost", model="primary", fallback_model="fallback", keep_alive="30m")
+    client = OllamaClient(config)
+    calls = []
+
+    def fake_post(self, endpoint, payload):
+        calls.append((endpoint, payload.get("model"), payload.get("keep_alive")))
+        if payload.get("model") == "fallback" and endpoint == "/api/generate":
+            raise ModelNotFoundError("Ollama model 'fallback' not found.")
+        return {"message": {"content": "ok"}, "done": True}
+
+    monkeypatch.setattr(OllamaClient, "_post", fake_post)
+    client.generate([{"role": "user", "content": "hi"}])
+    assert calls.pop() == ("/api/chat", "primary", "30m")
+
+    keeper = ModelResidencyKeeper(client)
+    assert keeper.interval == 1800 * 0.8
+    keeper.start()
+    keeper.stop()
+    assert calls == [("/api/generate", "primary", "30m"), ("/api/generate", "fallback", "30m")]
+    stats = keeper.stats()
+    assert stats["refreshes"] == 1 and stats["failures"] == 1 and not stats["running"]
+    assert stats["last_load_ms"]["fallback"] is None
@@ -19,7 +19,8 @@ Test Coverage:
 - HybridRetriever functionality
 - RetrievedDocument data structures
 - Search result ranking
-- Query embedding integration
+- Query embedding integration and caching
+- Semantic answer cache matching, TTL and LRU eviction
 - OpenSearch client interaction
 - Reranker component testing
 - Error handling scenarios
@@ -32,12 +33,24 @@ Usage:
     pytest tests/test_retrieval.py -k "reranker" -v
 """
 
+import asyncio
+from dataclasses import replace
 from typing import Any, Dict
 
 import pytest
 
+from rag_pipeline.answer_cache import SemanticAnswerCache, prompt_fingerprint
+from rag_pipeline.cache import LRUCache
+from rag_pipeline.retrieval.async_retriever import AsyncHybridRetriever
 from rag_pipeline.retrieval.retriever import HybridRetriever, RetrievedDocument
-from rag_pipeline.retrieval.reranker import PassThroughReranker
+from rag_pipeline.retrieval import reranker as reranker_module
+from rag_pipeline.retrieval.reranker import (
+    CascadeReranker,
+    CascadeStage,
+    CrossEncoderReranker,
+    KeywordOverlapReranker,
+    PassThroughReranker,
+)
 
 
 class DummyQueryEmbedder:
@@ -115,3 +128,341 @@ def test_retrieve_as_dicts_formats_langchain_documents():
     doc = docs[0]
     assert "page_content" in doc
     assert doc["metadata"]["title"] == "Attention Is All You Need" or doc["metadata"]["title"] == "BERT"
+
+
+class CountingQueryEmbedder(DummyQueryEmbedder):
+    def __init__(self):
+        self.calls = 0
+
+    def embed_query(self, text: str):
+        self.calls += 1
+        return super().embed_query(text)
+
+
+def test_embed_query_reuses_cached_vectors_until_ttl_expires():
+    """Repeated, near-identical questions skip the embedding model."""
+    now = [0.0]
+    embedder = CountingQueryEmbedder()
+    retriever = HybridRetriever(
+        client=DummySearchClient(build_hits()),
+        index_name="quest-research",
+        query_embedder=embedder,
+        query_cache=LRUCache(max_size=8, ttl_seconds=60, clock=lambda: now[0]),
+    )
+
+    retriever.embed_query("What is attention?")
+    retriever.embed_query("  what is   ATTENTION? ")
+    assert embedder.calls == 1
+
+    now[0] = 61.0
+    retriever.embed_query("What is attention?")
+    assert embedder.calls == 2
+
+    stats = retriever.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["expirations"] == 1
+
+
+class BatchQueryEmbedder(CountingQueryEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def embed_queries(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 0.0, 1.0] for text in texts]
+
+
+class DummyMultiSearchClient(DummySearchClient):
+    def msearch(self, body, index=None):
+        self.msearch_bodies = body  # type: ignore[attr-defined]
+        return {"responses": [self._hits for _ in range(len(body) // 2)]}
+
+
+def test_retrieve_many_batches_embedding_and_search():
+    """retrieve_many issues one encode batch and a single _msearch request."""
+    client = DummyMultiSearchClient(build_hits())
+    embedder = BatchQueryEmbedder()
+    retriever = HybridRetriever(
+        client=client,
+        index_name="quest-research",
+        query_embedder=embedder,
+    )
+    retriever.embed_query("What is BERT?")
+
+    results = retriever.retrieve_many(["What is attention?", "what is bert?", "Why?"], top_k=1)
+
+    assert [len(docs) for docs in results] == [1, 1, 1]
+    assert embedder.batches == [["What is attention?", "Why?"]]
+    assert embedder.calls == 1
+    assert len(client.msearch_bodies) == 6
+    assert client.msearch_bodies[0] == {"index": "quest-research"}
+
+
+class DummyAsyncSearchClient:
+    def __init__(self, hits: Dict[str, Any]):
+        self._hits = hits
+        self.calls = 0
+
+    async def search(self, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls += 1
+        return self._hits
+
+
+def test_async_retriever_awaits_search_client():
+    """AsyncHybridRetriever reuses the sync retriever config and awaits search."""
+    async_client = DummyAsyncSearchClient(build_hits())
+    retriever = HybridRetriever(
+        client=DummySearchClient({}),
+        index_name="quest-research",
+        query_embedder=DummyQueryEmbedder(),
+    )
+    async_retriever = AsyncHybridRetriever(retriever, client=async_client)
+
+    async def run():
+        single = await async_retriever.retrieve("What is attention?", top_k=1)
+        batch = await async_retriever.retrieve_many(["What is attention?", "BERT?"], top_k=2)
+        return single, batch
+
+    single, batch = asyncio.run(run())
+    assert single[0].metadata["title"] == "Attention Is All You Need"
+    assert [len(docs) for docs in batch] == [2, 2]
+    assert async_client.calls == 3
+
+
+class FakeCrossEncoder:
+    instances: list = []
+
+    def __init__(self, model_name, max_length=512, device=None):
+        self.batches = []
+        self.batch_sizes = []
+        FakeCrossEncoder.instances.append(self)
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        self.batches.append(list(pairs))
+        self.batch_sizes.append(batch_size)
+        return [float(len(set(q.lower().split()) & set(p.lower().split()))) for q, p in pairs]
+
+
+def test_cross_encoder_reranker_batches_and_caches_scores(monkeypatch):
+    """All pairs are scored in one batch and repeated queries skip the model."""
+    FakeCrossEncoder.instances = []
+    monkeypatch.setattr(reranker_module, "CrossEncoder", FakeCrossEncoder)
+    docs = [
+        RetrievedDocument(text="unrelated text", score=9.0, metadata={}, doc_id="a"),
+        RetrievedDocument(text="bert uses masked language modeling", score=1.0, metadata={}, doc_id="b"),
+        RetrievedDocument(text="masked tokens", score=2.0, metadata={}, doc_id="c"),
+    ]
+    reranker = CrossEncoderReranker(model_name="fake", batch_size=2)
+
+    ranked = reranker.rerank("How does BERT use masked modeling?", docs, top_k=2)
+    assert [doc.doc_id for doc in ranked] == ["b", "c"]
+    model = FakeCrossEncoder.instances[0]
+    assert len(model.batches) == 1 and len(model.batches[0]) == 3
+    assert model.batch_sizes == [2]
+
+    again = reranker.rerank("how does bert use masked modeling?", docs, top_k=2)
+    assert [doc.doc_id for doc in again] == ["b", "c"]
+    assert len(model.batches) == 1
+    assert reranker.cache_stats()["hits"] == 3
+
+    # Re-ingested under the same ID with new text: only that chunk is rescored.
+    edited = [docs[0], docs[1], replace(docs[2], text="masked modeling tokens")]
+    reranker.rerank("how does bert use masked modeling?", edited, top_k=2)
+    assert model.batches[1] == [("how does bert use masked modeling?", "masked modeling tokens")]
+
+
+class SlowReranker:
+    def __init__(self, clock, cost_ms):
+        self.clock = clock
+        self.cost_ms = cost_ms
+        self.calls = 0
+
+    def rerank(self, query, documents, top_k=5):
+        self.calls += 1
+        self.clock[0] += self.cost_ms / 1000.0
+        return sorted(documents, key=lambda doc: doc.text)[:top_k]
+
+
+def test_cascade_reranker_stops_when_budget_would_be_exceeded():
+    """The cascade returns the cheap stage's ordering once the budget is spent."""
+    now = [0.0]
+    expensive = SlowReranker(now, cost_ms=80)
+    cascade = CascadeReranker(
+        stages=[
+            CascadeStage(KeywordOverlapReranker(), keep=2),
+            CascadeStage(expensive, keep=1),
+        ],
+        budget_ms=50,
+        clock=lambda: now[0],
+    )
+    docs = [
+        RetrievedDocument(text="zeta attention", score=0.1, metadata={}),
+        RetrievedDocument(text="alpha", score=0.3, metadata={}),
+        RetrievedDocument(text="beta attention", score=0.2, metadata={}),
+    ]
+
+    # The first call is treated as warm-up; the second one is measured.
+    for _ in range(2):
+        first = cascade.rerank("attention", docs, top_k=1)
+    assert expensive.calls == 2
+    assert first[0].text == "beta attention"
+
+    second = cascade.rerank("attention", docs, top_k=1)
+    assert expensive.calls == 2
+    assert second[0].text == "beta attention"
+    assert cascade.stats()["stopped_before"] == {"SlowReranker": 1}
+
+
+def test_cascade_budget_and_latency_are_per_query_in_batches():
+    """A batch of N queries gets N budgets; its stage timings are stored per query."""
+    now = [0.0]
+    expensive = SlowReranker(now, cost_ms=30)
+    cascade = CascadeReranker(
+        stages=[CascadeStage(KeywordOverlapReranker(), keep=2), CascadeStage(expensive, keep=1)],
+        budget_ms=50,
+        clock=lambda: now[0],
+    )
+    docs = [RetrievedDocument(text=text, score=0.0, metadata={}) for text in ("b", "a", "c")]
+
+    for _ in range(3):
+        cascade.rerank_many(["q"] * 4, [docs] * 4, top_k=1)
+
+    assert expensive.calls == 12
+    stats = cascade.stats()
+    assert stats["stopped_before"] == {} and stats["completed"] == 3
+    assert stats["stage_latency_ms"]["SlowReranker"] == 30.0
+
+
+class SpikyReranker(SlowReranker):
+    """Slow on one specific call, fast otherwise."""
+
+    def __init__(self, clock, cost_ms, slow_call, slow_ms):
+        super().__init__(clock, cost_ms)
+        self.slow_call = slow_call
+        self.slow_ms = slow_ms
+
+    def rerank(self, query, documents, top_k=5):
+        if self.calls + 1 == self.slow_call:
+            self.clock[0] += (self.slow_ms - self.cost_ms) / 1000.0
+        return super().rerank(query, documents, top_k)
+
+
+def test_cascade_stage_recovers_after_one_slow_call():
+    """Neither a slow first call (model load) nor a later spike locks a stage out."""
+    now = [0.0]
+    stage = SpikyReranker(now, cost_ms=20, slow_call=2, slow_ms=500)
+    cold = SpikyReranker(now, cost_ms=20, slow_call=1, slow_ms=5000)
+    cascade = CascadeReranker(
+        stages=[CascadeStage(cold, keep=2, name="cold"), CascadeStage(stage, keep=1, name="spiky")],
+        budget_ms=150,
+        probe_every=5,
+        clock=lambda: now[0],
+    )
+    docs = [RetrievedDocument(text=text, score=0.0, metadata={}) for text in ("b", "a", "c")]
+
+    for _ in range(50):
+        cascade.rerank("q", docs, top_k=1)
+
+    # The 5 s cold start on the first call is not held against the first stage.
+    assert cold.calls == 50
+    # The second stage is skipped once while the cold start eats the budget, spikes
+    # on its second call, sits out 5 calls, then a probe re-measures it at 20 ms.
+    assert stage.calls == 50 - 6
+    stats = cascade.stats()
+    assert stats["probes"] == 1 and stats["stopped_before"] == {"spiky": 6}
+    assert stats["stage_latency_ms"] == {"cold": 20.0, "spiky": 20.0}
+
+
+class LegSearchClient:
+    def __init__(self):
+        self.bodies = []
+
+    def search(self, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.bodies.append(body)
+        if "match" in body["query"]:
+            hits = [("lex-only", 9.0), ("both", 4.0)]
+        else:
+            hits = [("both", 0.9), ("knn-only", 0.8)]
+        return {
+            "hits": {
+                "hits": [
+                    {"_id": doc_id, "_score": score, "_source": {"text": doc_id, "metadata": {}}}
+                    for doc_id, score in hits
+                ]
+            }
+        }
+
+    def msearch(self, body, index=None):
+        return {"responses": [self.search(index, request) for request in body[1::2]]}
+
+
+def test_client_side_rrf_fusion_runs_both_legs():
+    client = LegSearchClient()
+    retriever = HybridRetriever(
+        client=client,
+        index_name="docs",
+        query_embedder=DummyQueryEmbedder(),
+        fusion="rrf",
+        bm25_weight=0.6,
+        semantic_weight=0.4,
+    )
+
+    results = retriever.retrieve("question", top_k=3)
+
+    assert [doc.doc_id for doc in results] == ["both", "lex-only", "knn-only"]
+    assert {next(iter(body["query"])) for body in client.bodies} == {"match", "knn"}
+    stats = retriever.leg_stats()
+    assert stats["bm25_ms"]["count"] == 1 and stats["knn_ms"]["count"] == 1
+
+    batched = retriever.retrieve_many(["question", "other"], top_k=3)
+    assert [doc.doc_id for doc in batched[0]] == ["both", "lex-only", "knn-only"]
+
+
+def test_min_max_fusion_respects_weights():
+    retriever = HybridRetriever(
+        client=LegSearchClient(),
+        index_name="docs",
+        query_embedder=DummyQueryEmbedder(),
+        fusion="min_max",
+        bm25_weight=0.1,
+        semantic_weight=0.9,
+    )
+
+    results = retriever.retrieve("question", top_k=3)
+
+    assert [doc.doc_id for doc in results] == ["both", "lex-only", "knn-only"]
+    assert [doc.score for doc in results] == pytest.approx([0.9, 0.1, 0.0])
+
+
+def test_unknown_fusion_mode_is_rejected():
+    with pytest.raises(ValueError):
+        HybridRetriever(client=LegSearchClient(), index_name="docs", query_embedder=DummyQueryEmbedder(), fusion="magic")
+
+
+def test_semantic_answer_cache_requires_similar_question_and_same_evidence():
+    now = [0.0]
+    cache = SemanticAnswerCache(similarity_threshold=0.95, max_size=2, ttl_seconds=60, clock=lambda: now[0])
+    key = {"chunk_ids": ["a-0", "b-3"], "prompt_version": prompt_fingerprint({"qa_prompt": []}), "model": "llama3"}
+
+    assert cache.lookup([1.0, 0.0], **key) is None
+    cache.store([1.0, 0.0], "cached answer", **key)
+
+    # Paraphrase (cos ~0.99) over the same chunk set in a different order hits.
+    assert cache.lookup([0.99, 0.1], **{**key, "chunk_ids": ["b-3", "a-0"]}) == "cached answer"
+    # Dissimilar question, different evidence or a different model all miss.
+    assert cache.lookup([0.0, 1.0], **key) is None
+    assert cache.lookup([1.0, 0.0], **{**key, "chunk_ids": ["a-0"]}) is None
+    assert cache.lookup([1.0, 0.0], **{**key, "model": "phi3"}) is None
+
+    now[0] = 61.0
+    assert cache.lookup([1.0, 0.0], **key) is None
+
+    for model in ("m1", "m2", "m3"):
+        cache.store([1.0, 0.0], model, **{**key, "model": model})
+    assert cache.lookup([1.0, 0.0], **{**key, "model": "m1"}) is None
+    assert cache.lookup([1.0, 0.0], **{**key, "model": "m3"}) == "m3"
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 6 and stats["near_misses"] == 1
+    assert stats["evictions"] == 1 and stats["hit_rate"] == 0.25